@@ -11,7 +11,7 @@ For more information visit https://github.com/firecrawl/
 import logging
 import os
 
-from .firecrawl import FirecrawlApp, AsyncFirecrawlApp, JsonConfig, ScrapeOptions, ChangeTrackingOptions # noqa
+from .firecrawl import FirecrawlApp, AsyncFirecrawlApp, JsonConfig, ScrapeOptions, ChangeTrackingOptions, JsonCodec, DocumentView, PollingStrategy, JobMonitor, AsyncJobMonitor, JobHandle, AsyncJobHandle, RetryPolicy, CircuitBreaker, CircuitOpenError, RateLimit, RateLimiter, SQLiteBucketStore, BatchScrapeGroup, AsyncBatchScrapeGroup, ScrapeCache, MemoryScrapeCache, SQLiteDocumentStore, ScrapeManifest, ScrapeProfile # noqa
 
 __version__ = "2.13.0"
 
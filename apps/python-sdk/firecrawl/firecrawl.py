@@ -11,19 +11,62 @@ Classes:
 """
 import logging
 import os
+import queue
+import random
+import threading
 import time
-from typing import Any, Dict, Optional, List, Union, Callable, Literal, TypeVar, Generic
+from typing import Any, Dict, Optional, List, Tuple, Union, Callable, Literal, TypeVar, Generic, Iterator, AsyncIterator, Iterable, AsyncIterable, Set
 import json
-from datetime import datetime
+import gzip
+import zlib
+import hashlib
+import heapq
+import itertools
+import collections
+import concurrent.futures
+import urllib.parse
+import uuid
+from datetime import datetime, timezone
+import email.utils
 import re
+import sqlite3
 import warnings
 import requests
+import requests.adapters
 import pydantic
 import websockets
 import aiohttp
 import asyncio
+import contextlib
+import functools
+import weakref
 from pydantic import Field
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Suppress Pydantic warnings about attribute shadowing
 warnings.filterwarnings("ignore", message="Field name \"json\" in \"FirecrawlDocument\" shadows an attribute in parent \"BaseModel\"")
 warnings.filterwarnings("ignore", message="Field name \"json\" in \"ChangeTrackingData\" shadows an attribute in parent \"BaseModel\"")
@@ -49,6 +92,13 @@ logger : logging.Logger = logging.getLogger("firecrawl")
 
 T = TypeVar('T')
 
+# Exceptions raised by the async transports for network level failures
+_ASYNC_TRANSPORT_ERRORS = (aiohttp.ClientError,) + ((httpx.TransportError,) if httpx is not None else ())
+_TRANSPORT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, asyncio.TimeoutError) + _ASYNC_TRANSPORT_ERRORS
+# Errors raised before a request reaches the server, which are safe to retry for any method
+_CONNECT_ERRORS = (requests.exceptions.ConnectTimeout, aiohttp.ClientConnectorError) + (
+    (httpx.ConnectError, httpx.ConnectTimeout) if httpx is not None else ())
+
 # class FirecrawlDocumentMetadata(pydantic.BaseModel):
 #     """Metadata for a Firecrawl document."""
 #     title: Optional[str] = None
@@ -356,98 +406,1857 @@ class SearchResponse(pydantic.BaseModel):
     warning: Optional[str] = None
     error: Optional[str] = None
 
-class GenerateLLMsTextParams(pydantic.BaseModel):
-    """
-    Parameters for the LLMs.txt generation operation.
-    """
-    maxUrls: Optional[int] = 10
-    showFullText: Optional[bool] = False
-    cache: Optional[bool] = True
-    __experimental_stream: Optional[bool] = None
+class GenerateLLMsTextParams(pydantic.BaseModel):
+    """
+    Parameters for the LLMs.txt generation operation.
+    """
+    maxUrls: Optional[int] = 10
+    showFullText: Optional[bool] = False
+    cache: Optional[bool] = True
+    __experimental_stream: Optional[bool] = None
+
+class DeepResearchParams(pydantic.BaseModel):
+    """
+    Parameters for the deep research operation.
+    """
+    maxDepth: Optional[int] = 7
+    timeLimit: Optional[int] = 270
+    maxUrls: Optional[int] = 20
+    analysisPrompt: Optional[str] = None
+    systemPrompt: Optional[str] = None
+    __experimental_streamSteps: Optional[bool] = None
+
+class DeepResearchResponse(pydantic.BaseModel):
+    """
+    Response from the deep research operation.
+    """
+    success: bool
+    id: str
+    error: Optional[str] = None
+
+class DeepResearchStatusResponse(pydantic.BaseModel):
+    """
+    Status response from the deep research operation.
+    """
+    success: bool
+    data: Optional[Dict[str, Any]] = None
+    status: str
+    error: Optional[str] = None
+    expiresAt: str
+    currentDepth: int
+    maxDepth: int
+    activities: List[Dict[str, Any]]
+    sources: List[Dict[str, Any]]
+    summaries: List[str]
+
+class GenerateLLMsTextResponse(pydantic.BaseModel):
+    """Response from LLMs.txt generation operations."""
+    success: bool = True
+    id: str
+    error: Optional[str] = None
+
+class GenerateLLMsTextStatusResponseData(pydantic.BaseModel):
+    llmstxt: str
+    llmsfulltxt: Optional[str] = None
+
+class GenerateLLMsTextStatusResponse(pydantic.BaseModel):
+    """Status response from LLMs.txt generation operations."""
+    success: bool = True
+    data: Optional[GenerateLLMsTextStatusResponseData] = None
+    status: Literal["processing", "completed", "failed"]
+    error: Optional[str] = None
+    expiresAt: str
+    
+class SearchResponse(pydantic.BaseModel):
+    """
+    Response from the search operation.
+    """
+    success: bool
+    data: List[Dict[str, Any]]
+    warning: Optional[str] = None
+    error: Optional[str] = None
+
+class ExtractParams(pydantic.BaseModel):
+    """
+    Parameters for the extract operation.
+    """
+    prompt: Optional[str] = None
+    schema: Optional[Any] = pydantic.Field(None, alias='schema')
+    system_prompt: Optional[str] = None
+    allow_external_links: Optional[bool] = False
+    enable_web_search: Optional[bool] = False
+    # Just for backwards compatibility
+    enableWebSearch: Optional[bool] = False
+    show_sources: Optional[bool] = False
+    agent: Optional[Dict[str, Any]] = None
+
+def _require_httpx() -> None:
+    """
+    Ensure the optional httpx dependency used by the HTTP/2 transport is installed.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    if httpx is None:
+        raise ImportError("HTTP/2 support requires httpx. Install it with: pip install 'firecrawl-py[http2]'")
+
+def _require_zstandard() -> None:
+    """
+    Ensure the optional zstandard dependency used to compress stored documents is installed.
+
+    Raises:
+        ImportError: If zstandard is not installed.
+    """
+    if zstandard is None:
+        raise ImportError("zstd compression requires zstandard. Install it with: pip install 'firecrawl-py[compression]'")
+
+def _require_ijson() -> None:
+    """
+    Ensure the optional ijson dependency used for streamed status pages is installed.
+
+    Raises:
+        ImportError: If ijson is not installed.
+    """
+    if ijson is None:
+        raise ImportError("Streaming status pages requires ijson. Install it with: pip install 'firecrawl-py[streaming]'")
+
+def _is_session_closed(session: Any) -> bool:
+    """
+    Check whether an aiohttp.ClientSession or httpx.AsyncClient has been closed.
+    """
+    if httpx is not None and isinstance(session, httpx.AsyncClient):
+        return session.is_closed
+    return session.closed
+
+def _wire_size(response: Any, content_size: int) -> int:
+    """
+    Return the number of body bytes a sync response took on the wire, before decompression.
+
+    Falls back to the decoded size when the transport does not expose the raw byte count.
+    """
+    num_bytes = getattr(response, 'num_bytes_downloaded', None)  # httpx
+    if isinstance(num_bytes, int):
+        return num_bytes
+    tell = getattr(getattr(response, 'raw', None), 'tell', None)  # requests / urllib3
+    if callable(tell):
+        num_bytes = tell()
+        if isinstance(num_bytes, int):
+            return num_bytes
+    return content_size
+
+def _page_url(next_url: str, skip: int, limit: int) -> str:
+    """
+    Build the URL of a status page at an arbitrary offset from a `next` URL returned by the API.
+    """
+    parts = urllib.parse.urlsplit(next_url)
+    query = dict(urllib.parse.parse_qsl(parts.query))
+    query['skip'] = str(skip)
+    query['limit'] = str(limit)
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+class JsonCodec:
+    """
+    JSON codec backed by the standard library json module.
+
+    Codecs encode request bodies to UTF-8 bytes and decode response bodies and
+    WebSocket messages from bytes or str. Decoding errors are raised as ValueError.
+    """
+    name = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+class OrjsonCodec(JsonCodec):
+    """
+    JSON codec backed by orjson.
+    """
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("The orjson codec requires orjson. Install it with: pip install orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+class MsgspecCodec(JsonCodec):
+    """
+    JSON codec backed by msgspec.
+    """
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError("The msgspec codec requires msgspec. Install it with: pip install msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+_JSON_CODECS = {
+    'json': JsonCodec,
+    'orjson': OrjsonCodec,
+    'msgspec': MsgspecCodec,
+}
+
+def _get_json_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """
+    Resolve a json_codec setting to a codec instance.
+
+    Args:
+        codec (Union[str, JsonCodec]): A codec instance, a codec name ('json', 'orjson',
+            'msgspec') or 'auto' to pick the fastest installed codec.
+
+    Returns:
+        JsonCodec: The codec to use.
+
+    Raises:
+        ValueError: If the codec name is unknown.
+        ImportError: If the named codec's library is not installed.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == 'auto':
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return JsonCodec()
+    if codec not in _JSON_CODECS:
+        raise ValueError(f"Unknown json_codec {codec!r}. Expected one of: auto, {', '.join(_JSON_CODECS)}")
+    return _JSON_CODECS[codec]()
+
+@functools.lru_cache(maxsize=None)
+def _document_field_validator(name: str) -> Optional[Callable[[Any], Any]]:
+    """
+    Return a compiled validator for one FirecrawlDocument field, or None if the model has no such field.
+
+    Uses a pydantic v2 TypeAdapter, falling back to parse_obj_as on pydantic v1.
+    """
+    if hasattr(FirecrawlDocument, 'model_fields'):
+        field = FirecrawlDocument.model_fields.get(name)
+        annotation = field.annotation if field is not None else None
+    else:
+        field = FirecrawlDocument.__fields__.get(name)
+        annotation = field.outer_type_ if field is not None else None
+    if field is None:
+        return None
+    if hasattr(pydantic, 'TypeAdapter'):
+        return pydantic.TypeAdapter(annotation).validate_python
+    return functools.partial(pydantic.parse_obj_as, annotation)
+
+def _validate_document(document: Dict[str, Any]) -> FirecrawlDocument:
+    """
+    Validate a raw document into a FirecrawlDocument.
+    """
+    if hasattr(FirecrawlDocument, 'model_validate'):
+        return FirecrawlDocument.model_validate(document)
+    return FirecrawlDocument.parse_obj(document)
+
+class DocumentView:
+    """
+    Read-only view of a raw document that validates each field the first time it is accessed.
+
+    Returned in place of FirecrawlDocument for bulk results when the client is created with
+    validate='lazy'. Fields are read as attributes, like on FirecrawlDocument; the raw
+    document is available as `raw` and to_document() validates all of it.
+    """
+    __slots__ = ('raw', '_values')
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self.raw = raw
+        self._values: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        values = self._values
+        if name in values:
+            return values[name]
+        validator = _document_field_validator(name)
+        if validator is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = self.raw.get(name)
+        if value is not None:
+            value = validator(value)
+        values[name] = value
+        return value
+
+    def to_document(self) -> FirecrawlDocument:
+        """
+        Validate the whole document.
+
+        Returns:
+            FirecrawlDocument: The validated document.
+        """
+        return _validate_document(self.raw)
+
+    def __repr__(self) -> str:
+        return f"DocumentView(url={self.raw.get('url') or (self.raw.get('metadata') or {}).get('sourceURL')!r})"
+
+_STREAM_CHUNK_SIZE = 65536
+
+class _ChunkReader:
+    """
+    File-like reader over an iterator of decoded body chunks, counting the bytes read.
+    """
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b''
+        chunk = next(self._chunks, b'')
+        self.bytes_read += len(chunk)
+        return chunk
+
+class _AsyncChunkReader:
+    """
+    Async file-like reader over an async iterator of decoded body chunks, counting the bytes read.
+    """
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self.bytes_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b''
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b''
+        self.bytes_read += len(chunk)
+        return chunk
+
+class _StatusPageParser:
+    """
+    Rebuilds the documents of a crawl or batch scrape status page from ijson parse events.
+
+    Each element of `data` is returned as soon as it is complete, so only one document
+    is held in memory at a time. Top-level scalar fields such as `status` and `next`
+    are collected into fields; the API sends them before `data`.
+    """
+    NO_DOCUMENT = object()
+
+    def __init__(self, fields: Dict[str, Any]) -> None:
+        self.fields = fields
+        self._builder = None
+
+    def feed(self, prefix: str, event: str, value: Any) -> Any:
+        """
+        Process one parse event.
+
+        Returns:
+            Any: The completed document, or NO_DOCUMENT if the event did not complete one.
+        """
+        if self._builder is not None:
+            self._builder.event(event, value)
+            if prefix == 'data.item' and event in ('end_map', 'end_array'):
+                document, self._builder = self._builder.value, None
+                return document
+        elif prefix == 'data.item':
+            if event not in ('start_map', 'start_array'):
+                return value
+            self._builder = ijson.ObjectBuilder()
+            self._builder.event(event, value)
+        elif prefix and '.' not in prefix and event in ('string', 'number', 'boolean', 'null'):
+            self.fields[prefix] = value
+        return self.NO_DOCUMENT
+
+class TransferStats:
+    """
+    Byte counters for traffic exchanged with the Firecrawl API.
+
+    bytes_sent and bytes_received count body bytes as they went over the wire, the
+    *_decoded counters count the same bodies before compression and after decompression.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+            self.bytes_sent_decoded = 0
+            self.bytes_received = 0
+            self.bytes_received_decoded = 0
+
+    def record(self, bytes_sent: int, bytes_sent_decoded: int, bytes_received: int, bytes_received_decoded: int) -> None:
+        """Add the body sizes of one request/response pair to the counters."""
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += bytes_sent
+            self.bytes_sent_decoded += bytes_sent_decoded
+            self.bytes_received += bytes_received
+            self.bytes_received_decoded += bytes_received_decoded
+
+    @property
+    def bytes_saved(self) -> int:
+        """Total bytes compression kept off the wire, in both directions."""
+        return (self.bytes_sent_decoded - self.bytes_sent) + (self.bytes_received_decoded - self.bytes_received)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'bytes_sent': self.bytes_sent,
+                'bytes_sent_decoded': self.bytes_sent_decoded,
+                'bytes_received': self.bytes_received,
+                'bytes_received_decoded': self.bytes_received_decoded,
+            }
+
+    def __repr__(self) -> str:
+        return f"TransferStats({', '.join(f'{k}={v}' for k, v in self.as_dict().items())})"
+
+class _AsyncHTTPXResponse:
+    """
+    Adapts an httpx.Response to the parts of the aiohttp.ClientResponse interface
+    used by AsyncFirecrawlApp, so both transports share the same response handling.
+    """
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+
+    async def json(self) -> Any:
+        return self._response.json()
+
+    async def read(self) -> bytes:
+        return await self._response.aread()
+
+def _parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date into seconds from now.
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+class PollingStrategy:
+    """
+    Adaptive schedule for the status checks of a running job.
+
+    The first wait is `interval` seconds. When a job reports progress through `completed`
+    and `total`, the next wait is aimed at half the estimated time remaining, so short jobs
+    are picked up soon after they finish and long ones are checked less often. Without
+    progress the wait grows by `backoff`. Waits stay between `min_interval` and
+    `max_interval` and are randomized by +/- `jitter`, so many clients polling at once
+    spread out their requests. A Retry-After header on a status response takes precedence.
+
+    A strategy only holds settings, so one instance can be shared between calls and threads.
+    Subclass it and override next_interval to plug in a different schedule.
+    """
+    def __init__(
+            self,
+            interval: float = 2.0,
+            *,
+            min_interval: float = 1.0,
+            max_interval: float = 30.0,
+            backoff: float = 1.5,
+            jitter: float = 0.1) -> None:
+        """
+        Args:
+            interval (float): Seconds to wait before the second status check (default: 2)
+            min_interval (float): Shortest wait in seconds (default: 1)
+            max_interval (float): Longest wait in seconds (default: 30)
+            backoff (float): Factor the wait grows by per check (default: 1.5)
+            jitter (float): Fraction by which each wait is randomized (default: 0.1)
+        """
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+
+    def next_interval(
+            self,
+            previous_interval: Optional[float],
+            previous_status: Optional[Dict[str, Any]],
+            status: Dict[str, Any],
+            retry_after: Optional[float] = None) -> float:
+        """
+        Return how many seconds to wait before the next status check.
+
+        Args:
+            previous_interval (Optional[float]): The previous wait, or None before the first one.
+            previous_status (Optional[Dict[str, Any]]): The status returned by the previous check.
+            status (Dict[str, Any]): The status returned by the latest check.
+            retry_after (Optional[float]): Seconds requested by a Retry-After header, if any.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        if retry_after is not None:
+            return max(retry_after, self.min_interval)
+
+        if previous_interval is None:
+            interval = self.interval
+        else:
+            interval = previous_interval * self.backoff
+            completed, total = status.get('completed'), status.get('total')
+            previous_completed = (previous_status or {}).get('completed')
+            if (isinstance(completed, int) and isinstance(total, int) and isinstance(previous_completed, int)
+                    and completed > previous_completed):
+                rate = (completed - previous_completed) / previous_interval
+                remaining = max(total - completed, 0) / rate
+                interval = min(interval, remaining / 2)
+
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        if self.jitter:
+            interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return interval
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the circuit breaker for its host is open.
+    """
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker shared by every request a client makes.
+
+    After `failure_threshold` consecutive failures (transport errors or 5xx responses) to a host,
+    requests to it fail fast with CircuitOpenError for `recovery_time` seconds. Then a single
+    trial request is let through; if it succeeds the circuit closes, otherwise it opens again.
+    """
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0) -> None:
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit (default: 5)
+            recovery_time (float): Seconds the circuit stays open before a trial request (default: 30)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._trial_in_flight: Dict[str, bool] = {}
+
+    def state(self, host: str) -> Literal['closed', 'open', 'half-open']:
+        """
+        Return the state of the circuit for a host.
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return 'closed'
+            return 'half-open' if time.monotonic() - opened_at >= self.recovery_time else 'open'
+
+    def before_request(self, host: str) -> bool:
+        """
+        Check that a request to a host may be sent.
+
+        A request that is let through as the half-open trial must report its outcome with
+        record_success or record_failure, or no further request to the host is let through.
+
+        Returns:
+            bool: Whether the request is the trial request of a half-open circuit.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a trial request already in flight.
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return False
+            remaining = self.recovery_time - (time.monotonic() - opened_at)
+            if remaining > 0 or self._trial_in_flight.get(host):
+                raise CircuitOpenError(
+                    f'Circuit open for {host} after {self._failures.get(host, 0)} consecutive failures; '
+                    f'retry in {max(remaining, 0):.1f}s')
+            self._trial_in_flight[host] = True
+            return True
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trial_in_flight.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            trial_failed = self._trial_in_flight.pop(host, False)
+            if failures >= self.failure_threshold or trial_failed:
+                self._opened_at[host] = time.monotonic()
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to wait between attempts.
+
+    Responses with a status in `statuses` and transport errors in `exceptions` are retried up to
+    `max_attempts` attempts in total. Transport errors are only retried for idempotent methods and
+    requests carrying an idempotency key, except connection failures, which happen before the
+    request reaches the server. Waits use decorrelated jitter between `base_delay` and `max_delay`
+    unless the response carries a Retry-After header, and retrying stops once the waits of a single
+    call would exceed `retry_budget` seconds. One policy is shared by FirecrawlApp and AsyncFirecrawlApp.
+    """
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            *,
+            statuses: Optional[Iterable[int]] = (429, 502, 503, 504),
+            exceptions: Tuple[type, ...] = _TRANSPORT_ERRORS,
+            base_delay: float = 0.5,
+            max_delay: float = 30.0,
+            respect_retry_after: bool = True,
+            retry_budget: Optional[float] = 60.0) -> None:
+        """
+        Args:
+            max_attempts (int): Attempts per request, including the first (default: 3)
+            statuses (Optional[Iterable[int]]): Response statuses to retry (default: 429, 502, 503, 504)
+            exceptions (Tuple[type, ...]): Transport errors to retry (default: connection errors and timeouts)
+            base_delay (float): Shortest wait between attempts in seconds (default: 0.5)
+            max_delay (float): Longest computed wait between attempts in seconds (default: 30)
+            respect_retry_after (bool): Wait as long as a Retry-After header asks (default: True)
+            retry_budget (Optional[float]): Total seconds a single call may spend waiting to retry,
+                None for no limit (default: 60)
+        """
+        self.max_attempts = max_attempts
+        self.statuses = frozenset(statuses or ())
+        self.exceptions = exceptions
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.respect_retry_after = respect_retry_after
+        self.retry_budget = retry_budget
+
+    def backoff(self, previous_delay: Optional[float]) -> float:
+        """
+        Return the next wait using decorrelated jitter.
+
+        Args:
+            previous_delay (Optional[float]): The previous wait, or None before the first retry.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        upper = max((previous_delay or self.base_delay) * 3, self.base_delay)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def retries_exception(self, method: str, headers: Dict[str, str], error: BaseException) -> bool:
+        """
+        Return whether a transport error is safe and worthwhile to retry.
+        """
+        if not isinstance(error, self.exceptions):
+            return False
+        return (
+            method.upper() in self.IDEMPOTENT_METHODS
+            or 'x-idempotency-key' in headers
+            or isinstance(error, _CONNECT_ERRORS)
+        )
+
+class _RetryAttempts:
+    """
+    Retry state of a single call under a RetryPolicy and optional CircuitBreaker.
+    """
+    def __init__(
+            self,
+            policy: RetryPolicy,
+            breaker: Optional[CircuitBreaker],
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            max_attempts: Optional[int] = None,
+            base_delay: Optional[float] = None) -> None:
+        self.policy = policy
+        self.breaker = breaker
+        self.method = method
+        self.headers = headers
+        self.host = urllib.parse.urlsplit(url).netloc
+        # Transport errors are recorded by the circuit breaker even when the policy does not retry them
+        self.errors = _TRANSPORT_ERRORS + tuple(policy.exceptions)
+        self.max_attempts = max_attempts if max_attempts is not None else policy.max_attempts
+        self.base_delay = base_delay
+        self.attempt = 0
+        self.delay: Optional[float] = None
+        self.waited = 0.0
+        self.trial = False
+
+    def before_attempt(self) -> None:
+        """
+        Count an attempt, checking the circuit breaker first.
+
+        Raises:
+            CircuitOpenError: If the circuit for the host is open.
+        """
+        if self.breaker is not None:
+            self.trial = self.breaker.before_request(self.host)
+        self.attempt += 1
+
+    def end_attempt(self) -> None:
+        """
+        Finish an attempt, counting it as a failure if it took the circuit's half-open trial and
+        ended without a recorded result, such as by an unexpected exception or cancellation.
+        Call it in a finally block around every attempt.
+        """
+        if self.trial:
+            self.trial = False
+            self.breaker.record_failure(self.host)
+
+    def after_response(self, status: int, retry_after: Any = None) -> Optional[float]:
+        """
+        Record a response and return how long to wait before retrying it, or None to accept it.
+        """
+        if self.breaker is not None:
+            self.trial = False
+            if status >= 500:
+                self.breaker.record_failure(self.host)
+            else:
+                self.breaker.record_success(self.host)
+        if status not in self.policy.statuses:
+            return None
+        wait = _parse_retry_after(retry_after) if self.policy.respect_retry_after else None
+        return self._next_delay(wait)
+
+    def after_error(self, error: BaseException) -> Optional[float]:
+        """
+        Record a transport error and return how long to wait before retrying, or None to raise it.
+        """
+        if self.breaker is not None:
+            self.trial = False
+            self.breaker.record_failure(self.host)
+        if not self.policy.retries_exception(self.method, self.headers, error):
+            return None
+        return self._next_delay(None)
+
+    def _next_delay(self, wait: Optional[float]) -> Optional[float]:
+        if self.attempt >= self.max_attempts:
+            return None
+        if wait is None:
+            if self.base_delay is not None:
+                wait = min(self.policy.max_delay, self.base_delay * (2 ** (self.attempt - 1)))
+            else:
+                wait = self.policy.backoff(self.delay)
+        budget = self.policy.retry_budget
+        if budget is not None and self.waited + wait > budget:
+            return None
+        self.delay = wait
+        self.waited += wait
+        return wait
+
+class RateLimit:
+    """
+    Request rate and concurrency allowed for one class of endpoints.
+    """
+    def __init__(self, rate: float, burst: Optional[float] = None, concurrency: Optional[int] = None) -> None:
+        """
+        Args:
+            rate (float): Requests per second
+            burst (Optional[float]): Requests that may be sent at once after a quiet period (default: rate, at least 1)
+            concurrency (Optional[int]): Maximum requests in flight at once, None for no limit
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.concurrency = concurrency
+
+    def __repr__(self) -> str:
+        return f'RateLimit(rate={self.rate}, burst={self.burst}, concurrency={self.concurrency})'
+
+class _MemoryBucketStore:
+    """
+    Token buckets kept in memory, shared by the threads and tasks of one process.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def reserve(self, name: str, rate: float, burst: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(name, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate) - 1
+            self._buckets[name] = (tokens, now)
+        return max(-tokens / rate, 0.0)
+
+class SQLiteBucketStore:
+    """
+    Token buckets kept in a SQLite database, so that several processes on one machine share a limit.
+    """
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        """
+        Args:
+            path (str): Path to the database file, created if it does not exist
+            timeout (float): Seconds to wait for another process holding the database lock (default: 30)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)')
+
+    def reserve(self, name: str, rate: float, burst: float) -> float:
+        with self._lock:
+            connection = self._connection
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                row = connection.execute('SELECT tokens, updated FROM buckets WHERE name = ?', (name,)).fetchone()
+                tokens, updated = row if row is not None else (burst, now)
+                tokens = min(burst, tokens + max(now - updated, 0.0) * rate) - 1
+                connection.execute(
+                    'INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)', (name, tokens, now))
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        return max(-tokens / rate, 0.0)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+class RateLimiter:
+    """
+    Client-side token-bucket rate limiter, applied per API key and endpoint class.
+
+    Endpoint classes follow the API's own rate limits: 'scrape' (scrape, batch scrape and LLMs.txt),
+    'crawl' (crawl and deep research), 'search', 'map', 'extract', 'extract_status' and 'crawl_status'
+    (every other status check and cancellation). A limit under '*' applies to classes without one.
+
+    Each request reserves the next free slot in its bucket and waits for it, so callers spread out
+    evenly at the configured rate instead of bursting into 429s and backing off together.
+    Buckets live in memory by default; pass a SQLiteBucketStore to share them between processes.
+    Concurrency caps are enforced within a process.
+    """
+    def __init__(
+            self,
+            limits: Dict[str, Union[RateLimit, float]],
+            *,
+            store: Optional[Union[_MemoryBucketStore, SQLiteBucketStore]] = None) -> None:
+        """
+        Args:
+            limits (Dict[str, Union[RateLimit, float]]): Limit for each endpoint class, as a RateLimit
+                or a number of requests per second
+            store (Optional[SQLiteBucketStore]): Where token buckets are kept (default: in memory)
+        """
+        self.limits = {
+            name: limit if isinstance(limit, RateLimit) else RateLimit(limit)
+            for name, limit in limits.items()
+        }
+        self.store = store or _MemoryBucketStore()
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_semaphores: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+
+    @staticmethod
+    def classify(method: str, url: str) -> str:
+        """
+        Return the endpoint class of a request.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+
+        Returns:
+            str: The endpoint class.
+        """
+        path = urllib.parse.urlsplit(url).path
+        if method.upper() == 'POST':
+            for prefix, name in (('/v1/batch/scrape', 'scrape'), ('/v1/scrape', 'scrape'), ('/v1/llmstxt', 'scrape'),
+                                 ('/v1/crawl', 'crawl'), ('/v1/deep-research', 'crawl'), ('/v1/search', 'search'),
+                                 ('/v1/map', 'map'), ('/v1/extract', 'extract')):
+                if path.startswith(prefix):
+                    return name
+        if path.startswith('/v1/extract/'):
+            return 'extract_status'
+        return 'crawl_status'
+
+    def _limit(self, endpoint: str) -> Optional[RateLimit]:
+        return self.limits.get(endpoint) or self.limits.get('*')
+
+    def _reserve(self, endpoint: str, limit: RateLimit, key: str) -> float:
+        return self.store.reserve(f'{key}:{endpoint}', limit.rate, limit.burst)
+
+    @contextlib.contextmanager
+    def acquire(self, method: str, url: str, key: str = ''):
+        """
+        Wait until a request may be sent, and hold a concurrency slot while it runs.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            key (str): Identifies the API key the limit applies to.
+        """
+        endpoint = self.classify(method, url)
+        limit = self._limit(endpoint)
+        if limit is None:
+            yield
+            return
+        semaphore = None
+        if limit.concurrency:
+            with self._lock:
+                semaphore = self._semaphores.setdefault(endpoint, threading.BoundedSemaphore(limit.concurrency))
+            semaphore.acquire()
+        try:
+            delay = self._reserve(endpoint, limit, key)
+            if delay:
+                time.sleep(delay)
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    @contextlib.asynccontextmanager
+    async def async_acquire(self, method: str, url: str, key: str = ''):
+        """
+        Wait without blocking the event loop until a request may be sent, and hold a
+        concurrency slot while it runs.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            key (str): Identifies the API key the limit applies to.
+        """
+        endpoint = self.classify(method, url)
+        limit = self._limit(endpoint)
+        if limit is None:
+            yield
+            return
+        semaphore = None
+        if limit.concurrency:
+            # asyncio semaphores belong to one event loop
+            loop_id = id(asyncio.get_running_loop())
+            with self._lock:
+                semaphore = self._async_semaphores.get((endpoint, loop_id))
+                if semaphore is None:
+                    semaphore = self._async_semaphores[(endpoint, loop_id)] = asyncio.Semaphore(limit.concurrency)
+            await semaphore.acquire()
+        try:
+            if isinstance(self.store, _MemoryBucketStore):
+                delay = self._reserve(endpoint, limit, key)
+            else:
+                # A shared store may wait for another process's lock, which must not stall the event loop
+                delay = await asyncio.get_running_loop().run_in_executor(None, self._reserve, endpoint, limit, key)
+            if delay:
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+class _Poller:
+    """
+    Tracks the polling state of one job and waits according to a PollingStrategy.
+    """
+    def __init__(self, strategy: PollingStrategy) -> None:
+        self.strategy = strategy
+        self.interval: Optional[float] = None
+        self.status: Optional[Dict[str, Any]] = None
+
+    def next_delay(self, status: Dict[str, Any], retry_after: Optional[float] = None) -> float:
+        self.interval = self.strategy.next_interval(self.interval, self.status, status, retry_after)
+        self.status = status
+        return self.interval
+
+    def wait(self, status: Dict[str, Any], retry_after: Optional[float] = None) -> None:
+        time.sleep(self.next_delay(status, retry_after))
+
+    async def async_wait(self, status: Dict[str, Any], retry_after: Optional[float] = None) -> None:
+        await asyncio.sleep(self.next_delay(status, retry_after))
+
+def _settle_future(future: Any, result: Any = None, exception: Optional[BaseException] = None) -> None:
+    """
+    Resolve a concurrent or asyncio future unless it has been cancelled in the meantime.
+    """
+    if future.done():
+        return
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+        pass
+
+def _cancel_future(future: concurrent.futures.Future) -> None:
+    """
+    Cancel a concurrent future that no executor runs, and notify concurrent.futures.wait and
+    as_completed as an executor does when it drops a cancelled work item.
+    """
+    if future.cancel():
+        with future._condition:
+            if future._state == concurrent.futures._base.CANCELLED:
+                future.set_running_or_notify_cancel()
+
+# Status endpoint path and action description for each kind of job a JobMonitor can track
+_MONITORED_JOB_KINDS = {
+    'crawl': ('crawl', 'check crawl status'),
+    'batch_scrape': ('batch/scrape', 'check batch scrape status'),
+    'extract': ('extract', 'get extract status'),
+    'deep_research': ('deep-research', 'check deep research status'),
+    'llmstxt': ('llmstxt', 'check LLMs.txt generation status'),
+}
+
+class _MonitoredJob:
+    """
+    A job tracked by a JobMonitor, with its future and polling state.
+    """
+    __slots__ = ('kind', 'id', 'future', 'poller', 'status')
+
+    def __init__(self, kind: str, id: str, future: Any, poller: _Poller) -> None:
+        if kind not in _MONITORED_JOB_KINDS:
+            raise ValueError(f"Unknown job kind {kind!r}, expected one of: {', '.join(_MONITORED_JOB_KINDS)}")
+        self.kind = kind
+        self.id = id
+        self.future = future
+        self.poller = poller
+        self.status: Optional[Dict[str, Any]] = None
+
+    @property
+    def url_path(self) -> str:
+        return f'/v1/{_MONITORED_JOB_KINDS[self.kind][0]}/{self.id}'
+
+    @property
+    def action(self) -> str:
+        return _MONITORED_JOB_KINDS[self.kind][1]
+
+    def finished_result(self, status: Dict[str, Any]) -> Any:
+        """
+        Return the result of a completed extract, deep research or LLMs.txt job from its status.
+        Crawl and batch scrape results are fetched separately since they can span several pages.
+        """
+        if self.kind == 'extract':
+            return ExtractResponse(**status)
+        if self.kind == 'llmstxt':
+            return GenerateLLMsTextStatusResponse(**status)
+        return status
+
+    def failure(self, status: Dict[str, Any]) -> Optional[Exception]:
+        """
+        Return the exception to fail the job's future with, or None if the job has not failed.
+        """
+        if status.get('status') in ['failed', 'cancelled']:
+            return Exception(f'{self.kind} job {self.id} {status["status"]}. Error: {status.get("error")}')
+        return None
+
+def _url_domain(url: str) -> str:
+    """
+    Return the lowercased host name of a URL, which may be given without a scheme.
+    """
+    return (urllib.parse.urlsplit(url if '://' in url else f'//{url}').hostname or '').lower()
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of up to size items, reading it lazily.
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _scrape_key(params: Dict[str, Any]) -> str:
+    """
+    Canonical form of scrape parameters, the same for any two calls that send the same request.
+    """
+    return json.dumps(params, sort_keys=True, separators=(',', ':'), default=str)
+
+class _GeneratedSchema(dict):
+    """
+    JSON schema generated from a model class for one request.
+    """
+
+_generated_schemas: 'weakref.WeakKeyDictionary[type, Dict[str, Any]]' = weakref.WeakKeyDictionary()
+_generated_schemas_lock = threading.Lock()
+
+def _copy_json(value: Any) -> Any:
+    """
+    Copy the dicts and lists of a JSON value, sharing its immutable leaves.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+def _model_schema(model: type) -> Optional[_GeneratedSchema]:
+    """
+    Return the JSON schema of a Pydantic model class, generating it only the first time, or None for other classes.
+
+    Schemas are cached for as long as their class exists. Each call returns its own copy of the
+    cached schema, so a request that changes its schema does not change it for later requests.
+    """
+    with _generated_schemas_lock:
+        schema = _generated_schemas.get(model)
+    if schema is None:
+        # Pydantic v1/v2 model class
+        if hasattr(model, 'model_json_schema'):
+            schema = model.model_json_schema()
+        elif hasattr(model, 'schema'):
+            schema = model.schema()
+        else:
+            return None
+        with _generated_schemas_lock:
+            schema = _generated_schemas.setdefault(model, schema)
+    return _GeneratedSchema(_copy_json(schema))
+
+def _ensure_schema_dict(schema):
+    """
+    Utility to ensure a schema is a dict, not a Pydantic model class. Recursively checks dicts and lists.
+    """
+    if schema is None or isinstance(schema, _GeneratedSchema):
+        return schema
+    if isinstance(schema, type):
+        generated = _model_schema(schema)
+        if generated is not None:
+            return generated
+    if isinstance(schema, dict):
+        return {k: _ensure_schema_dict(v) for k, v in schema.items()}
+    if isinstance(schema, (list, tuple)):
+        return [_ensure_schema_dict(v) for v in schema]
+    return schema
+
+class ScrapeProfile:
+    """
+    Scrape options compiled once into the request payload the API expects.
+
+    Pass a profile to scrape_url, batch_scrape_urls or their async variants in place of the individual
+    options. The options are then validated, serialized and their schemas generated only once, and each
+    call just adds its URLs to a copy of the payload. Options given alongside a profile are added to it.
+    """
+    def __init__(
+            self,
+            options: Optional[ScrapeOptions] = None,
+            *,
+            extract: Optional[JsonConfig] = None,
+            json_options: Optional[JsonConfig] = None,
+            actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
+            **params: Any) -> None:
+        """
+        Args:
+            options (Optional[ScrapeOptions]): Scrape options
+            extract (Optional[JsonConfig]): Content extraction settings
+            json_options (Optional[JsonConfig]): JSON extraction settings
+            actions (Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]]): Actions to perform
+            **params: Additional parameters to pass to the API, named as the API names them
+
+        Raises:
+            pydantic.ValidationError: If the options are not valid scrape parameters
+        """
+        payload = options.dict(exclude_none=True) if options is not None else {}
+        if extract is not None:
+            payload['extract'] = extract
+        if json_options is not None:
+            payload['jsonOptions'] = json_options
+        if actions:
+            payload['actions'] = actions
+        payload.update(params)
+        # Parameters ScrapeParams does not know are passed through as given
+        payload.update(ScrapeParams(**payload).dict(exclude_none=True))
+        for key in ('extract', 'jsonOptions'):
+            if payload.get(key) and 'schema' in payload[key]:
+                payload[key]['schema'] = _ensure_schema_dict(payload[key]['schema'])
+        self.payload: Dict[str, Any] = payload
+
+    @property
+    def timeout(self) -> Optional[int]:
+        """Scrape timeout in milliseconds, if the profile sets one."""
+        return self.payload.get('timeout')
+
+    def params(self, **urls: Any) -> Dict[str, Any]:
+        """
+        Return the request payload for a call, made of the profile's options and the given URL fields.
+
+        The copy is shallow: the option values are shared with the profile and must not be changed.
+
+        Args:
+            **urls: The URL fields of the request, such as url or urls
+
+        Returns:
+            Dict[str, Any]: The request payload.
+        """
+        params = dict(self.payload)
+        params.update(urls)
+        params['origin'] = f"python-sdk@{version}"
+        return params
+
+    def __repr__(self) -> str:
+        return f'ScrapeProfile({self.payload!r})'
+
+class _SingleFlight:
+    """
+    Lets concurrent calls with the same key share one execution and its result.
+
+    Only calls that overlap are coalesced: once a call finishes, the next one with its key runs again.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, concurrent.futures.Future] = {}
+        self._async_calls: Dict[Tuple[int, str], asyncio.Task] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for the call already running with the same key and return its result.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = concurrent.futures.Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def async_do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Await fn(), or the call already running with the same key on this event loop, and return its result.
+
+        The shared call runs in its own task, so cancelling one of the callers does not cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        task = self._async_calls.get(call_key)
+        if task is None:
+            task = self._async_calls[call_key] = loop.create_task(fn())
+
+            def finished(task: asyncio.Task) -> None:
+                self._async_calls.pop(call_key, None)
+                if not task.cancelled():
+                    # Mark the exception as retrieved in case every caller was cancelled
+                    task.exception()
+
+            task.add_done_callback(finished)
+        return await asyncio.shield(task)
+
+class ScrapeCache:
+    """
+    Interface for caches of scrape results, used by scrape_url when a client is created with one.
+
+    Results are stored as the `data` dict of the scrape response, under a key derived from
+    the URL and scrape options. Implementations must be safe to use from several threads.
+    """
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the result stored under key, or None if there is none or it is older than max_age.
+
+        Args:
+            key (str): The cache key
+            max_age (Optional[float]): Maximum age in seconds of a result to return, None for any age
+                the cache still holds
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Store a scrape result under key.
+
+        Args:
+            key (str): The cache key
+            data (Dict[str, Any]): The scrape result
+        """
+        raise NotImplementedError
+
+class MemoryScrapeCache(ScrapeCache):
+    """
+    In-memory LRU cache of scrape results, bounded by their total encoded size and by age.
+
+    Results are kept encoded, so every hit returns a fresh copy.
+    """
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = 300.0) -> None:
+        """
+        Args:
+            max_bytes (int): Maximum total size of the encoded results (default: 64 MiB)
+            ttl (Optional[float]): Seconds a result stays usable, None to keep results until evicted (default: 300)
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._codec = _get_json_codec('auto')
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the encoded results held."""
+        return self._size
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                body, stored_at = entry
+                age = time.monotonic() - stored_at
+                if self.ttl is not None and age > self.ttl:
+                    self._remove(key)
+                    entry = None
+                elif max_age is not None and age > max_age:
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._codec.loads(body)
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        body = self._codec.dumps(data)
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (body, time.monotonic())
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove every result."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        body, _ = self._entries.pop(key)
+        self._size -= len(body)
+
+def _document_dict(document: Union[FirecrawlDocument, DocumentView, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return the raw dict of a document given as a model, a DocumentView or a dict.
+    """
+    if isinstance(document, DocumentView):
+        return document.raw
+    if isinstance(document, pydantic.BaseModel):
+        return document.dict(exclude_none=True)
+    return document
+
+def _document_url(document: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the source URL of a raw document.
+    """
+    metadata = document.get('metadata') or {}
+    return metadata.get('sourceURL') or metadata.get('url') or document.get('url')
+
+def _content_hash(document: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the SHA-256 of a raw document's main content: its markdown, or its HTML when it has none.
+    """
+    for field in ('markdown', 'html', 'rawHtml'):
+        content = document.get(field)
+        if content is not None:
+            return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    return None
+
+class SQLiteDocumentStore(ScrapeCache):
+    """
+    Scraped documents kept in a SQLite database on disk, indexed by URL and scrape time.
+
+    The large content fields (markdown, html, rawHtml and screenshot) are compressed with zstd, or zlib
+    when zstandard is not installed, and stored once per distinct content under its SHA-256 hash, so
+    pages that did not change between scrapes take no extra space.
+
+    The store is a ScrapeCache that can be passed to a client as scrape_cache, and a sink for crawl and
+    batch scrape results through add_documents. Several processes can share one database file.
+    """
+    BODY_FIELDS = ('markdown', 'html', 'rawHtml', 'screenshot')
+
+    def __init__(
+            self,
+            path: str,
+            *,
+            compression: Literal['auto', 'zstd', 'zlib'] = 'auto',
+            ttl: Optional[float] = None,
+            timeout: float = 30.0) -> None:
+        """
+        Args:
+            path (str): Path to the database file, created if it does not exist
+            compression (Literal['auto', 'zstd', 'zlib']): How new content is compressed; 'auto' uses zstd
+                when zstandard is installed and zlib otherwise (default: 'auto')
+            ttl (Optional[float]): Seconds a document stays usable as a cached scrape result, None for no limit
+            timeout (float): Seconds to wait for another process holding the database lock (default: 30)
+
+        Raises:
+            ValueError: If compression is not 'auto', 'zstd' or 'zlib'
+            ImportError: If compression is 'zstd' and zstandard is not installed
+        """
+        if compression not in ('auto', 'zstd', 'zlib'):
+            raise ValueError(f"compression must be 'auto', 'zstd' or 'zlib', got {compression!r}")
+        if compression == 'zstd':
+            _require_zstandard()
+        self.path = path
+        self.compression = compression if compression != 'auto' else ('zstd' if zstandard is not None else 'zlib')
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.executescript('''
+            CREATE TABLE IF NOT EXISTS bodies (
+                hash TEXT PRIMARY KEY, codec TEXT NOT NULL, size INTEGER NOT NULL, data BLOB NOT NULL);
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY, url TEXT, key TEXT, scraped_at REAL NOT NULL,
+                fields TEXT NOT NULL, bodies TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS documents_by_url ON documents (url, scraped_at);
+            CREATE INDEX IF NOT EXISTS documents_by_key ON documents (key, scraped_at);
+        ''')
+
+    def __enter__(self) -> 'SQLiteDocumentStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+    def add(
+            self,
+            document: Union[FirecrawlDocument, DocumentView, Dict[str, Any]],
+            *,
+            key: Optional[str] = None,
+            scraped_at: Optional[float] = None) -> None:
+        """
+        Store one document.
+
+        Args:
+            document (Union[FirecrawlDocument, DocumentView, Dict[str, Any]]): The document
+            key (Optional[str]): Scrape cache key the document answers, if any
+            scraped_at (Optional[float]): When the document was scraped, as a Unix timestamp (default: now)
+        """
+        self.add_documents([document], key=key, scraped_at=scraped_at)
+
+    def add_documents(
+            self,
+            documents: Iterable[Union[FirecrawlDocument, DocumentView, Dict[str, Any]]],
+            *,
+            key: Optional[str] = None,
+            scraped_at: Optional[float] = None,
+            batch_size: int = 500) -> int:
+        """
+        Store documents, for example every document of a crawl as it is iterated.
+
+        Documents are written in transactions of batch_size, so an iterator of any length can be passed.
+
+        Args:
+            documents (Iterable[Union[FirecrawlDocument, DocumentView, Dict[str, Any]]]): The documents
+            key (Optional[str]): Scrape cache key the documents answer, if any
+            scraped_at (Optional[float]): When the documents were scraped, as a Unix timestamp (default: now)
+            batch_size (int): Documents written per transaction (default: 500)
+
+        Returns:
+            int: Number of documents stored
+        """
+        count = 0
+        for batch in _chunks(documents, batch_size):
+            rows = [self._encode(document) for document in batch]
+            now = scraped_at if scraped_at is not None else time.time()
+            with self._transaction() as connection:
+                for url, fields, bodies in rows:
+                    connection.executemany(
+                        'INSERT OR IGNORE INTO bodies (hash, codec, size, data) VALUES (?, ?, ?, ?)', bodies.values())
+                    connection.execute(
+                        'INSERT INTO documents (url, key, scraped_at, fields, bodies) VALUES (?, ?, ?, ?, ?)',
+                        (url, key, now, fields, json.dumps({field: body[0] for field, body in bodies.items()})))
+            count += len(rows)
+        return count
+
+    def get_document(self, url: str, max_age: Optional[float] = None) -> Optional[FirecrawlDocument]:
+        """
+        Return the latest stored document for a URL.
+
+        Args:
+            url (str): The document's source URL
+            max_age (Optional[float]): Maximum age in seconds of the document, None for any age
+
+        Returns:
+            Optional[FirecrawlDocument]: The document, or None if none is stored or it is too old
+        """
+        document = self._latest('url', url, max_age)
+        return _validate_document(document) if document is not None else None
+
+    def iter_documents(self, url: Optional[str] = None, since: Optional[float] = None) -> Iterator[Tuple[float, FirecrawlDocument]]:
+        """
+        Iterate over stored documents in the order they were stored, with the time each was scraped.
+
+        Args:
+            url (Optional[str]): Only documents of this URL (default: all)
+            since (Optional[float]): Only documents scraped at or after this Unix timestamp (default: all)
+
+        Yields:
+            Tuple[float, FirecrawlDocument]: Each document's scrape time and the document
+        """
+        query = 'SELECT id, scraped_at, fields, bodies FROM documents WHERE id > ?'
+        params: List[Any] = []
+        if url is not None:
+            query += ' AND url = ?'
+            params.append(url)
+        if since is not None:
+            query += ' AND scraped_at >= ?'
+            params.append(since)
+        query += ' ORDER BY id LIMIT 100'
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._connection.execute(query, [last_id, *params]).fetchall()
+            if not rows:
+                return
+            for last_id, scraped_at, fields, bodies in rows:
+                yield scraped_at, _validate_document(self._decode(fields, bodies))
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        return self._latest('key', key, max_age)
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        self.add(data, key=key)
+
+    def prune(self, before: float) -> int:
+        """
+        Delete documents scraped before a time, and content no remaining document refers to.
+
+        Args:
+            before (float): Unix timestamp; documents scraped earlier are deleted
+
+        Returns:
+            int: Number of documents deleted
+        """
+        with self._transaction() as connection:
+            deleted = connection.execute('DELETE FROM documents WHERE scraped_at < ?', (before,)).rowcount
+            connection.execute('''
+                DELETE FROM bodies WHERE hash NOT IN (
+                    SELECT value FROM documents, json_each(documents.bodies))''')
+        return deleted
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        with self._lock:
+            connection = self._connection
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield connection
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+
+    def _latest(self, column: str, value: str, max_age: Optional[float]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                f'SELECT scraped_at, fields, bodies FROM documents WHERE {column} = ? ORDER BY scraped_at DESC, id DESC LIMIT 1',
+                (value,)).fetchone()
+        if row is None:
+            return None
+        scraped_at, fields, bodies = row
+        age = time.time() - scraped_at
+        if (max_age is not None and age > max_age) or (column == 'key' and self.ttl is not None and age > self.ttl):
+            return None
+        return self._decode(fields, bodies)
+
+    def _encode(self, document: Union[FirecrawlDocument, DocumentView, Dict[str, Any]]) -> Tuple[Optional[str], str, Dict[str, Tuple[str, str, int, bytes]]]:
+        """
+        Split a document into its small fields, as JSON, and its compressed content bodies by field.
+        """
+        fields = dict(_document_dict(document))
+        bodies = {}
+        for field in self.BODY_FIELDS:
+            body = fields.pop(field, None)
+            if body is None:
+                continue
+            raw = body.encode('utf-8')
+            if self.compression == 'zstd':
+                data = zstandard.ZstdCompressor().compress(raw)
+            else:
+                data = zlib.compress(raw)
+            bodies[field] = (hashlib.sha256(raw).hexdigest(), self.compression, len(raw), data)
+        return _document_url(fields), json.dumps(fields), bodies
+
+    def _decode(self, fields: str, bodies: str) -> Dict[str, Any]:
+        document = json.loads(fields)
+        hashes = json.loads(bodies)
+        if hashes:
+            with self._lock:
+                rows = self._connection.execute(
+                    f'SELECT hash, codec, data FROM bodies WHERE hash IN ({", ".join("?" * len(hashes))})',
+                    list(hashes.values())).fetchall()
+            content = {}
+            for hash, codec, data in rows:
+                if codec == 'zstd':
+                    _require_zstandard()
+                    content[hash] = zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+                else:
+                    content[hash] = zlib.decompress(data).decode('utf-8')
+            for field, hash in hashes.items():
+                document[field] = content[hash]
+        return document
 
-class DeepResearchParams(pydantic.BaseModel):
-    """
-    Parameters for the deep research operation.
+class ScrapeManifest:
     """
-    maxDepth: Optional[int] = 7
-    timeLimit: Optional[int] = 270
-    maxUrls: Optional[int] = 20
-    analysisPrompt: Optional[str] = None
-    systemPrompt: Optional[str] = None
-    __experimental_streamSteps: Optional[bool] = None
+    Content hash, scrape time and HTTP validators of each page scraped, kept in a SQLite database.
 
-class DeepResearchResponse(pydantic.BaseModel):
-    """
-    Response from the deep research operation.
+    Record crawl or batch scrape results with record(), then pass the manifest to rescrape_changed
+    to scrape again only the pages that changed.
     """
-    success: bool
-    id: str
-    error: Optional[str] = None
+    def __init__(self, path: str = ':memory:', timeout: float = 30.0) -> None:
+        """
+        Args:
+            path (str): Path to the database file, created if it does not exist (default: in memory)
+            timeout (float): Seconds to wait for another process holding the database lock (default: 30)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS pages ('
+            'url TEXT PRIMARY KEY, hash TEXT, scraped_at REAL NOT NULL, etag TEXT, last_modified TEXT)')
 
-class DeepResearchStatusResponse(pydantic.BaseModel):
-    """
-    Status response from the deep research operation.
-    """
-    success: bool
-    data: Optional[Dict[str, Any]] = None
-    status: str
-    error: Optional[str] = None
-    expiresAt: str
-    currentDepth: int
-    maxDepth: int
-    activities: List[Dict[str, Any]]
-    sources: List[Dict[str, Any]]
-    summaries: List[str]
+    def __enter__(self) -> 'ScrapeManifest':
+        return self
 
-class GenerateLLMsTextResponse(pydantic.BaseModel):
-    """Response from LLMs.txt generation operations."""
-    success: bool = True
-    id: str
-    error: Optional[str] = None
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
-class GenerateLLMsTextStatusResponseData(pydantic.BaseModel):
-    llmstxt: str
-    llmsfulltxt: Optional[str] = None
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
 
-class GenerateLLMsTextStatusResponse(pydantic.BaseModel):
-    """Status response from LLMs.txt generation operations."""
-    success: bool = True
-    data: Optional[GenerateLLMsTextStatusResponseData] = None
-    status: Literal["processing", "completed", "failed"]
-    error: Optional[str] = None
-    expiresAt: str
-    
-class SearchResponse(pydantic.BaseModel):
-    """
-    Response from the search operation.
-    """
-    success: bool
-    data: List[Dict[str, Any]]
-    warning: Optional[str] = None
-    error: Optional[str] = None
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
 
-class ExtractParams(pydantic.BaseModel):
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Return what is recorded for a URL.
+
+        Args:
+            url (str): The page URL
+
+        Returns:
+            Optional[Dict[str, Any]]: The page's 'hash', 'scraped_at', 'etag' and 'last_modified', or None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT hash, scraped_at, etag, last_modified FROM pages WHERE url = ?', (url,)).fetchone()
+        return dict(zip(('hash', 'scraped_at', 'etag', 'last_modified'), row)) if row is not None else None
+
+    def record(
+            self,
+            documents: Iterable[Union[FirecrawlDocument, DocumentView, Dict[str, Any]]],
+            *,
+            scraped_at: Optional[float] = None) -> int:
+        """
+        Record the content hashes of scraped documents, such as the results of a crawl.
+
+        Args:
+            documents (Iterable[Union[FirecrawlDocument, DocumentView, Dict[str, Any]]]): The documents
+            scraped_at (Optional[float]): When the documents were scraped, as a Unix timestamp (default: now)
+
+        Returns:
+            int: Number of documents whose content changed or that were not recorded before
+        """
+        changed = 0
+        for document in documents:
+            document = _document_dict(document)
+            url = _document_url(document)
+            if url is not None:
+                changed += self.update(url, document, scraped_at=scraped_at)
+        return changed
+
+    def update(
+            self,
+            url: str,
+            document: Union[FirecrawlDocument, DocumentView, Dict[str, Any]],
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None,
+            scraped_at: Optional[float] = None) -> bool:
+        """
+        Record a scrape of url, keeping its validators when neither they nor its content changed.
+
+        Args:
+            url (str): The page URL
+            document (Union[FirecrawlDocument, DocumentView, Dict[str, Any]]): The scraped document
+            etag (Optional[str]): The page's ETag header, if known
+            last_modified (Optional[str]): The page's Last-Modified header, if known
+            scraped_at (Optional[float]): When the page was scraped, as a Unix timestamp (default: now)
+
+        Returns:
+            bool: Whether the content changed or the URL was not recorded before
+        """
+        content_hash = _content_hash(_document_dict(document))
+        with self._lock:
+            connection = self._connection
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                row = connection.execute('SELECT hash, etag, last_modified FROM pages WHERE url = ?', (url,)).fetchone()
+                changed = row is None or row[0] != content_hash
+                if not changed and etag is None and last_modified is None:
+                    etag, last_modified = row[1], row[2]
+                connection.execute(
+                    'INSERT OR REPLACE INTO pages (url, hash, scraped_at, etag, last_modified) VALUES (?, ?, ?, ?, ?)',
+                    (url, content_hash, scraped_at if scraped_at is not None else time.time(), etag, last_modified))
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        return changed
+
+    def is_unchanged(self, url: str, etag: Optional[str], last_modified: Optional[str]) -> bool:
+        """
+        Whether a page's current HTTP validators show it has not changed since it was recorded.
+
+        The ETag is compared when the page sends one, and Last-Modified otherwise.
+        A page without either, or not recorded, is never considered unchanged.
+
+        Args:
+            url (str): The page URL
+            etag (Optional[str]): The ETag header of the page now
+            last_modified (Optional[str]): The Last-Modified header of the page now
+        """
+        page = self.get(url)
+        if page is None:
+            return False
+        if etag:
+            return page['etag'] == etag
+        return bool(last_modified) and page['last_modified'] == last_modified
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+class _ScrapeSlots:
     """
-    Parameters for the extract operation.
+    Tracks the scrapes in flight for each domain and holds back URLs whose domain is at its cap.
     """
-    prompt: Optional[str] = None
-    schema: Optional[Any] = pydantic.Field(None, alias='schema')
-    system_prompt: Optional[str] = None
-    allow_external_links: Optional[bool] = False
-    enable_web_search: Optional[bool] = False
-    # Just for backwards compatibility
-    enableWebSearch: Optional[bool] = False
-    show_sources: Optional[bool] = False
-    agent: Optional[Dict[str, Any]] = None
+    def __init__(self, per_domain: Optional[int] = None) -> None:
+        if per_domain is not None and per_domain < 1:
+            raise ValueError('per_domain_concurrency must be at least 1')
+        self.per_domain = per_domain
+        self._active: collections.Counter = collections.Counter()
+        self._deferred: collections.deque = collections.deque()
+
+    def __len__(self) -> int:
+        return len(self._deferred)
+
+    def admit(self, url: str, tag: Any = None) -> bool:
+        """
+        Start a scrape of url if its domain has room, otherwise hold the URL back together with tag.
+        """
+        domain = _url_domain(url)
+        if self.per_domain is not None and self._active[domain] >= self.per_domain:
+            self._deferred.append((domain, url, tag))
+            return False
+        self._active[domain] += 1
+        return True
+
+    def take_deferred(self) -> Optional[Tuple[str, Any]]:
+        """
+        Start the oldest held-back URL whose domain now has room, if any, returning it with its tag.
+        """
+        for i, (domain, url, tag) in enumerate(self._deferred):
+            if self._active[domain] < self.per_domain:
+                del self._deferred[i]
+                self._active[domain] += 1
+                return url, tag
+        return None
+
+    def release(self, url: str) -> None:
+        domain = _url_domain(url)
+        self._active[domain] -= 1
+        if not self._active[domain]:
+            del self._active[domain]
 
 class FirecrawlApp:
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None) -> None:
+    def __init__(
+            self,
+            api_key: Optional[str] = None,
+            api_url: Optional[str] = None,
+            *,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            http2: bool = False,
+            compress_requests: bool = False,
+            compression_threshold: int = 65536,
+            json_codec: Union[str, JsonCodec] = 'auto',
+            validate: Literal['full', 'lazy', 'none'] = 'full',
+            poll_strategy: Optional[PollingStrategy] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            coalesce_scrapes: bool = False,
+            scrape_cache: Optional[ScrapeCache] = None) -> None:
         """
         Initialize the FirecrawlApp instance with API key, API URL.
 
         Args:
             api_key (Optional[str]): API key for authenticating with the Firecrawl API.
             api_url (Optional[str]): Base URL for the Firecrawl API.
+            pool_connections (int): Number of per-host connection pools to keep (default: 10)
+            pool_maxsize (int): Maximum connections kept open per host (default: 10)
+            pool_block (bool): Block instead of opening extra connections once pool_maxsize is reached
+            keep_alive (bool): Reuse connections between requests (default: True)
+            http2 (bool): Use an httpx transport that speaks HTTP/2 and multiplexes requests
+                over one connection per host. Requires `pip install firecrawl-py[http2]`
+            compress_requests (bool): Gzip request bodies larger than compression_threshold (default: False)
+            compression_threshold (int): Minimum request body size in bytes to compress (default: 65536)
+            json_codec (Union[str, JsonCodec]): JSON codec used for request bodies, responses and
+                WebSocket messages: 'orjson', 'msgspec', 'json' or 'auto' to use orjson or msgspec
+                when installed and the standard library otherwise (default: 'auto')
+            validate (Literal['full', 'lazy', 'none']): How documents in crawl and batch scrape results
+                are validated. 'full' returns FirecrawlDocument models, 'lazy' returns DocumentView
+                objects that validate each field on first access and 'none' returns the raw
+                dicts (default: 'full')
+            poll_strategy (Optional[PollingStrategy]): Default schedule for status checks of running
+                jobs. Defaults to an adaptive PollingStrategy starting at each call's poll_interval
+            retry_policy (Optional[RetryPolicy]): Which failed requests to retry and how long to wait
+                between attempts (default: RetryPolicy())
+            circuit_breaker (Optional[CircuitBreaker]): Per-host circuit breaker that fails requests fast
+                after repeated failures (default: None, disabled)
+            rate_limiter (Optional[RateLimiter]): Client-side limit on request rate and concurrency
+                per endpoint class (default: None, disabled)
+            coalesce_scrapes (bool): Let concurrent scrape_url calls with identical parameters share
+                one request and its result (default: False)
+            scrape_cache (Optional[ScrapeCache]): Cache of scrape_url results, such as a MemoryScrapeCache,
+                consulted before sending a scrape (default: None, disabled)
         """
         self.api_key = api_key or os.getenv('FIRECRAWL_API_KEY')
         self.api_url = api_url or os.getenv('FIRECRAWL_API_URL', 'https://api.firecrawl.dev')
@@ -456,9 +2265,121 @@ class FirecrawlApp:
         if 'api.firecrawl.dev' in self.api_url and self.api_key is None:
             logger.warning("No API key provided for cloud service")
             raise ValueError('No API key provided')
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.http2 = http2
+        if http2:
+            _require_httpx()
+        self.compress_requests = compress_requests
+        self.compression_threshold = compression_threshold
+        self.json_codec = _get_json_codec(json_codec)
+        if validate not in ('full', 'lazy', 'none'):
+            raise ValueError(f"validate must be 'full', 'lazy' or 'none', got {validate!r}")
+        self.validate = validate
+        self.poll_strategy = poll_strategy
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self._rate_limit_key = hashlib.sha256((self.api_key or '').encode()).hexdigest()[:16]
+        self._scrape_flights = _SingleFlight() if coalesce_scrapes else None
+        self.scrape_cache = scrape_cache
+        self.transfer_stats = TransferStats()
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self._job_monitor: Optional['JobMonitor'] = None
             
         logger.debug(f"Initialized FirecrawlApp with API URL: {self.api_url}")
 
+    def __enter__(self) -> 'FirecrawlApp':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The pooled HTTP session shared by every request this client makes.
+
+        The session is created on first use. Its connection pools are thread-safe,
+        so a single FirecrawlApp can be shared between worker threads. With http2
+        enabled this is an httpx.Client, which exposes the same request methods.
+        """
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+        return session
+
+    @property
+    def job_monitor(self) -> 'JobMonitor':
+        """
+        The JobMonitor shared by this client, which polls many jobs from a single background thread.
+
+        The monitor is created on first use and uses the client's poll_strategy.
+        On AsyncFirecrawlApp it is an AsyncJobMonitor polling from the running event loop.
+        """
+        monitor = self._job_monitor
+        if monitor is None:
+            with self._session_lock:
+                if self._job_monitor is None:
+                    self._job_monitor = self._create_job_monitor()
+                monitor = self._job_monitor
+        return monitor
+
+    def _create_job_monitor(self) -> 'JobMonitor':
+        return JobMonitor(self)
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a requests session with a keep-alive connection pool mounted for http and https.
+
+        Returns:
+            requests.Session: The configured session, or an httpx.Client when http2 is enabled.
+        """
+        if self.http2:
+            return httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.pool_connections * self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0
+                ),
+                headers=None if self.keep_alive else {'Connection': 'close'},
+                timeout=None
+            )
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP session and release its connections.
+
+        Jobs still tracked by the job monitor are no longer polled and their futures are cancelled.
+        The client stays usable; a new session is created on the next request.
+        """
+        with self._session_lock:
+            session, self._session = self._session, None
+            monitor, self._job_monitor = self._job_monitor, None
+        if monitor is not None:
+            monitor.close()
+        if session is not None:
+            session.close()
+
     def scrape_url(
             self,
             url: str,
@@ -483,6 +2404,7 @@ class FirecrawlApp:
             max_age: Optional[int] = None,
             store_in_cache: Optional[bool] = None,
             zero_data_retention: Optional[bool] = None,
+            profile: Optional[ScrapeProfile] = None,
             **kwargs) -> ScrapeResponse[Any]:
         """
         Scrape and extract content from a URL.
@@ -505,7 +2427,10 @@ class FirecrawlApp:
           json_options (Optional[JsonConfig]): JSON extraction settings
           actions (Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]]): Actions to perform
           change_tracking_options (Optional[ChangeTrackingOptions]): Change tracking settings
+          max_age (Optional[int]): Maximum age in milliseconds of a cached page to accept
+          store_in_cache (Optional[bool]): Whether to store the result in the cache
           zero_data_retention (Optional[bool]): Whether to delete data after scrape is done
+          profile (Optional[ScrapeProfile]): Compiled options to scrape with, added to by any other options given
 
 
         Returns:
@@ -521,10 +2446,15 @@ class FirecrawlApp:
         headers = self._prepare_headers()
 
         # Build scrape parameters
-        scrape_params = {
-            'url': url,
-            'origin': f"python-sdk@{version}"
-        }
+        if profile is not None:
+            scrape_params = profile.params(url=url)
+            if timeout is None:
+                timeout = profile.timeout
+        else:
+            scrape_params = {
+                'url': url,
+                'origin': f"python-sdk@{version}"
+            }
 
         # Add optional parameters if provided
         if formats:
@@ -571,35 +2501,194 @@ class FirecrawlApp:
             scrape_params['maxAge'] = max_age
         if store_in_cache is not None:
             scrape_params['storeInCache'] = store_in_cache
+        if zero_data_retention is not None:
+            scrape_params['zeroDataRetention'] = zero_data_retention
         
         scrape_params.update(kwargs)
 
-        if 'extract' in scrape_params and scrape_params['extract'] and 'schema' in scrape_params['extract']:
-            scrape_params['extract']['schema'] = self._ensure_schema_dict(scrape_params['extract']['schema'])
-        if 'jsonOptions' in scrape_params and scrape_params['jsonOptions'] and 'schema' in scrape_params['jsonOptions']:
-            scrape_params['jsonOptions']['schema'] = self._ensure_schema_dict(scrape_params['jsonOptions']['schema'])
+        for key in ('extract', 'jsonOptions'):
+            # A profile's schemas were generated when it was compiled, and its options are shared
+            if profile is not None and scrape_params.get(key) is profile.payload.get(key):
+                continue
+            if scrape_params.get(key) and 'schema' in scrape_params[key]:
+                scrape_params[key]['schema'] = self._ensure_schema_dict(scrape_params[key]['schema'])
+
+        def scrape() -> Dict[str, Any]:
+            response = self._send_with_retries(
+                'POST',
+                f'{self.api_url}/v1/scrape',
+                headers,
+                scrape_params,
+                timeout=(timeout + 5000 if timeout else None)
+            )
 
-        # Make request
-        response = requests.post(
-            f'{self.api_url}/v1/scrape',
-            headers=headers,
-            json=scrape_params,
-            timeout=(timeout + 5000 if timeout else None)
-        )
+            if response.status_code == 200:
+                try:
+                    response_json = self._parse_json(response)
+                    if response_json.get('success') and 'data' in response_json:
+                        return response_json['data']
+                    elif "error" in response_json:
+                        raise Exception(f'Failed to scrape URL. Error: {response_json["error"]}')
+                    else:
+                        raise Exception(f'Failed to scrape URL. Error: {response_json}')
+                except ValueError:
+                    raise Exception('Failed to parse Firecrawl response as JSON.')
+            else:
+                self._handle_error(response, 'scrape URL')
 
-        if response.status_code == 200:
-            try:
-                response_json = response.json()
-                if response_json.get('success') and 'data' in response_json:
-                    return ScrapeResponse(**response_json['data'])
-                elif "error" in response_json:
-                    raise Exception(f'Failed to scrape URL. Error: {response_json["error"]}')
-                else:
-                    raise Exception(f'Failed to scrape URL. Error: {response_json}')
-            except ValueError:
-                raise Exception('Failed to parse Firecrawl response as JSON.')
+        cache_key, data = self._scrape_cache_lookup(scrape_params)
+        if data is not None:
+            return ScrapeResponse(**data)
+
+        # Make request, sharing it with identical scrapes already in flight when enabled
+        if self._scrape_flights is not None:
+            data = self._scrape_flights.do(_scrape_key(scrape_params), scrape)
         else:
-            self._handle_error(response, 'scrape URL')
+            data = scrape()
+        self._scrape_cache_store(cache_key, scrape_params, data)
+        return ScrapeResponse(**data)
+
+    def scrape_many(
+            self,
+            urls: Iterable[str],
+            *,
+            max_workers: int = 10,
+            per_domain_concurrency: Optional[int] = None,
+            ordered: bool = False,
+            **scrape_opts) -> Iterator[Tuple[str, Union[ScrapeResponse[Any], Exception]]]:
+        """
+        Scrape many URLs with scrape_url on a thread pool, yielding results as they complete.
+
+        The worker threads share the client's pooled session, so pool_maxsize should be at least max_workers.
+        URLs are read from urls only as scrapes finish, keeping at most twice max_workers of them in memory.
+        A failed scrape does not stop the others: its exception is yielded in place of the response.
+        Closing the iterator, or breaking out of a loop over it, stops new scrapes from starting.
+
+        Args:
+            urls (Iterable[str]): URLs to scrape
+            max_workers (int): Maximum scrapes in flight at once
+            per_domain_concurrency (Optional[int]): Maximum scrapes in flight for any one domain, None for no limit
+            ordered (bool): Yield results in the order of urls instead of completion order
+            **scrape_opts: Options passed to scrape_url for every URL
+
+        Yields:
+            Tuple[str, Union[ScrapeResponse[Any], Exception]]: Each URL with its response or the exception
+            its scrape raised
+
+        Raises:
+            ValueError: If max_workers or per_domain_concurrency is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        slots = _ScrapeSlots(per_domain_concurrency)
+        url_iterator = iter(urls)
+        window = 2 * max_workers
+        read = 0
+        yielded = 0
+        exhausted = False
+        running: Dict[concurrent.futures.Future, Tuple[str, int]] = {}
+        # Results that finished ahead of an earlier URL, by input position, in ordered mode
+        finished: Dict[int, Tuple[str, Any]] = {}
+
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='firecrawl-scrape')
+        try:
+            while True:
+                while len(running) < max_workers:
+                    deferred = slots.take_deferred() if per_domain_concurrency is not None else None
+                    if deferred is not None:
+                        url, index = deferred
+                    else:
+                        # URLs read but not yet yielded are either running, waiting for a busy domain
+                        # or, in ordered mode, waiting for an earlier URL
+                        if exhausted or read - yielded >= window:
+                            break
+                        url = next(url_iterator, None)
+                        if url is None:
+                            exhausted = True
+                            break
+                        index = read
+                        read += 1
+                        if not slots.admit(url, index):
+                            continue
+                    running[pool.submit(self.scrape_url, url, **scrape_opts)] = (url, index)
+                if not running:
+                    return
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    url, index = running.pop(future)
+                    slots.release(url)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = e
+                    if ordered:
+                        finished[index] = (url, result)
+                    else:
+                        yielded += 1
+                        yield url, result
+                while yielded in finished:
+                    yielded += 1
+                    yield finished.pop(yielded - 1)
+        finally:
+            for future in running:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def rescrape_changed(
+            self,
+            urls: Iterable[str] = (),
+            *,
+            manifest: ScrapeManifest,
+            map_site: Optional[str] = None,
+            max_workers: int = 10,
+            probe_timeout: float = 10.0,
+            **scrape_opts) -> Iterator[Tuple[str, Union[ScrapeResponse[Any], Exception]]]:
+        """
+        Scrape again only the pages that changed since they were recorded in a manifest.
+
+        Every URL is first probed with a HEAD request to its own site. A page whose ETag, or
+        Last-Modified header when it sends no ETag, matches the one recorded is skipped without a
+        scrape. The other pages are scraped with scrape_many, and a result whose content hash
+        matches the manifest is not yielded. The manifest is updated as results arrive.
+
+        Args:
+            urls (Iterable[str]): URLs to check
+            manifest (ScrapeManifest): The pages scraped before
+            map_site (Optional[str]): Also check every URL map_url finds on this site, so new pages are scraped
+            max_workers (int): Maximum probes or scrapes in flight at once
+            probe_timeout (float): Seconds to wait for each HEAD probe
+            **scrape_opts: Options passed to scrape_url
+
+        Yields:
+            Tuple[str, Union[ScrapeResponse[Any], Exception]]: Each new or changed page with its response,
+            or the exception its scrape raised
+        """
+        candidates = list(urls)
+        if map_site is not None:
+            candidates.extend(self.map_url(map_site).links or [])
+        candidates = list(dict.fromkeys(candidates))
+
+        def probe(url: str) -> Tuple[Optional[str], Optional[str]]:
+            try:
+                response = session.head(url, timeout=probe_timeout, allow_redirects=True)
+            except requests.exceptions.RequestException:
+                return None, None
+            if response.status_code >= 400:
+                return None, None
+            return response.headers.get('ETag'), response.headers.get('Last-Modified')
+
+        # Probes go to the sites themselves, so they use their own session without the API credentials
+        validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        with requests.Session() as session, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='firecrawl-probe') as pool:
+            for url, (etag, last_modified) in zip(candidates, pool.map(probe, candidates)):
+                if not manifest.is_unchanged(url, etag, last_modified):
+                    validators[url] = (etag, last_modified)
+        logger.debug(f"{len(candidates) - len(validators)} of {len(candidates)} pages unchanged by their validators")
+
+        for url, result in self.scrape_many(list(validators), max_workers=max_workers, **scrape_opts):
+            if isinstance(result, Exception) or manifest.update(url, result, *validators[url]):
+                yield url, result
 
     def search(
             self,
@@ -672,15 +2761,16 @@ class FirecrawlApp:
         params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
-        response = requests.post(
+        response = self._send_with_retries(
+            'POST',
             f"{self.api_url}/v1/search",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json=params_dict
+            {"Authorization": f"Bearer {self.api_key}"},
+            params_dict
         )
 
         if response.status_code == 200:
             try:
-                response_json = response.json()
+                response_json = self._parse_json(response)
                 if response_json.get('success') and 'data' in response_json:
                     return SearchResponse(**response_json)
                 elif "error" in response_json:
@@ -715,6 +2805,7 @@ class FirecrawlApp:
         max_concurrency: Optional[int] = None,
         zero_data_retention: Optional[bool] = None,
         poll_interval: Optional[int] = 2,
+        poll_strategy: Optional[PollingStrategy] = None,
         idempotency_key: Optional[str] = None,
         **kwargs
     ) -> CrawlStatusResponse:
@@ -742,6 +2833,7 @@ class FirecrawlApp:
             max_concurrency (Optional[int]): Maximum number of concurrent scrapes
             zero_data_retention (Optional[bool]): Whether to delete data after 24 hours
             poll_interval (Optional[int]): Seconds between status checks (default: 2)
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
             **kwargs: Additional parameters to pass to the API
 
@@ -811,10 +2903,10 @@ class FirecrawlApp:
 
         if response.status_code == 200:
             try:
-                id = response.json().get('id')
+                id = self._parse_json(response).get('id')
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return self._monitor_job_status(id, headers, poll_interval)
+            return self._monitor_job_status(id, headers, poll_interval, poll_strategy)
         else:
             self._handle_error(response, 'start crawl job')
 
@@ -841,8 +2933,9 @@ class FirecrawlApp:
         max_concurrency: Optional[int] = None,
         zero_data_retention: Optional[bool] = None,
         idempotency_key: Optional[str] = None,
+        return_handle: bool = False,
         **kwargs
-    ) -> CrawlResponse:
+    ) -> Union[CrawlResponse, 'JobHandle']:
         """
         Start an asynchronous crawl job.
 
@@ -867,6 +2960,7 @@ class FirecrawlApp:
             max_concurrency (Optional[int]): Maximum number of concurrent scrapes
             zero_data_retention (Optional[bool]): Whether to delete data after 24 hours
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            return_handle (bool): Return a JobHandle that resolves to the crawl results instead of the bare response
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -936,18 +3030,25 @@ class FirecrawlApp:
 
         if response.status_code == 200:
             try:
-                return CrawlResponse(**response.json())
+                crawl_response = CrawlResponse(**self._parse_json(response))
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
+            if return_handle:
+                return JobHandle(self, 'crawl', crawl_response)
+            return crawl_response
         else:
             self._handle_error(response, 'start crawl job')
 
-    def check_crawl_status(self, id: str) -> CrawlStatusResponse:
+    def check_crawl_status(self, id: str, prefetch: int = 0, parallel: int = 0) -> CrawlStatusResponse:
         """
         Check the status and results of a crawl job.
 
         Args:
             id: Unique identifier for the crawl job
+            prefetch: Number of result pages to fetch ahead on a background thread while
+                earlier pages are processed (default: 0, pages are fetched one at a time)
+            parallel: Once the job is complete, fetch up to this many result pages at once
+                using skip offsets (default: 0, pages are fetched by following `next` links)
 
         Returns:
             CrawlStatusResponse containing:
@@ -974,33 +3075,19 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}{endpoint}', headers)
         if response.status_code == 200:
             try:
-                status_data = response.json()
+                status_data = self._parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
                 if 'data' in status_data:
                     data = status_data['data']
-                    while 'next' in status_data:
-                        if len(status_data['data']) == 0:
-                            break
-                        next_url = status_data.get('next')
-                        if not next_url:
-                            logger.warning("Expected 'next' URL is missing.")
-                            break
-                        try:
-                            status_response = self._get_request(next_url, headers)
-                            if status_response.status_code != 200:
-                                logger.error(f"Failed to fetch next page: {status_response.status_code}")
-                                break
-                            try:
-                                next_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                    next_pages = self._read_ahead(self._next_pages(status_data, headers, 'check crawl status', parallel), prefetch)
+                    try:
+                        for next_data in next_pages:
                             data.extend(next_data.get('data', []))
                             status_data = next_data
-                        except Exception as e:
-                            logger.error(f"Error during pagination request: {e}")
-                            break
+                    except Exception as e:
+                        logger.error(f"Error during pagination request: {e}")
                     status_data['data'] = data
 
             response = {
@@ -1018,12 +3105,44 @@ class FirecrawlApp:
             if 'next' in status_data:
                 response['next'] = status_data['next']
 
-            return CrawlStatusResponse(
-                success=False if 'error' in status_data else True,
+            return self._build_status_response(CrawlStatusResponse, {
+                'success': False if 'error' in status_data else True,
                 **response
-            )
+            })
         else:
             self._handle_error(response, 'check crawl status')
+
+    def iter_crawl_documents(
+            self,
+            id: str,
+            poll_interval: int = 2,
+            prefetch: int = 0,
+            parallel: int = 0,
+            stream: bool = False) -> Iterator[FirecrawlDocument]:
+        """
+        Iterate over the documents of a crawl job page by page.
+
+        Waits for the job to finish, then follows the result pages one at a time so
+        only a single page of documents is held in memory.
+
+        Args:
+            id (str): The ID of the crawl job
+            poll_interval (int): Seconds between status checks while the job is running (default: 2)
+            prefetch (int): Number of result pages to fetch ahead on a background thread (default: 0)
+            parallel (int): Number of result pages to fetch at once using skip offsets (default: 0)
+            stream (bool): Parse each result page incrementally as it downloads, holding a single
+                document in memory instead of a whole page. Requires ijson; cannot be combined
+                with prefetch or parallel (default: False)
+
+        Yields:
+            FirecrawlDocument: Each crawled document, in result order
+
+        Raises:
+            Exception: If the job fails, is cancelled or a status request fails
+        """
+        documents = self._iter_job_documents(f'{self.api_url}/v1/crawl/{id}', 'check crawl status', poll_interval, prefetch, parallel, stream)
+        for document in documents:
+            yield self._build_document(document)
     
     def check_crawl_errors(self, id: str) -> CrawlErrorsResponse:
         """
@@ -1048,7 +3167,7 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}/v1/crawl/{id}/errors', headers)
         if response.status_code == 200:
             try:
-                return CrawlErrorsResponse(**response.json())
+                return CrawlErrorsResponse(**self._parse_json(response))
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -1073,12 +3192,37 @@ class FirecrawlApp:
         response = self._delete_request(f'{self.api_url}/v1/crawl/{id}', headers)
         if response.status_code == 200:
             try:
-                return response.json()
+                return self._parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
             self._handle_error(response, "cancel crawl job")
 
+    def cancel_batch_scrape(self, id: str) -> Dict[str, Any]:
+        """
+        Cancel a batch scrape job.
+
+        Args:
+            id (str): The ID of the batch scrape job to cancel
+
+        Returns:
+            Dict[str, Any] containing:
+            * success (bool): Whether cancellation was successful
+            * error (str, optional): Error message if cancellation failed
+
+        Raises:
+            Exception: If cancellation fails
+        """
+        headers = self._prepare_headers()
+        response = self._delete_request(f'{self.api_url}/v1/batch/scrape/{id}', headers)
+        if response.status_code == 200:
+            try:
+                return self._parse_json(response)
+            except:
+                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+        else:
+            self._handle_error(response, "cancel batch scrape job")
+
     def crawl_url_and_watch(
             self,
             url: str,
@@ -1229,15 +3373,16 @@ class FirecrawlApp:
         params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
-        response = requests.post(
+        response = self._send_with_retries(
+            'POST',
             f"{self.api_url}/v1/map",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json=params_dict
+            {"Authorization": f"Bearer {self.api_key}"},
+            params_dict
         )
 
         if response.status_code == 200:
             try:
-                response_json = response.json()
+                response_json = self._parse_json(response)
                 if response_json.get('success') and 'links' in response_json:
                     return MapResponse(**response_json)
                 elif "error" in response_json:
@@ -1271,9 +3416,11 @@ class FirecrawlApp:
         actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
         agent: Optional[AgentOptions] = None,
         poll_interval: Optional[int] = 2,
+        poll_strategy: Optional[PollingStrategy] = None,
         max_concurrency: Optional[int] = None,
         zero_data_retention: Optional[bool] = None,
         idempotency_key: Optional[str] = None,
+        profile: Optional[ScrapeProfile] = None,
         **kwargs
     ) -> BatchScrapeStatusResponse:
         """
@@ -1300,7 +3447,9 @@ class FirecrawlApp:
             agent (Optional[AgentOptions]): Agent configuration
             max_concurrency (Optional[int]): Maximum number of concurrent scrapes
             poll_interval (Optional[int]): Seconds between status checks (default: 2)
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            profile (Optional[ScrapeProfile]): Compiled options to scrape with, added to by any other options given
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -1364,16 +3513,21 @@ class FirecrawlApp:
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
-        # Create final params object
-        final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
-        params_dict['urls'] = urls
-        params_dict['origin'] = f"python-sdk@{version}"
-
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
+        if profile is not None and not scrape_params:
+            # The profile's options were validated and serialized when it was compiled
+            params_dict = profile.params(urls=urls)
+        else:
+            # Create final params object
+            final_params = ScrapeParams(**scrape_params)
+            params_dict = final_params.dict(exclude_none=True)
+            for key in ('extract', 'jsonOptions'):
+                if params_dict.get(key) and 'schema' in params_dict[key]:
+                    params_dict[key]['schema'] = self._ensure_schema_dict(params_dict[key]['schema'])
+            if profile is not None:
+                params_dict = profile.params(urls=urls, **params_dict)
+            else:
+                params_dict['urls'] = urls
+                params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
@@ -1381,10 +3535,10 @@ class FirecrawlApp:
 
         if response.status_code == 200:
             try:
-                id = response.json().get('id')
+                id = self._parse_json(response).get('id')
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return self._monitor_job_status(id, headers, poll_interval)
+            return self._monitor_job_status(id, headers, poll_interval, poll_strategy)
         else:
             self._handle_error(response, 'start batch scrape job')
 
@@ -1410,9 +3564,12 @@ class FirecrawlApp:
         actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
         agent: Optional[AgentOptions] = None,
         max_concurrency: Optional[int] = None,
+        zero_data_retention: Optional[bool] = None,
         idempotency_key: Optional[str] = None,
+        return_handle: bool = False,
+        profile: Optional[ScrapeProfile] = None,
         **kwargs
-    ) -> BatchScrapeResponse:
+    ) -> Union[BatchScrapeResponse, 'JobHandle']:
         """
         Initiate a batch scrape job asynchronously.
 
@@ -1438,6 +3595,8 @@ class FirecrawlApp:
             max_concurrency (Optional[int]): Maximum number of concurrent scrapes
             zero_data_retention (Optional[bool]): Whether to delete data after 24 hours
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            return_handle (bool): Return a JobHandle that resolves to the scraped documents instead of the bare response
+            profile (Optional[ScrapeProfile]): Compiled options to scrape with, added to by any other options given
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -1504,29 +3663,102 @@ class FirecrawlApp:
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
-        # Create final params object
-        final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
-        params_dict['urls'] = urls
-        params_dict['origin'] = f"python-sdk@{version}"
+        if profile is not None and not scrape_params:
+            # The profile's options were validated and serialized when it was compiled
+            params_dict = profile.params(urls=urls)
+        else:
+            # Create final params object
+            final_params = ScrapeParams(**scrape_params)
+            params_dict = final_params.dict(exclude_none=True)
+            for key in ('extract', 'jsonOptions'):
+                if params_dict.get(key) and 'schema' in params_dict[key]:
+                    params_dict[key]['schema'] = self._ensure_schema_dict(params_dict[key]['schema'])
+            if profile is not None:
+                params_dict = profile.params(urls=urls, **params_dict)
+            else:
+                params_dict['urls'] = urls
+                params_dict['origin'] = f"python-sdk@{version}"
+
+        # Make request
+        headers = self._prepare_headers(idempotency_key)
+        response = self._post_request(f'{self.api_url}/v1/batch/scrape', params_dict, headers)
 
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
+        if response.status_code == 200:
+            try:
+                batch_response = BatchScrapeResponse(**self._parse_json(response))
+            except:
+                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+            if return_handle:
+                return JobHandle(self, 'batch_scrape', batch_response)
+            return batch_response
+        else:
+            self._handle_error(response, 'start batch scrape job')
+    
+    def async_batch_scrape_urls_chunked(
+            self,
+            urls: Iterable[str],
+            *,
+            chunk_size: int = 1000,
+            max_submissions: int = 4,
+            idempotency_key: Optional[str] = None,
+            poll_strategy: Optional[PollingStrategy] = None,
+            **kwargs) -> 'BatchScrapeGroup':
+        """
+        Split a large list of URLs into chunks and start a batch scrape job for each, several at a time.
+
+        Each chunk is sent with its own idempotency key derived from idempotency_key, so a start
+        request retried after a timeout, or a whole submission repeated with the same key, cannot
+        start a chunk twice. Chunks whose job could not be started are kept on the returned group
+        with their error rather than failing the jobs already started.
+
+        Args:
+            urls (Iterable[str]): URLs to scrape, read one chunk at a time
+            chunk_size (int): Maximum URLs per batch scrape job (default: 1000)
+            max_submissions (int): Maximum start requests in flight at once, also used for status checks (default: 4)
+            idempotency_key (Optional[str]): UUID the chunks' idempotency keys are derived from (default: random)
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
+            **kwargs: Options passed to async_batch_scrape_urls for every chunk
+
+        Returns:
+            BatchScrapeGroup: The started jobs, whose documents and progress can be read as one job
 
-        # Make request
-        headers = self._prepare_headers(idempotency_key)
-        response = self._post_request(f'{self.api_url}/v1/batch/scrape', params_dict, headers)
+        Raises:
+            ValueError: If chunk_size or max_submissions is less than 1, or idempotency_key is not a UUID
+            Exception: If no job could be started
+        """
+        if chunk_size < 1 or max_submissions < 1:
+            raise ValueError('chunk_size and max_submissions must be at least 1')
+        base_key = uuid.UUID(idempotency_key) if idempotency_key else uuid.uuid4()
+        started: Dict[int, str] = {}
+        failed: Dict[int, Tuple[List[str], Exception]] = {}
+        pending: Dict[concurrent.futures.Future, Tuple[int, List[str]]] = {}
+
+        def collect(futures: Iterable[concurrent.futures.Future]) -> None:
+            for future in futures:
+                index, chunk = pending.pop(future)
+                try:
+                    started[index] = future.result().id
+                except Exception as e:
+                    failed[index] = (chunk, e)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_submissions, thread_name_prefix='firecrawl-submit') as pool:
+            for index, chunk in enumerate(_chunks(urls, chunk_size)):
+                if len(pending) >= max_submissions:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    collect(done)
+                key = str(uuid.uuid5(base_key, str(index)))
+                pending[pool.submit(self.async_batch_scrape_urls, chunk, idempotency_key=key, **kwargs)] = (index, chunk)
+            collect(list(pending))
+
+        if failed and not started:
+            raise failed[min(failed)][1]
+        return BatchScrapeGroup(
+            self,
+            [started[index] for index in sorted(started)],
+            [failed[index] for index in sorted(failed)],
+            max_workers=max_submissions,
+            poll_strategy=poll_strategy)
 
-        if response.status_code == 200:
-            try:
-                return BatchScrapeResponse(**response.json())
-            except:
-                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-        else:
-            self._handle_error(response, 'start batch scrape job')
-    
     def batch_scrape_urls_and_watch(
         self,
         urls: List[str],
@@ -1551,6 +3783,7 @@ class FirecrawlApp:
         max_concurrency: Optional[int] = None,
         zero_data_retention: Optional[bool] = None,
         idempotency_key: Optional[str] = None,
+        profile: Optional[ScrapeProfile] = None,
         **kwargs
     ) -> 'CrawlWatcher':
         """
@@ -1578,6 +3811,7 @@ class FirecrawlApp:
             max_concurrency (Optional[int]): Maximum number of concurrent scrapes
             zero_data_retention (Optional[bool]): Whether to delete data after 24 hours
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            profile (Optional[ScrapeProfile]): Compiled options to scrape with, added to by any other options given
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -1640,16 +3874,21 @@ class FirecrawlApp:
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
-        # Create final params object
-        final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
-        params_dict['urls'] = urls
-        params_dict['origin'] = f"python-sdk@{version}"
-
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
+        if profile is not None and not scrape_params:
+            # The profile's options were validated and serialized when it was compiled
+            params_dict = profile.params(urls=urls)
+        else:
+            # Create final params object
+            final_params = ScrapeParams(**scrape_params)
+            params_dict = final_params.dict(exclude_none=True)
+            for key in ('extract', 'jsonOptions'):
+                if params_dict.get(key) and 'schema' in params_dict[key]:
+                    params_dict[key]['schema'] = self._ensure_schema_dict(params_dict[key]['schema'])
+            if profile is not None:
+                params_dict = profile.params(urls=urls, **params_dict)
+            else:
+                params_dict['urls'] = urls
+                params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
@@ -1657,7 +3896,7 @@ class FirecrawlApp:
 
         if response.status_code == 200:
             try:
-                crawl_response = BatchScrapeResponse(**response.json())
+                crawl_response = BatchScrapeResponse(**self._parse_json(response))
                 if crawl_response.success and crawl_response.id:
                     return CrawlWatcher(crawl_response.id, self)
                 else:
@@ -1667,12 +3906,16 @@ class FirecrawlApp:
         else:
             self._handle_error(response, 'start batch scrape job')
     
-    def check_batch_scrape_status(self, id: str) -> BatchScrapeStatusResponse:
+    def check_batch_scrape_status(self, id: str, prefetch: int = 0, parallel: int = 0) -> BatchScrapeStatusResponse:
         """
         Check the status of a batch scrape job using the Firecrawl API.
 
         Args:
             id (str): The ID of the batch scrape job.
+            prefetch (int): Number of result pages to fetch ahead on a background thread while
+                earlier pages are processed (default: 0, pages are fetched one at a time).
+            parallel (int): Once the job is complete, fetch up to this many result pages at once
+                using skip offsets (default: 0, pages are fetched by following `next` links).
 
         Returns:
             BatchScrapeStatusResponse: The status of the batch scrape job.
@@ -1686,36 +3929,22 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}{endpoint}', headers)
         if response.status_code == 200:
             try:
-                status_data = response.json()
+                status_data = self._parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
                 if 'data' in status_data:
                     data = status_data['data']
-                    while 'next' in status_data:
-                        if len(status_data['data']) == 0:
-                            break
-                        next_url = status_data.get('next')
-                        if not next_url:
-                            logger.warning("Expected 'next' URL is missing.")
-                            break
-                        try:
-                            status_response = self._get_request(next_url, headers)
-                            if status_response.status_code != 200:
-                                logger.error(f"Failed to fetch next page: {status_response.status_code}")
-                                break
-                            try:
-                                next_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                    next_pages = self._read_ahead(self._next_pages(status_data, headers, 'check batch scrape status', parallel), prefetch)
+                    try:
+                        for next_data in next_pages:
                             data.extend(next_data.get('data', []))
                             status_data = next_data
-                        except Exception as e:
-                            logger.error(f"Error during pagination request: {e}")
-                            break
+                    except Exception as e:
+                        logger.error(f"Error during pagination request: {e}")
                     status_data['data'] = data
 
-            return BatchScrapeStatusResponse(**{
+            return self._build_status_response(BatchScrapeStatusResponse, {
                 'success': False if 'error' in status_data else True,
                 'status': status_data.get('status'),
                 'total': status_data.get('total'),
@@ -1729,6 +3958,38 @@ class FirecrawlApp:
         else:
             self._handle_error(response, 'check batch scrape status')
 
+    def iter_batch_scrape_documents(
+            self,
+            id: str,
+            poll_interval: int = 2,
+            prefetch: int = 0,
+            parallel: int = 0,
+            stream: bool = False) -> Iterator[FirecrawlDocument]:
+        """
+        Iterate over the documents of a batch scrape job page by page.
+
+        Waits for the job to finish, then follows the result pages one at a time so
+        only a single page of documents is held in memory.
+
+        Args:
+            id (str): The ID of the batch scrape job
+            poll_interval (int): Seconds between status checks while the job is running (default: 2)
+            prefetch (int): Number of result pages to fetch ahead on a background thread (default: 0)
+            parallel (int): Number of result pages to fetch at once using skip offsets (default: 0)
+            stream (bool): Parse each result page incrementally as it downloads, holding a single
+                document in memory instead of a whole page. Requires ijson; cannot be combined
+                with prefetch or parallel (default: False)
+
+        Yields:
+            FirecrawlDocument: Each scraped document, in result order
+
+        Raises:
+            Exception: If the job fails, is cancelled or a status request fails
+        """
+        documents = self._iter_job_documents(f'{self.api_url}/v1/batch/scrape/{id}', 'check batch scrape status', poll_interval, prefetch, parallel, stream)
+        for document in documents:
+            yield self._build_document(document)
+
     def check_batch_scrape_errors(self, id: str) -> CrawlErrorsResponse:
         """
         Returns information about batch scrape errors.
@@ -1752,7 +4013,7 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}/v1/batch/scrape/{id}/errors', headers)
         if response.status_code == 200:
             try:
-                return CrawlErrorsResponse(**response.json())
+                return CrawlErrorsResponse(**self._parse_json(response))
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -1768,7 +4029,8 @@ class FirecrawlApp:
             allow_external_links: Optional[bool] = False,
             enable_web_search: Optional[bool] = False,
             show_sources: Optional[bool] = False,
-            agent: Optional[Dict[str, Any]] = None) -> ExtractResponse[Any]:
+            agent: Optional[Dict[str, Any]] = None,
+            poll_strategy: Optional[PollingStrategy] = None) -> ExtractResponse[Any]:
         """
         Extract structured information from URLs.
 
@@ -1781,6 +4043,7 @@ class FirecrawlApp:
             enable_web_search (Optional[bool]): Enable web search
             show_sources (Optional[bool]): Include source URLs
             agent (Optional[Dict[str, Any]]): Agent configuration
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
 
         Returns:
             ExtractResponse[Any] with:
@@ -1829,7 +4092,7 @@ class FirecrawlApp:
             )
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = self._parse_json(response)
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
                 if data['success']:
@@ -1838,6 +4101,7 @@ class FirecrawlApp:
                         raise Exception('Job ID not returned from extract request.')
 
                     # Poll for the extract status
+                    poller = self._poller(poll_strategy)
                     while True:
                         status_response = self._get_request(
                             f'{self.api_url}/v1/extract/{job_id}',
@@ -1845,7 +4109,7 @@ class FirecrawlApp:
                         )
                         if status_response.status_code == 200:
                             try:
-                                status_data = status_response.json()
+                                status_data = self._parse_json(status_response)
                             except:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
                             if status_data['status'] == 'completed':
@@ -1855,7 +4119,7 @@ class FirecrawlApp:
                         else:
                             self._handle_error(status_response, "extract-status")
 
-                        time.sleep(2)  # Polling interval
+                        poller.wait(status_data, _parse_retry_after(status_response.headers.get('Retry-After')))
                 else:
                     raise Exception(f'Failed to extract. Error: {data["error"]}')
             else:
@@ -1883,7 +4147,7 @@ class FirecrawlApp:
             response = self._get_request(f'{self.api_url}/v1/extract/{job_id}', headers)
             if response.status_code == 200:
                 try:
-                    return ExtractResponse(**response.json())
+                    return ExtractResponse(**self._parse_json(response))
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
             else:
@@ -1951,7 +4215,7 @@ class FirecrawlApp:
             response = self._post_request(f'{self.api_url}/v1/extract', request_data, headers)
             if response.status_code == 200:
                 try:
-                    return ExtractResponse(**response.json())
+                    return ExtractResponse(**self._parse_json(response))
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
             else:
@@ -1966,7 +4230,8 @@ class FirecrawlApp:
             max_urls: Optional[int] = None,
             show_full_text: Optional[bool] = None,
             cache: Optional[bool] = None,
-            experimental_stream: Optional[bool] = None) -> GenerateLLMsTextStatusResponse:
+            experimental_stream: Optional[bool] = None,
+            poll_strategy: Optional[PollingStrategy] = None) -> GenerateLLMsTextStatusResponse:
         """
         Generate LLMs.txt for a given URL and poll until completion.
 
@@ -1976,6 +4241,7 @@ class FirecrawlApp:
             show_full_text (Optional[bool]): Include full text in output (default: False)
             cache (Optional[bool]): Whether to use cached content if available (default: True)
             experimental_stream (Optional[bool]): Enable experimental streaming
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
 
         Returns:
             GenerateLLMsTextStatusResponse with:
@@ -2011,6 +4277,7 @@ class FirecrawlApp:
             )
 
         job_id = response.id
+        poller = self._poller(poll_strategy)
         while True:
             status = self.check_generate_llms_text_status(job_id)
             
@@ -2026,7 +4293,7 @@ class FirecrawlApp:
                     expiresAt=''
                 )
 
-            time.sleep(2)  # Polling interval
+            poller.wait({'status': status.status})
 
     def async_generate_llms_text(
             self,
@@ -2068,7 +4335,7 @@ class FirecrawlApp:
 
         try:
             req = self._post_request(f'{self.api_url}/v1/llmstxt', json_data, headers)
-            response = req.json()
+            response = self._parse_json(req)
             print("json_data", json_data)
             print("response", response)
             if response.get('success'):
@@ -2111,7 +4378,7 @@ class FirecrawlApp:
             response = self._get_request(f'{self.api_url}/v1/llmstxt/{id}', headers)
             if response.status_code == 200:
                 try:
-                    json_data = response.json()
+                    json_data = self._parse_json(response)
                     return GenerateLLMsTextStatusResponse(**json_data)
                 except Exception as e:
                     raise Exception(f'Failed to parse Firecrawl response as GenerateLLMsTextStatusResponse: {str(e)}')
@@ -2124,6 +4391,36 @@ class FirecrawlApp:
 
         return GenerateLLMsTextStatusResponse(success=False, error='Internal server error', status='failed', expiresAt='')
 
+    def _scrape_cache_lookup(self, scrape_params: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look a scrape up in the client's scrape cache.
+
+        Cached results older than the scrape's maxAge are not used, and maxAge 0 always scrapes afresh.
+
+        Args:
+            scrape_params (Dict[str, Any]): The scrape request body
+
+        Returns:
+            Tuple[Optional[str], Optional[Dict[str, Any]]]: The cache key, None without a cache, and the cached
+            result, None on a miss
+        """
+        if self.scrape_cache is None:
+            return None, None
+        # Freshness options do not change the page, so results are shared between them
+        key = _scrape_key({name: value for name, value in scrape_params.items() if name not in ('maxAge', 'storeInCache')})
+        max_age = scrape_params.get('maxAge')
+        if max_age == 0:
+            return key, None
+        return key, self.scrape_cache.get(key, max_age / 1000 if max_age is not None else None)
+
+    def _scrape_cache_store(self, key: Optional[str], scrape_params: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """
+        Store a scrape result in the client's scrape cache, unless the scrape was sent with storeInCache
+        false or asked for zero data retention.
+        """
+        if key is not None and scrape_params.get('storeInCache') is not False and not scrape_params.get('zeroDataRetention'):
+            self.scrape_cache.set(key, data)
+
     def _prepare_headers(
             self,
             idempotency_key: Optional[str] = None) -> Dict[str, str]:
@@ -2148,13 +4445,224 @@ class FirecrawlApp:
             'Authorization': f'Bearer {self.api_key}',
         }
 
+    def _rate_limit(self, method: str, url: str):
+        """
+        Return a context manager that waits for the rate limiter, if any, before a request is sent.
+        """
+        if self.rate_limiter is None:
+            return contextlib.nullcontext()
+        return self.rate_limiter.acquire(method, url, self._rate_limit_key)
+
+    def _encode_request_body(
+            self,
+            data: Optional[Dict[str, Any]],
+            headers: Dict[str, str]) -> Tuple[Optional[bytes], Dict[str, str], int]:
+        """
+        Serialize a JSON request body, gzip-compressing it when it is large enough.
+
+        Args:
+            data (Optional[Dict[str, Any]]): The JSON data to send, or None for no body.
+            headers (Dict[str, str]): The headers for the request.
+
+        Returns:
+            Tuple[Optional[bytes], Dict[str, str], int]: The body to send, the headers to send
+            with it and the uncompressed body size.
+        """
+        if data is None:
+            return None, headers, 0
+
+        body = self.json_codec.dumps(data)
+        size = len(body)
+        headers = dict(headers)
+        headers.setdefault('Content-Type', 'application/json')
+        if self.compress_requests and size >= self.compression_threshold:
+            body = gzip.compress(body, compresslevel=6)
+            headers['Content-Encoding'] = 'gzip'
+        return body, headers, size
+
+    def _request(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            data: Optional[Dict[str, Any]] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        """
+        Send a single request on the pooled session and record its transfer stats.
+
+        Args:
+            method (str): The HTTP method to use.
+            url (str): The URL to send the request to.
+            headers (Dict[str, str]): The headers to include in the request.
+            data (Optional[Dict[str, Any]]): The JSON data to include in the request body.
+            timeout (Optional[float]): Timeout for the request.
+
+        Returns:
+            requests.Response: The response, or an httpx.Response when http2 is enabled.
+        """
+        body, headers, body_size = self._encode_request_body(data, headers)
+        kwargs: Dict[str, Any] = {'headers': headers, 'timeout': timeout}
+        if body is not None:
+            kwargs['content' if self.http2 else 'data'] = body
+
+        with self._rate_limit(method, url):
+            response = getattr(self.session, method.lower())(url, **kwargs)
+
+        content_size = len(response.content)
+        self.transfer_stats.record(
+            bytes_sent=len(body) if body is not None else 0,
+            bytes_sent_decoded=body_size,
+            bytes_received=_wire_size(response, content_size),
+            bytes_received_decoded=content_size
+        )
+        return response
+
+    def _parse_json(self, response: requests.Response) -> Any:
+        """
+        Decode a response body with the configured JSON codec.
+
+        Args:
+            response (requests.Response): The response to decode.
+
+        Returns:
+            Any: The decoded JSON document.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return self.json_codec.loads(response.content)
+
+    def _build_document(self, document: Dict[str, Any]) -> FirecrawlDocument:
+        """
+        Turn a raw document into the result type selected by the client's validate setting.
+
+        Args:
+            document (Dict[str, Any]): The document as returned by the API.
+
+        Returns:
+            FirecrawlDocument: The validated document, a DocumentView or the raw dict.
+        """
+        if self.validate == 'none':
+            return document
+        if self.validate == 'lazy':
+            return DocumentView(document)
+        return _validate_document(document)
+
+    def _build_status_response(self, model: type, fields: Dict[str, Any]) -> Any:
+        """
+        Create a crawl or batch scrape status response, validating its documents according to the validate setting.
+
+        The status fields are always validated; with validate='lazy' or 'none' the documents
+        bypass model validation and are attached as DocumentView objects or raw dicts.
+
+        Args:
+            model (type): CrawlStatusResponse or BatchScrapeStatusResponse.
+            fields (Dict[str, Any]): The response fields, including data.
+
+        Returns:
+            The status response.
+        """
+        if self.validate == 'full':
+            return model(**fields)
+        response = model(**{**fields, 'data': []})
+        response.data = [self._build_document(document) for document in fields.get('data') or []]
+        return response
+
+    def _poller(self, poll_strategy: Optional[PollingStrategy] = None, poll_interval: Optional[float] = 2) -> _Poller:
+        """
+        Create the polling state for one job.
+
+        Args:
+            poll_strategy (Optional[PollingStrategy]): The strategy passed to the call, if any.
+            poll_interval (Optional[float]): The call's initial interval, used when neither the call
+                nor the client specify a strategy.
+
+        Returns:
+            _Poller: The polling state.
+        """
+        strategy = poll_strategy or self.poll_strategy
+        if strategy is None:
+            # Status checks have always been at least 2s apart; a slower interval asked for is never shortened
+            interval = max(poll_interval or 2, 2)
+            strategy = PollingStrategy(interval=interval, max_interval=max(30.0, interval))
+        return _Poller(strategy)
+
+    def _retry_attempts(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None) -> _RetryAttempts:
+        """
+        Start tracking the retries of one call under the client's retry policy and circuit breaker.
+
+        Args:
+            method (str): The HTTP method of the call.
+            url (str): The URL of the call.
+            headers (Dict[str, str]): The headers of the call.
+            retries (Optional[int]): Attempts to make, overriding the policy's max_attempts.
+            backoff_factor (Optional[float]): Exponential backoff factor, overriding the policy's jittered backoff.
+
+        Returns:
+            _RetryAttempts: The retry state of the call.
+        """
+        return _RetryAttempts(self.retry_policy, self.circuit_breaker, method, url, headers, retries, backoff_factor)
+
+    def _send_with_retries(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            data: Optional[Dict[str, Any]] = None,
+            timeout: Optional[float] = None,
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None) -> requests.Response:
+        """
+        Send a request, retrying it according to the client's retry policy.
+
+        Args:
+            method (str): The HTTP method to use.
+            url (str): The URL to send the request to.
+            headers (Dict[str, str]): The headers to include in the request.
+            data (Optional[Dict[str, Any]]): The JSON data to include in the request body.
+            timeout (Optional[float]): Timeout for the request.
+            retries (Optional[int]): Attempts to make, overriding the policy's max_attempts.
+            backoff_factor (Optional[float]): Exponential backoff factor, overriding the policy's jittered backoff.
+
+        Returns:
+            requests.Response: The first response that is not retried, or the last one once retries run out.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker for the host is open.
+            requests.RequestException: If the request fails and is not retried.
+        """
+        attempts = self._retry_attempts(method, url, headers, retries, backoff_factor)
+        while True:
+            attempts.before_attempt()
+            try:
+                response = self._request(method, url, headers, data, timeout=timeout)
+            except attempts.errors as e:
+                delay = attempts.after_error(e)
+                if delay is None:
+                    raise
+                logger.debug(f"{method} {url} failed with {e!r}, retrying in {delay:.2f}s")
+            else:
+                delay = attempts.after_response(response.status_code, response.headers.get('Retry-After'))
+                if delay is None:
+                    return response
+                logger.debug(f"{method} {url} returned {response.status_code}, retrying in {delay:.2f}s")
+            finally:
+                attempts.end_attempt()
+            time.sleep(delay)
+
     def _post_request(
             self,
             url: str,
             data: Dict[str, Any],
             headers: Dict[str, str],
-            retries: int = 3,
-            backoff_factor: float = 0.5) -> requests.Response:
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None) -> requests.Response:
         """
         Make a POST request with retries.
 
@@ -2162,8 +4670,8 @@ class FirecrawlApp:
             url (str): The URL to send the POST request to.
             data (Dict[str, Any]): The JSON data to include in the POST request.
             headers (Dict[str, str]): The headers to include in the POST request.
-            retries (int): Number of retries for the request.
-            backoff_factor (float): Backoff factor for retries.
+            retries (Optional[int]): Attempts to make, overriding the retry policy.
+            backoff_factor (Optional[float]): Backoff factor, overriding the retry policy.
 
         Returns:
             requests.Response: The response from the POST request.
@@ -2171,28 +4679,23 @@ class FirecrawlApp:
         Raises:
             requests.RequestException: If the request fails after the specified retries.
         """
-        for attempt in range(retries):
-            response = requests.post(url, headers=headers, json=data, timeout=((data["timeout"] + 5000) if "timeout" in data else None))
-            if response.status_code == 502:
-                time.sleep(backoff_factor * (2 ** attempt))
-            else:
-                return response
-        return response
+        timeout = (data["timeout"] + 5000) if "timeout" in data else None
+        return self._send_with_retries('POST', url, headers, data, timeout, retries, backoff_factor)
 
     def _get_request(
             self,
             url: str,
             headers: Dict[str, str],
-            retries: int = 3,
-            backoff_factor: float = 0.5) -> requests.Response:
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None) -> requests.Response:
         """
         Make a GET request with retries.
 
         Args:
             url (str): The URL to send the GET request to.
             headers (Dict[str, str]): The headers to include in the GET request.
-            retries (int): Number of retries for the request.
-            backoff_factor (float): Backoff factor for retries.
+            retries (Optional[int]): Attempts to make, overriding the retry policy.
+            backoff_factor (Optional[float]): Backoff factor, overriding the retry policy.
 
         Returns:
             requests.Response: The response from the GET request.
@@ -2200,28 +4703,22 @@ class FirecrawlApp:
         Raises:
             requests.RequestException: If the request fails after the specified retries.
         """
-        for attempt in range(retries):
-            response = requests.get(url, headers=headers)
-            if response.status_code == 502:
-                time.sleep(backoff_factor * (2 ** attempt))
-            else:
-                return response
-        return response
+        return self._send_with_retries('GET', url, headers, retries=retries, backoff_factor=backoff_factor)
     
     def _delete_request(
             self,
             url: str,
             headers: Dict[str, str],
-            retries: int = 3,
-            backoff_factor: float = 0.5) -> requests.Response:
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None) -> requests.Response:
         """
         Make a DELETE request with retries.
 
         Args:
             url (str): The URL to send the DELETE request to.
             headers (Dict[str, str]): The headers to include in the DELETE request.
-            retries (int): Number of retries for the request.
-            backoff_factor (float): Backoff factor for retries.
+            retries (Optional[int]): Attempts to make, overriding the retry policy.
+            backoff_factor (Optional[float]): Backoff factor, overriding the retry policy.
 
         Returns:
             requests.Response: The response from the DELETE request.
@@ -2229,65 +4726,442 @@ class FirecrawlApp:
         Raises:
             requests.RequestException: If the request fails after the specified retries.
         """
-        for attempt in range(retries):
-            response = requests.delete(url, headers=headers)
-            if response.status_code == 502:
-                time.sleep(backoff_factor * (2 ** attempt))
-            else:
-                return response
-        return response
+        return self._send_with_retries('DELETE', url, headers, retries=retries, backoff_factor=backoff_factor)
 
     def _monitor_job_status(
             self,
             id: str,
             headers: Dict[str, str],
-            poll_interval: int) -> CrawlStatusResponse:
+            poll_interval: int,
+            poll_strategy: Optional[PollingStrategy] = None) -> CrawlStatusResponse:
+        """
+        Monitor the status of a crawl job until completion.
+
+        Documents are collected on every poll while the job runs, so once it completes
+        only the documents scraped since the last poll remain to be fetched.
+
+        Args:
+            id (str): The ID of the crawl job.
+            headers (Dict[str, str]): The headers to include in the status check requests.
+            poll_interval (int): Seconds before the second status check.
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's.
+
+        Returns:
+            CrawlStatusResponse: The crawl results if the job is completed successfully.
+
+        Raises:
+            Exception: If the job fails or an error occurs during status checks.
+        """
+        url = f'{self.api_url}/v1/crawl/{id}'
+        data: List[Dict[str, Any]] = []
+        poller = self._poller(poll_strategy, poll_interval)
+        while True:
+            hints: Dict[str, Any] = {}
+            status_data = self._get_status_page(url, headers, 'check crawl status', hints)
+            documents = status_data.get('data') or []
+            data.extend(documents)
+            # `next` points just past the documents received so far, so following it on the
+            # next poll only downloads documents scraped since, and the tail once completed
+            if status_data.get('next'):
+                url = status_data['next']
+            if status_data['status'] == 'completed':
+                if documents and status_data.get('next'):
+                    continue
+                if 'data' not in status_data and not data:
+                    raise Exception('Crawl job completed but no data was returned')
+                status_data['data'] = data
+                return self._build_status_response(CrawlStatusResponse, status_data)
+            elif status_data['status'] in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
+                poller.wait(status_data, hints.get('retry_after'))
+            else:
+                raise Exception(f'Crawl job failed or was stopped. Status: {status_data["status"]}')
+
+    def _get_status_page(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            action: str,
+            hints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Fetch and decode one page of a crawl or batch scrape status.
+
+        Args:
+            url (str): The status or next-page URL.
+            headers (Dict[str, str]): The headers to include in the request.
+            action (str): Description of the action, used in error messages.
+            hints (Optional[Dict[str, Any]]): If given, receives 'retry_after' when the response
+                asks the client to wait before polling again.
+
+        Returns:
+            Dict[str, Any]: The decoded status page.
+
+        Raises:
+            Exception: If the request fails or the response is not valid JSON.
+        """
+        response = self._get_request(url, headers)
+        if response.status_code != 200:
+            self._handle_error(response, action)
+        if hints is not None:
+            hints['retry_after'] = _parse_retry_after(response.headers.get('Retry-After'))
+        try:
+            return self._parse_json(response)
+        except:
+            raise Exception(f'Failed to parse Firecrawl response as JSON.')
+
+    def _iter_job_documents(
+            self,
+            url: str,
+            action: str,
+            poll_interval: int,
+            prefetch: int = 0,
+            parallel: int = 0,
+            stream: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Wait for a crawl or batch scrape job to complete, then yield its raw documents in order.
+
+        Args:
+            url (str): The job status URL.
+            action (str): Description of the action, used in error messages.
+            poll_interval (int): Seconds between status checks while the job is running.
+            prefetch (int): Number of pages to fetch ahead of the consumer on a background thread.
+            parallel (int): Number of pages to fetch at once using skip offsets.
+            stream (bool): Parse pages incrementally instead of decoding them whole.
+
+        Yields:
+            Dict[str, Any]: Each document, as returned by the API.
+
+        Raises:
+            ValueError: If stream is combined with prefetch or parallel.
+            Exception: If the job fails or is stopped, or a status request fails.
+        """
+        if stream:
+            if prefetch or parallel:
+                raise ValueError('stream cannot be combined with prefetch or parallel')
+            yield from self._iter_streamed_documents(url, action, poll_interval)
+            return
+        for page in self._iter_job_pages(url, action, poll_interval, prefetch, parallel):
+            yield from page.get('data', [])
+
+    @contextlib.contextmanager
+    def _stream_get(self, url: str, headers: Dict[str, str]):
+        """
+        Send a GET request on the pooled session without buffering the response body.
+
+        Yields the response together with a file-like reader over its decoded body,
+        and records the transfer stats once the body has been read. Opening the response
+        is retried according to the client's retry policy.
+
+        Args:
+            url (str): The URL to send the request to.
+            headers (Dict[str, str]): The headers to include in the request.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker for the host is open.
+            requests.RequestException: If the request fails and is not retried.
+        """
+        attempts = self._retry_attempts('GET', url, headers)
+        while True:
+            attempts.before_attempt()
+            try:
+                with contextlib.ExitStack() as stack:
+                    try:
+                        stack.enter_context(self._rate_limit('GET', url))
+                        if self.http2:
+                            response = stack.enter_context(self.session.stream('GET', url, headers=headers))
+                            reader = _ChunkReader(response.iter_bytes(_STREAM_CHUNK_SIZE))
+                        else:
+                            response = stack.enter_context(self.session.get(url, headers=headers, stream=True))
+                            reader = _ChunkReader(response.iter_content(_STREAM_CHUNK_SIZE))
+                    except attempts.errors as e:
+                        delay = attempts.after_error(e)
+                        if delay is None:
+                            raise
+                        logger.debug(f"GET {url} failed with {e!r}, retrying in {delay:.2f}s")
+                    else:
+                        delay = attempts.after_response(response.status_code, response.headers.get('Retry-After'))
+                        if delay is None:
+                            try:
+                                yield response, reader
+                            finally:
+                                self.transfer_stats.record(
+                                    bytes_sent=0,
+                                    bytes_sent_decoded=0,
+                                    bytes_received=_wire_size(response, reader.bytes_read),
+                                    bytes_received_decoded=reader.bytes_read
+                                )
+                            return
+                        logger.debug(f"GET {url} returned {response.status_code}, retrying in {delay:.2f}s")
+            finally:
+                attempts.end_attempt()
+            time.sleep(delay)
+
+    def _stream_status_page(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            action: str,
+            fields: Dict[str, Any],
+            hints: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch one status page and yield its documents as they are parsed from the response stream.
+
+        Args:
+            url (str): The status or next-page URL.
+            headers (Dict[str, str]): The headers to include in the request.
+            action (str): Description of the action, used in error messages.
+            fields (Dict[str, Any]): Filled with the page's top-level fields, such as status and next.
+            hints (Optional[Dict[str, Any]]): If given, receives 'retry_after' when the response
+                asks the client to wait before polling again.
+
+        Yields:
+            Dict[str, Any]: Each document on the page.
+
+        Raises:
+            Exception: If the request fails or the response is not valid JSON.
+        """
+        with self._stream_get(url, headers) as (response, reader):
+            if response.status_code != 200:
+                if self.http2:
+                    response.read()
+                self._handle_error(response, action)
+            if hints is not None:
+                hints['retry_after'] = _parse_retry_after(response.headers.get('Retry-After'))
+            parser = _StatusPageParser(fields)
+            try:
+                for prefix, event, value in ijson.parse(reader, use_float=True):
+                    document = parser.feed(prefix, event, value)
+                    if document is not parser.NO_DOCUMENT:
+                        yield document
+            except ijson.JSONError:
+                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+
+    def _iter_streamed_documents(self, url: str, action: str, poll_interval: int) -> Iterator[Dict[str, Any]]:
+        """
+        Wait for a job to complete, then yield its documents, parsing each page incrementally.
+
+        Args:
+            url (str): The job status URL.
+            action (str): Description of the action, used in error messages.
+            poll_interval (int): Seconds between status checks while the job is running.
+
+        Yields:
+            Dict[str, Any]: Each document, as returned by the API.
+
+        Raises:
+            Exception: If the job fails or is stopped, or a status request fails.
+        """
+        _require_ijson()
+        headers = self._prepare_headers()
+        poller = self._poller(poll_interval=poll_interval)
+        hints: Dict[str, Any] = {}
+        while True:
+            fields: Dict[str, Any] = {}
+            documents = self._stream_status_page(url, headers, action, fields, hints)
+            # The API sends status and next ahead of data, so they are known once the first document is parsed
+            first = list(itertools.islice(documents, 1))
+            if fields.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
+                documents.close()
+                poller.wait(fields, hints.get('retry_after'))
+                continue
+            if fields.get('status') != 'completed':
+                documents.close()
+                raise Exception(f'Job failed or was stopped. Status: {fields.get("status")}')
+            break
+
+        while True:
+            count = 0
+            for document in itertools.chain(first, documents):
+                count += 1
+                yield document
+            next_url = fields.get('next')
+            if not count or not next_url:
+                return
+            fields = {}
+            documents = self._stream_status_page(next_url, headers, action, fields)
+            first = []
+
+    def _iter_job_pages(self, url: str, action: str, poll_interval: int, prefetch: int = 0, parallel: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Wait for a crawl or batch scrape job to complete, then yield its result pages in order.
+
+        Args:
+            url (str): The job status URL.
+            action (str): Description of the action, used in error messages.
+            poll_interval (int): Seconds between status checks while the job is running.
+            prefetch (int): Number of pages to fetch ahead of the consumer on a background thread.
+            parallel (int): Number of pages to fetch at once using skip offsets.
+
+        Yields:
+            Dict[str, Any]: Each status page, as returned by the API.
+
+        Raises:
+            Exception: If the job fails or is stopped, or a status request fails.
+        """
+        headers = self._prepare_headers()
+        poller = self._poller(poll_interval=poll_interval)
+        hints: Dict[str, Any] = {}
+        page = self._get_status_page(url, headers, action, hints)
+        while page.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
+            poller.wait(page, hints.get('retry_after'))
+            page = self._get_status_page(url, headers, action, hints)
+        if page.get('status') != 'completed':
+            raise Exception(f'Job failed or was stopped. Status: {page.get("status")}')
+
+        def pages() -> Iterator[Dict[str, Any]]:
+            # The first page goes through the read-ahead too, so page 2 is fetched while page 1 is processed
+            yield page
+            yield from self._next_pages(page, headers, action, parallel)
+
+        yield from self._read_ahead(pages(), prefetch)
+
+    def _follow_next_pages(self, page: Dict[str, Any], headers: Dict[str, str], action: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the status pages that follow page, walking its `next` links until the results are exhausted.
+
+        Args:
+            page (Dict[str, Any]): The status page to start from; it is not yielded itself.
+            headers (Dict[str, str]): The headers to include in the requests.
+            action (str): Description of the action, used in error messages.
+
+        Yields:
+            Dict[str, Any]: Each following status page.
+
+        Raises:
+            Exception: If a page request fails.
+        """
+        while page.get('next') and page.get('data'):
+            page = self._get_status_page(page['next'], headers, action)
+            yield page
+
+    def _next_pages(self, page: Dict[str, Any], headers: Dict[str, str], action: str, parallel: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the status pages that follow page, fetching them concurrently when parallel is above 1.
+
+        Args:
+            page (Dict[str, Any]): The status page to start from; it is not included.
+            headers (Dict[str, str]): The headers to include in the requests.
+            action (str): Description of the action, used in error messages.
+            parallel (int): Maximum number of pages to fetch at once.
+
+        Returns:
+            Iterator[Dict[str, Any]]: The following status pages, in order.
+        """
+        if parallel > 1:
+            return self._fetch_pages_in_parallel(page, headers, action, parallel)
+        return self._follow_next_pages(page, headers, action)
+
+    def _fetch_pages_in_parallel(
+            self,
+            page: Dict[str, Any],
+            headers: Dict[str, str],
+            action: str,
+            workers: int) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch the pages of a completed job concurrently by computing their skip offsets.
+
+        Once a job is complete its document count is known, so the page at each multiple of
+        the first page's size can be requested directly. Pages are yielded in order. If a
+        page comes back with fewer documents than requested (the API also caps pages by
+        size), the remaining pages are fetched sequentially by following `next` links.
+
+        Args:
+            page (Dict[str, Any]): The first status page; it is not yielded itself.
+            headers (Dict[str, str]): The headers to include in the requests.
+            action (str): Description of the action, used in error messages.
+            workers (int): Maximum number of pages to fetch at once.
+
+        Yields:
+            Dict[str, Any]: Each following status page, in order.
+        """
+        page_size = len(page.get('data') or [])
+        total = page.get('completed')
+        if page.get('status') != 'completed' or not page.get('next') or not page_size or not isinstance(total, int):
+            yield from self._follow_next_pages(page, headers, action)
+            return
+
+        offsets = iter(range(page_size, total, page_size))
+        pending: collections.deque = collections.deque()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='firecrawl-page') as pool:
+            def submit() -> None:
+                offset = next(offsets, None)
+                if offset is not None:
+                    url = _page_url(page['next'], offset, page_size)
+                    pending.append((offset, pool.submit(self._get_status_page, url, headers, action)))
+
+            for _ in range(workers):
+                submit()
+            try:
+                while pending:
+                    offset, future = pending.popleft()
+                    page = future.result()
+                    submit()
+                    yield page
+                    if len(page.get('data') or []) < min(page_size, total - offset):
+                        logger.debug(f"Page at offset {offset} came back short, following next links instead")
+                        break
+                else:
+                    return
+            finally:
+                for _, future in pending:
+                    future.cancel()
+        yield from self._follow_next_pages(page, headers, action)
+
+    def _read_ahead(self, pages: Iterator[Dict[str, Any]], depth: int) -> Iterator[Dict[str, Any]]:
         """
-        Monitor the status of a crawl job until completion.
+        Consume a page iterator on a background thread, keeping up to depth pages ready.
 
-        Args:
-            id (str): The ID of the crawl job.
-            headers (Dict[str, str]): The headers to include in the status check requests.
-            poll_interval (int): Seconds between status checks.
+        While the caller processes one page the following ones are already being fetched.
+        Errors raised while fetching are re-raised to the caller in order. Once the caller
+        stops, the background thread closes the page generator.
 
-        Returns:
-            CrawlStatusResponse: The crawl results if the job is completed successfully.
+        Args:
+            pages (Iterator[Dict[str, Any]]): The page generator to fetch from.
+            depth (int): Number of pages to buffer ahead of the caller; 0 disables read-ahead.
 
-        Raises:
-            Exception: If the job fails or an error occurs during status checks.
+        Yields:
+            Dict[str, Any]: The pages, in their original order.
         """
-        while True:
-            api_url = f'{self.api_url}/v1/crawl/{id}'
+        if depth <= 0:
+            yield from pages
+            return
 
-            status_response = self._get_request(api_url, headers)
-            if status_response.status_code == 200:
+        buffer: queue.Queue = queue.Queue(maxsize=depth)
+        stopped = threading.Event()
+        done = object()
+
+        def put(item: Any) -> bool:
+            while not stopped.is_set():
                 try:
-                    status_data = status_response.json()
-                except:
-                    raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                if status_data['status'] == 'completed':
-                    if 'data' in status_data:
-                        data = status_data['data']
-                        while 'next' in status_data:
-                            if len(status_data['data']) == 0:
-                                break
-                            status_response = self._get_request(status_data['next'], headers)
-                            try:
-                                status_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                            data.extend(status_data.get('data', []))
-                        status_data['data'] = data
-                        return CrawlStatusResponse(**status_data)
-                    else:
-                        raise Exception('Crawl job completed but no data was returned')
-                elif status_data['status'] in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                    poll_interval=max(poll_interval,2)
-                    time.sleep(poll_interval)  # Wait for the specified interval before checking again
-                else:
-                    raise Exception(f'Crawl job failed or was stopped. Status: {status_data["status"]}')
-            else:
-                self._handle_error(status_response, 'check crawl status')
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for page in pages:
+                    if not put((page, None)):
+                        return
+                put((done, None))
+            except BaseException as e:
+                put((done, e))
+            finally:
+                # Release open responses and in-flight requests of a consumer that stopped early
+                pages.close()
+
+        thread = threading.Thread(target=produce, name='firecrawl-read-ahead', daemon=True)
+        thread.start()
+        try:
+            while True:
+                page, error = buffer.get()
+                if page is done:
+                    if error is not None:
+                        raise error
+                    return
+                yield page
+        finally:
+            stopped.set()
 
     def _handle_error(
             self,
@@ -2304,8 +5178,8 @@ class FirecrawlApp:
             Exception: An exception with a message containing the status code and error details from the response.
         """
         try:
-            error_message = response.json().get('error', 'No error message provided.')
-            error_details = response.json().get('details', 'No additional error details provided.')
+            error_message = self._parse_json(response).get('error', 'No error message provided.')
+            error_details = self._parse_json(response).get('details', 'No additional error details provided.')
         except:
             raise requests.exceptions.HTTPError(f'Failed to parse Firecrawl error response as JSON. Status code: {response.status_code}', response=response)
         
@@ -2351,7 +5225,8 @@ class FirecrawlApp:
             system_prompt: Optional[str] = None,
             __experimental_stream_steps: Optional[bool] = None,
             on_activity: Optional[Callable[[Dict[str, Any]], None]] = None,
-            on_source: Optional[Callable[[Dict[str, Any]], None]] = None) -> DeepResearchStatusResponse:
+            on_source: Optional[Callable[[Dict[str, Any]], None]] = None,
+            poll_strategy: Optional[PollingStrategy] = None) -> DeepResearchStatusResponse:
         """
         Initiates a deep research operation on a given query and polls until completion.
 
@@ -2365,6 +5240,7 @@ class FirecrawlApp:
             __experimental_stream_steps (Optional[bool]): Enable experimental streaming
             on_activity (Optional[Callable]): Progress callback receiving {type, status, message, timestamp, depth}
             on_source (Optional[Callable]): Source discovery callback receiving {url, title, description}
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
 
         Returns:
             DeepResearchStatusResponse containing:
@@ -2409,6 +5285,7 @@ class FirecrawlApp:
         job_id = response['id']
         last_activity_count = 0
         last_source_count = 0
+        poller = self._poller(poll_strategy)
 
         while True:
             status = self.check_deep_research_status(job_id)
@@ -2432,7 +5309,7 @@ class FirecrawlApp:
             elif status['status'] != 'processing':
                 break
 
-            time.sleep(2)  # Polling interval
+            poller.wait(status)
 
         return {'success': False, 'error': 'Deep research job terminated unexpectedly'}
 
@@ -2490,14 +5367,14 @@ class FirecrawlApp:
         # Handle json options schema if present
         if 'jsonOptions' in json_data:
             json_opts = json_data['jsonOptions']
-            if json_opts and 'schema' in json_opts and hasattr(json_opts['schema'], 'schema'):
-                json_data['jsonOptions']['schema'] = json_opts['schema'].schema()
+            if json_opts and 'schema' in json_opts:
+                json_data['jsonOptions']['schema'] = self._ensure_schema_dict(json_opts['schema'])
 
         try:
             response = self._post_request(f'{self.api_url}/v1/deep-research', json_data, headers)
             if response.status_code == 200:
                 try:
-                    return response.json()
+                    return self._parse_json(response)
                 except:
                     raise Exception('Failed to parse Firecrawl response as JSON.')
             else:
@@ -2537,7 +5414,7 @@ class FirecrawlApp:
             response = self._get_request(f'{self.api_url}/v1/deep-research/{id}', headers)
             if response.status_code == 200:
                 try:
-                    return response.json()
+                    return self._parse_json(response)
                 except:
                     raise Exception('Failed to parse Firecrawl response as JSON.')
             elif response.status_code == 404:
@@ -2603,19 +5480,7 @@ class FirecrawlApp:
         """
         Utility to ensure a schema is a dict, not a Pydantic model class. Recursively checks dicts and lists.
         """
-        if schema is None:
-            return schema
-        if isinstance(schema, type):
-            # Pydantic v1/v2 model class
-            if hasattr(schema, 'model_json_schema'):
-                return schema.model_json_schema()
-            elif hasattr(schema, 'schema'):
-                return schema.schema()
-        if isinstance(schema, dict):
-            return {k: self._ensure_schema_dict(v) for k, v in schema.items()}
-        if isinstance(schema, (list, tuple)):
-            return [self._ensure_schema_dict(v) for v in schema]
-        return schema
+        return _ensure_schema_dict(schema)
 
 class CrawlWatcher:
     """
@@ -2660,7 +5525,7 @@ class CrawlWatcher:
             websocket: The WebSocket connection object
         """
         async for message in websocket:
-            msg = json.loads(message)
+            msg = self.app.json_codec.loads(message)
             await self._handle_message(msg)
 
     def add_event_listener(self, event_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
@@ -2708,11 +5573,608 @@ class CrawlWatcher:
             self.data.append(msg['data'])
             self.dispatch_event('document', {'data': msg['data'], 'id': self.id})
 
+class JobMonitor:
+    """
+    Polls the status of any number of crawl, batch scrape, extract, deep research and
+    LLMs.txt jobs from a single background thread.
+
+    Each watched job gets a concurrent.futures.Future that resolves to the same result the
+    blocking method would return, e.g. a CrawlStatusResponse for a crawl. Status checks are
+    handed to a small pool of workers as they fall due, and each job is rescheduled according
+    to its PollingStrategy once its own check returns, so a slow check or result download
+    never holds up the other jobs.
+    """
+    def __init__(self, app: FirecrawlApp, *, max_concurrency: int = 8) -> None:
+        """
+        Args:
+            app (FirecrawlApp): The client used for status checks.
+            max_concurrency (int): Maximum number of status checks in flight at once (default: 8)
+        """
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self._schedule: List[Tuple[float, int, _MonitoredJob]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._checks: Dict[concurrent.futures.Future, _MonitoredJob] = {}
+        self._closed = False
+
+    def __enter__(self) -> 'JobMonitor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def watch(
+            self,
+            kind: Literal['crawl', 'batch_scrape', 'extract', 'deep_research', 'llmstxt'],
+            id: str,
+            *,
+            callback: Optional[Callable[[concurrent.futures.Future], None]] = None,
+            poll_strategy: Optional[PollingStrategy] = None) -> concurrent.futures.Future:
+        """
+        Start tracking a job.
+
+        Args:
+            kind (str): The kind of job: 'crawl', 'batch_scrape', 'extract', 'deep_research' or 'llmstxt'
+            id (str): The job ID
+            callback (Optional[Callable[[Future], None]]): Called with the future once the job finishes
+            poll_strategy (Optional[PollingStrategy]): Schedule for this job's status checks. Defaults to the client's
+
+        Returns:
+            concurrent.futures.Future: Resolves to the job's result, or raises if the job fails.
+            Cancelling it stops tracking the job but does not cancel the job itself.
+
+        Raises:
+            ValueError: If the job kind is unknown
+            Exception: If the monitor has been closed
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        self._track(_MonitoredJob(kind, id, future, self.app._poller(poll_strategy)))
+        return future
+
+    def _track(self, job: _MonitoredJob) -> None:
+        """
+        Schedule a job for its first status check, starting the background thread if needed.
+        """
+        with self._condition:
+            if self._closed:
+                raise Exception('JobMonitor is closed')
+            self._schedule_job(job, 0)
+            if self._thread is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix='firecrawl-job-monitor'
+                )
+                self._thread = threading.Thread(target=self._run, name='firecrawl-job-monitor', daemon=True)
+                self._thread.start()
+
+    def pending(self) -> int:
+        """
+        Return the number of jobs still being tracked.
+        """
+        with self._condition:
+            return len(self._schedule) + sum(1 for job in self._checks.values() if not job.future.done())
+
+    def close(self) -> None:
+        """
+        Stop the background thread and cancel the futures of jobs that have not finished.
+        """
+        with self._condition:
+            self._closed = True
+            schedule, self._schedule = self._schedule, []
+            checks = dict(self._checks)
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        # Checks still queued are dropped, and those running have their results ignored
+        for check in checks:
+            check.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        for job in itertools.chain((job for _, _, job in schedule), checks.values()):
+            _cancel_future(job.future)
+
+    def _schedule_job(self, job: _MonitoredJob, delay: float) -> None:
+        heapq.heappush(self._schedule, (time.monotonic() + delay, next(self._counter), job))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        with self._condition:
+            while True:
+                while not self._closed:
+                    timeout = self._schedule[0][0] - time.monotonic() if self._schedule else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                now = time.monotonic()
+                while self._schedule and self._schedule[0][0] <= now:
+                    job = heapq.heappop(self._schedule)[2]
+                    if job.future.cancelled():
+                        _cancel_future(job.future)
+                        continue
+                    check = self._executor.submit(self._check, job)
+                    self._checks[check] = job
+                    check.add_done_callback(self._checked)
+
+    def _checked(self, check: concurrent.futures.Future) -> None:
+        """
+        Reschedule the job of a finished status check, unless the job has finished or the monitor was closed.
+        """
+        with self._condition:
+            job = self._checks.pop(check)
+            if not check.cancelled() and not self._closed:
+                error = check.exception()
+                if error is not None:
+                    _settle_future(job.future, exception=error)
+                    return
+                delay = check.result()
+                if delay is not None:
+                    self._schedule_job(job, delay)
+                    return
+        # The job has finished, or the monitor was closed before it did
+        _cancel_future(job.future)
+
+    def _check(self, job: _MonitoredJob) -> Optional[float]:
+        """
+        Check a job's status once and settle its future if the job has finished.
+
+        Returns:
+            Optional[float]: Seconds until the next check, or None if the job has finished.
+        """
+        try:
+            hints: Dict[str, Any] = {}
+            status = self.app._get_status_page(
+                f'{self.app.api_url}{job.url_path}', self.app._prepare_headers(), job.action, hints)
+            job.status = status
+            error = job.failure(status)
+            if error is not None:
+                _settle_future(job.future, exception=error)
+            elif status.get('status') == 'completed':
+                if job.kind == 'crawl':
+                    result = self.app.check_crawl_status(job.id)
+                elif job.kind == 'batch_scrape':
+                    result = self.app.check_batch_scrape_status(job.id)
+                else:
+                    result = job.finished_result(status)
+                _settle_future(job.future, result=result)
+            else:
+                return job.poller.next_delay(status, hints.get('retry_after'))
+        except Exception as e:
+            _settle_future(job.future, exception=e)
+        return None
+
+class _JobProgress:
+    """
+    Progress attributes of a job handle, read from the latest status check of its job.
+    """
+    _job: _MonitoredJob
+
+    @property
+    def status(self) -> Optional[str]:
+        """The job's status as of the latest check, or None before the first check."""
+        return (self._job.status or {}).get('status')
+
+    @property
+    def completed(self) -> Optional[int]:
+        """Number of pages scraped so far."""
+        return (self._job.status or {}).get('completed')
+
+    @property
+    def total(self) -> Optional[int]:
+        """Number of pages the job is expected to scrape."""
+        return (self._job.status or {}).get('total')
+
+    @property
+    def credits_used(self) -> Optional[int]:
+        """API credits consumed so far."""
+        return (self._job.status or {}).get('creditsUsed')
+
+def _cancel_failed_message(handle: Union['JobHandle', 'AsyncJobHandle'], error: Exception) -> str:
+    return (f'Stopped tracking {handle.kind} job {handle.id}, but cancelling it on the server failed '
+            f'and it may still be running: {error}')
+
+class JobHandle(_JobProgress, concurrent.futures.Future):
+    """
+    A running crawl or batch scrape job, returned by async_crawl_url and async_batch_scrape_urls
+    when called with return_handle=True.
+
+    The handle is a concurrent.futures.Future resolved by the client's job monitor, so it works
+    with concurrent.futures.wait and as_completed. Cancelling it cancels the job.
+    """
+    def __init__(
+            self,
+            app: FirecrawlApp,
+            kind: Literal['crawl', 'batch_scrape'],
+            response: Union[CrawlResponse, BatchScrapeResponse]) -> None:
+        """
+        Args:
+            app (FirecrawlApp): The client that started the job
+            kind (str): 'crawl' or 'batch_scrape'
+            response (Union[CrawlResponse, BatchScrapeResponse]): The response that started the job
+        """
+        super().__init__()
+        self.app = app
+        self.kind = kind
+        self.id = response.id
+        self.response = response
+        self.cancel_error: Optional[Exception] = None
+        self._job = _MonitoredJob(kind, response.id, self, app._poller())
+        app.job_monitor._track(self._job)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.kind} {self.id} status={self.status!r}>'
+
+    def cancel(self) -> bool:
+        """
+        Stop tracking the job and cancel it on the server.
+
+        The handle is cancelled before the cancellation request is sent. If that request fails,
+        the handle stays cancelled while the job may keep running on the server untracked: the
+        error is raised and kept in cancel_error, and the job can be checked or cancelled again by its id.
+        Cancelling a handle that is already cancelled does nothing.
+
+        Returns:
+            bool: False if the job had already finished, True otherwise.
+
+        Raises:
+            Exception: If the cancellation request fails
+        """
+        # Cancel locally first so the monitor cannot report the server-side cancellation as a failure
+        with self._condition:
+            if self.cancelled():
+                return True
+            if not super().cancel():
+                return False
+            # Nobody runs this future, so acknowledge the cancellation as an executor would;
+            # until then concurrent.futures.wait and as_completed do not see it as done
+            self.set_running_or_notify_cancel()
+        try:
+            if self.kind == 'crawl':
+                self.app.cancel_crawl(self.id)
+            else:
+                self.app.cancel_batch_scrape(self.id)
+        except Exception as e:
+            self.cancel_error = e
+            raise Exception(_cancel_failed_message(self, e)) from e
+        return True
+
+class BatchScrapeGroup:
+    """
+    The batch scrape jobs started for one URL list split into chunks, read as a single job.
+
+    Returned by async_batch_scrape_urls_chunked. Documents are streamed from every job while
+    they are scraped, and the progress of all jobs is summed into one counter.
+    """
+    def __init__(
+            self,
+            app: FirecrawlApp,
+            ids: List[str],
+            failed_chunks: Optional[List[Tuple[List[str], Exception]]] = None,
+            *,
+            max_workers: int = 4,
+            poll_strategy: Optional[PollingStrategy] = None) -> None:
+        """
+        Args:
+            app (FirecrawlApp): The client that started the jobs
+            ids (List[str]): The batch scrape job IDs, in the order of their chunks
+            failed_chunks (Optional[List[Tuple[List[str], Exception]]]): URL chunks whose job could not
+                be started, with the error raised
+            max_workers (int): Maximum status requests in flight at once
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
+        """
+        self.app = app
+        self.ids = ids
+        self.failed_chunks = failed_chunks or []
+        self.max_workers = max_workers
+        self.poll_strategy = poll_strategy
+        self._statuses: Dict[str, Dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} jobs={len(self.ids)} status={self.status!r} completed={self.completed}/{self.total}>'
+
+    @property
+    def status(self) -> str:
+        """'completed' once every job has completed, 'failed' if any job failed or was cancelled, else 'scraping'."""
+        statuses = [self._statuses.get(id, {}).get('status') for id in self.ids]
+        if any(status in ['failed', 'cancelled'] for status in statuses):
+            return 'failed'
+        if all(status == 'completed' for status in statuses):
+            return 'completed'
+        return 'scraping'
+
+    @property
+    def completed(self) -> int:
+        """Number of pages scraped so far by all jobs."""
+        return sum(self._statuses.get(id, {}).get('completed') or 0 for id in self.ids)
+
+    @property
+    def total(self) -> int:
+        """Number of pages all jobs are expected to scrape, as far as known."""
+        return sum(self._statuses.get(id, {}).get('total') or 0 for id in self.ids)
+
+    @property
+    def credits_used(self) -> int:
+        """API credits consumed so far by all jobs."""
+        return sum(self._statuses.get(id, {}).get('creditsUsed') or 0 for id in self.ids)
+
+    def _status_url(self, id: str) -> str:
+        return f'{self.app.api_url}/v1/batch/scrape/{id}'
+
+    def _unfinished(self) -> List[str]:
+        return [id for id in self.ids if self._statuses.get(id, {}).get('status') not in ['completed', 'failed', 'cancelled']]
+
+    def _advance(self, id: str, page: Dict[str, Any], cursors: Dict[str, str]) -> bool:
+        """
+        Record a status page of a job and move its cursor past the documents received.
+
+        Returns:
+            bool: Whether the job has completed but has result pages left to fetch.
+
+        Raises:
+            Exception: If the job failed or was stopped
+        """
+        self._statuses[id] = {key: value for key, value in page.items() if key != 'data'}
+        status = page.get('status')
+        if status == 'completed':
+            if page.get('data') and page.get('next'):
+                cursors[id] = page['next']
+                return True
+            del cursors[id]
+        elif status in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
+            if page.get('next'):
+                cursors[id] = page['next']
+        else:
+            raise Exception(f'Batch scrape job {id} failed or was stopped. Status: {status}')
+        return False
+
+    def refresh(self) -> 'BatchScrapeGroup':
+        """
+        Check the status of every unfinished job once, updating the progress counters.
+
+        Returns:
+            BatchScrapeGroup: This group
+
+        Raises:
+            Exception: If a status request fails
+        """
+        headers = self.app._prepare_headers()
+        ids = self._unfinished()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='firecrawl-status') as pool:
+            pages = pool.map(lambda id: self.app._get_status_page(f'{self._status_url(id)}?limit=1', headers, 'check batch scrape status'), ids)
+            for id, page in zip(ids, pages):
+                self._statuses[id] = {key: value for key, value in page.items() if key != 'data'}
+        return self
+
+    def iter_documents(self, poll_interval: int = 2) -> Iterator[FirecrawlDocument]:
+        """
+        Iterate over the documents of all jobs as they are scraped.
+
+        Every unfinished job is polled each round, following its `next` link so that only
+        documents scraped since the previous round are downloaded. Documents of different
+        jobs are interleaved; within a job they keep their result order.
+
+        Args:
+            poll_interval (int): Seconds before the second round of status checks (default: 2)
+
+        Yields:
+            FirecrawlDocument: Each scraped document
+
+        Raises:
+            Exception: If a job fails or is cancelled, or a status request fails
+        """
+        headers = self.app._prepare_headers()
+        cursors = {id: self._status_url(id) for id in self.ids}
+        poller = self.app._poller(self.poll_strategy, poll_interval)
+
+        def fetch(id: str) -> Tuple[Dict[str, Any], Optional[float]]:
+            hints: Dict[str, Any] = {}
+            return self.app._get_status_page(cursors[id], headers, 'check batch scrape status', hints), hints.get('retry_after')
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='firecrawl-status') as pool:
+            while cursors:
+                ids = list(cursors)
+                draining = False
+                retry_after = None
+                for id, (page, hint) in zip(ids, pool.map(fetch, ids)):
+                    draining = self._advance(id, page, cursors) or draining
+                    if hint is not None:
+                        retry_after = max(retry_after or 0, hint)
+                    for document in page.get('data') or []:
+                        yield self.app._build_document(document)
+                if cursors and not draining:
+                    poller.wait({'status': self.status, 'completed': self.completed, 'total': self.total}, retry_after)
+
+    def cancel(self) -> None:
+        """
+        Cancel every job of the group that has not finished.
+
+        Raises:
+            Exception: If a cancellation request fails
+        """
+        for id in self._unfinished():
+            self.app.cancel_batch_scrape(id)
+            self._statuses.setdefault(id, {})['status'] = 'cancelled'
+
 class AsyncFirecrawlApp(FirecrawlApp):
     """
     Asynchronous version of FirecrawlApp that implements async methods using aiohttp.
     Provides non-blocking alternatives to all FirecrawlApp operations.
     """
+    def __init__(
+            self,
+            api_key: Optional[str] = None,
+            api_url: Optional[str] = None,
+            *,
+            connection_limit: int = 100,
+            connection_limit_per_host: int = 0,
+            ttl_dns_cache: Optional[int] = 300,
+            keepalive_timeout: float = 15.0,
+            **kwargs) -> None:
+        """
+        Initialize the AsyncFirecrawlApp instance with API key, API URL and connector settings.
+
+        Args:
+            api_key (Optional[str]): API key for authenticating with the Firecrawl API.
+            api_url (Optional[str]): Base URL for the Firecrawl API.
+            connection_limit (int): Maximum simultaneous connections, 0 for unlimited (default: 100)
+            connection_limit_per_host (int): Maximum simultaneous connections per host, 0 for unlimited (default: 0)
+            ttl_dns_cache (Optional[int]): Seconds to cache DNS lookups, None to cache forever (default: 300)
+            keepalive_timeout (float): Seconds to keep idle connections open (default: 15)
+            **kwargs: Connection pool and http2 settings shared with FirecrawlApp
+        """
+        super().__init__(api_key, api_url, **kwargs)
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> 'AsyncFirecrawlApp':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    def _create_job_monitor(self) -> 'AsyncJobMonitor':
+        return AsyncJobMonitor(self)
+
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared aiohttp session, creating it on first use.
+
+        aiohttp sessions are bound to the event loop they were created on, so a new
+        session is created if the previous one was closed or belongs to another loop.
+        A session left behind on another loop is closed first.
+
+        Returns:
+            aiohttp.ClientSession: The session shared by every async request, or an
+            httpx.AsyncClient when http2 is enabled.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._async_session
+        if session is None or _is_session_closed(session) or self._async_session_loop is not loop:
+            if session is not None and not _is_session_closed(session):
+                logger.debug("Closing async session bound to a different event loop")
+                await self._close_async_session(session, self._async_session_loop)
+            if self.http2:
+                session = httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=self.connection_limit or None,
+                        keepalive_expiry=self.keepalive_timeout
+                    ),
+                    timeout=None
+                )
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=self.connection_limit,
+                    limit_per_host=self.connection_limit_per_host,
+                    ttl_dns_cache=self.ttl_dns_cache,
+                    keepalive_timeout=self.keepalive_timeout
+                )
+                session = aiohttp.ClientSession(connector=connector)
+            self._async_session = session
+            self._async_session_loop = loop
+        return session
+
+    async def _close_async_session(self, session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Close an async session, which may belong to an event loop other than the running one.
+
+        Args:
+            session (aiohttp.ClientSession): The session, or an httpx.AsyncClient when http2 is enabled.
+            loop (Optional[asyncio.AbstractEventLoop]): The event loop the session was created on.
+        """
+        close = session.aclose if self.http2 else session.close
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            # The loop runs in another thread, so the session is closed there
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(close(), loop))
+            return
+        try:
+            await close()
+        except Exception as e:
+            # Connections of a closed loop are released without it; an idle loop finishes closing them when it next runs
+            logger.debug(f"Closing async session of another event loop did not complete: {e!r}")
+
+    @contextlib.asynccontextmanager
+    async def _async_rate_limit(self, method: str, url: str):
+        """
+        Wait for the rate limiter, if any, before a request is sent, without blocking the event loop.
+        """
+        if self.rate_limiter is None:
+            yield
+            return
+        async with self.rate_limiter.async_acquire(method, url, self._rate_limit_key):
+            yield
+
+    @contextlib.asynccontextmanager
+    async def _async_send(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            data: Optional[Dict[str, Any]] = None):
+        """
+        Send a single request on the shared async session.
+
+        Yields an aiohttp.ClientResponse, or an adapter exposing the same interface
+        when the httpx transport is in use, so callers handle both transports alike.
+        The body is read before the response is yielded so its transfer stats can be recorded.
+
+        Args:
+            method (str): The HTTP method to use.
+            url (str): The URL to send the request to.
+            headers (Dict[str, str]): Headers to include in the request.
+            data (Optional[Dict[str, Any]]): The JSON data to include in the request body.
+        """
+        session = await self._get_async_session()
+        body, headers, body_size = self._encode_request_body(data, headers)
+        bytes_sent = len(body) if body is not None else 0
+        if self.http2:
+            async with self._async_rate_limit(method, url):
+                response = await session.request(method, url, headers=headers, content=body)
+            self.transfer_stats.record(
+                bytes_sent=bytes_sent,
+                bytes_sent_decoded=body_size,
+                bytes_received=response.num_bytes_downloaded,
+                bytes_received_decoded=len(response.content)
+            )
+            yield _AsyncHTTPXResponse(response)
+        else:
+            async with self._async_rate_limit(method, url), \
+                    session.request(method=method, url=url, headers=headers, data=body) as response:
+                content = await response.read()
+                self.transfer_stats.record(
+                    bytes_sent=bytes_sent,
+                    bytes_sent_decoded=body_size,
+                    bytes_received=getattr(response.content, 'total_raw_bytes', len(content)),
+                    bytes_received_decoded=len(content)
+                )
+                yield response
+
+    async def aclose(self) -> None:
+        """
+        Close the shared aiohttp session and the synchronous session, releasing their connections.
+
+        Jobs still tracked by the job monitor are no longer polled and their futures are cancelled.
+        The client stays usable; new sessions are created on the next request.
+        """
+        with self._session_lock:
+            monitor, self._job_monitor = self._job_monitor, None
+        if monitor is not None:
+            await monitor.aclose()
+        session, self._async_session = self._async_session, None
+        loop, self._async_session_loop = self._async_session_loop, None
+        if session is not None and not _is_session_closed(session):
+            await self._close_async_session(session, loop)
+        self.close()
 
     async def _async_request(
             self,
@@ -2720,48 +6182,60 @@ class AsyncFirecrawlApp(FirecrawlApp):
             url: str,
             headers: Dict[str, str],
             data: Optional[Dict[str, Any]] = None,
-            retries: int = 3,
-            backoff_factor: float = 0.5) -> Dict[str, Any]:
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None,
+            hints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Generic async request method with exponential backoff retry logic.
+        Generic async request method, retrying according to the client's retry policy.
 
         Args:
             method (str): The HTTP method to use (e.g., "GET" or "POST").
             url (str): The URL to send the request to.
             headers (Dict[str, str]): Headers to include in the request.
             data (Optional[Dict[str, Any]]): The JSON data to include in the request body (only for POST requests).
-            retries (int): Maximum number of retry attempts (default: 3).
-            backoff_factor (float): Factor to calculate delay between retries (default: 0.5).
+            retries (Optional[int]): Attempts to make, overriding the retry policy.
+            backoff_factor (Optional[float]): Backoff factor, overriding the retry policy.
                 Delay will be backoff_factor * (2 ** retry_count).
+            hints (Optional[Dict[str, Any]]): If given, receives 'retry_after' when the response
+                asks the client to wait before polling again.
 
         Returns:
             Dict[str, Any]: The parsed JSON response from the server.
 
         Raises:
-            aiohttp.ClientError: If the request fails after all retries.
-            Exception: If max retries are exceeded or other errors occur.
+            CircuitOpenError: If the circuit breaker for the host is open.
+            aiohttp.ClientError: If the request fails and is not retried.
+            Exception: If the API returns an error response.
         """
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(retries):
-                try:
-                    async with session.request(
-                        method=method, url=url, headers=headers, json=data
-                    ) as response:
-                        if response.status == 502:
-                            await asyncio.sleep(backoff_factor * (2 ** attempt))
-                            continue
-                        if response.status >= 300:
-                            await self._handle_error(response, f"make {method} request")
-                        return await response.json()
-                except aiohttp.ClientError as e:
-                    if attempt == retries - 1:
-                        raise e
-                    await asyncio.sleep(backoff_factor * (2 ** attempt))
-            raise Exception("Max retries exceeded")
+        attempts = self._retry_attempts(method, url, headers, retries, backoff_factor)
+        while True:
+            attempts.before_attempt()
+            try:
+                async with contextlib.AsyncExitStack() as stack:
+                    try:
+                        response = await stack.enter_async_context(self._async_send(method, url, headers, data))
+                    except attempts.errors as e:
+                        delay = attempts.after_error(e)
+                        if delay is None:
+                            raise
+                        logger.debug(f"{method} {url} failed with {e!r}, retrying in {delay:.2f}s")
+                    else:
+                        # Outside the except clause, so an API error raised here is never retried as a transport error
+                        delay = attempts.after_response(response.status, response.headers.get('Retry-After'))
+                        if delay is None:
+                            if response.status >= 300:
+                                await self._handle_error(response, f"make {method} request")
+                            if hints is not None:
+                                hints['retry_after'] = _parse_retry_after(response.headers.get('Retry-After'))
+                            return self.json_codec.loads(await response.read())
+                        logger.debug(f"{method} {url} returned {response.status}, retrying in {delay:.2f}s")
+            finally:
+                attempts.end_attempt()
+            await asyncio.sleep(delay)
 
     async def _async_post_request(
             self, url: str, data: Dict[str, Any], headers: Dict[str, str],
-            retries: int = 3, backoff_factor: float = 0.5) -> Dict[str, Any]:
+            retries: Optional[int] = None, backoff_factor: Optional[float] = None) -> Dict[str, Any]:
         """
         Make an async POST request with exponential backoff retry logic.
 
@@ -2769,8 +6243,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             url (str): The URL to send the POST request to.
             data (Dict[str, Any]): The JSON data to include in the request body.
             headers (Dict[str, str]): Headers to include in the request.
-            retries (int): Maximum number of retry attempts (default: 3).
-            backoff_factor (float): Factor to calculate delay between retries (default: 0.5).
+            retries (Optional[int]): Attempts to make, overriding the retry policy.
+            backoff_factor (Optional[float]): Backoff factor, overriding the retry policy.
                 Delay will be backoff_factor * (2 ** retry_count).
 
         Returns:
@@ -2784,16 +6258,19 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
     async def _async_get_request(
             self, url: str, headers: Dict[str, str],
-            retries: int = 3, backoff_factor: float = 0.5) -> Dict[str, Any]:
+            retries: Optional[int] = None, backoff_factor: Optional[float] = None,
+            hints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Make an async GET request with exponential backoff retry logic.
 
         Args:
             url (str): The URL to send the GET request to.
             headers (Dict[str, str]): Headers to include in the request.
-            retries (int): Maximum number of retry attempts (default: 3).
-            backoff_factor (float): Factor to calculate delay between retries (default: 0.5).
+            retries (Optional[int]): Attempts to make, overriding the retry policy.
+            backoff_factor (Optional[float]): Backoff factor, overriding the retry policy.
                 Delay will be backoff_factor * (2 ** retry_count).
+            hints (Optional[Dict[str, Any]]): If given, receives 'retry_after' when the response
+                asks the client to wait before polling again.
 
         Returns:
             Dict[str, Any]: The parsed JSON response from the server.
@@ -2802,7 +6279,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             aiohttp.ClientError: If the request fails after all retries.
             Exception: If max retries are exceeded or other errors occur.
         """
-        return await self._async_request("GET", url, headers, None, retries, backoff_factor)
+        return await self._async_request("GET", url, headers, None, retries, backoff_factor, hints)
 
     async def _handle_error(self, response: aiohttp.ClientResponse, action: str) -> None:
         """
@@ -2821,7 +6298,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
                 - Other: Unexpected error with status code
         """
         try:
-            error_data = await response.json()
+            error_data = self.json_codec.loads(await response.read())
             error_message = error_data.get('error', 'No error message provided.')
             error_details = error_data.get('details', 'No additional error details provided.')
         except:
@@ -2952,6 +6429,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
             extract: Optional[JsonConfig] = None,
             json_options: Optional[JsonConfig] = None,
             actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
+            max_age: Optional[int] = None,
+            store_in_cache: Optional[bool] = None,
+            zero_data_retention: Optional[bool] = None,
+            profile: Optional[ScrapeProfile] = None,
             **kwargs) -> ScrapeResponse[Any]:
         """
         Scrape a single URL asynchronously.
@@ -2973,6 +6454,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
           extract (Optional[JsonConfig]): Content extraction settings
           json_options (Optional[JsonConfig]): JSON extraction settings
           actions (Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]]): Actions to perform
+          max_age (Optional[int]): Maximum age in milliseconds of a cached page to accept
+          store_in_cache (Optional[bool]): Whether to store the result in the cache
+          zero_data_retention (Optional[bool]): Whether to delete data after scrape is done
+          profile (Optional[ScrapeProfile]): Compiled options to scrape with, added to by any other options given
           **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -2996,10 +6481,15 @@ class AsyncFirecrawlApp(FirecrawlApp):
         headers = self._prepare_headers()
 
         # Build scrape parameters
-        scrape_params = {
-            'url': url,
-            'origin': f"python-sdk@{version}"
-        }
+        if profile is not None:
+            scrape_params = profile.params(url=url)
+            if timeout is None:
+                timeout = profile.timeout
+        else:
+            scrape_params = {
+                'url': url,
+                'origin': f"python-sdk@{version}"
+            }
 
         # Add optional parameters if provided and not None
         if formats:
@@ -3040,28 +6530,210 @@ class AsyncFirecrawlApp(FirecrawlApp):
             scrape_params['jsonOptions'] = json_options if isinstance(json_options, dict) else json_options.dict(exclude_none=True)
         if actions:
             scrape_params['actions'] = [action if isinstance(action, dict) else action.dict(exclude_none=True) for action in actions]
+        if max_age is not None:
+            scrape_params['maxAge'] = max_age
+        if store_in_cache is not None:
+            scrape_params['storeInCache'] = store_in_cache
+        if zero_data_retention is not None:
+            scrape_params['zeroDataRetention'] = zero_data_retention
 
-        if 'extract' in scrape_params and scrape_params['extract'] and 'schema' in scrape_params['extract']:
-            scrape_params['extract']['schema'] = self._ensure_schema_dict(scrape_params['extract']['schema'])
-        if 'jsonOptions' in scrape_params and scrape_params['jsonOptions'] and 'schema' in scrape_params['jsonOptions']:
-            scrape_params['jsonOptions']['schema'] = self._ensure_schema_dict(scrape_params['jsonOptions']['schema'])
+        for key in ('extract', 'jsonOptions'):
+            # A profile's schemas were generated when it was compiled, and its options are shared
+            if profile is not None and scrape_params.get(key) is profile.payload.get(key):
+                continue
+            if scrape_params.get(key) and 'schema' in scrape_params[key]:
+                scrape_params[key]['schema'] = self._ensure_schema_dict(scrape_params[key]['schema'])
+
+        async def scrape() -> Dict[str, Any]:
+            endpoint = f'/v1/scrape'
+            response = await self._async_post_request(
+                f'{self.api_url}{endpoint}',
+                scrape_params,
+                headers
+            )
 
-        # Make async request
-        endpoint = f'/v1/scrape'
-        response = await self._async_post_request(
-            f'{self.api_url}{endpoint}',
-            scrape_params,
-            headers
-        )
+            if response.get('success') and 'data' in response:
+                return response['data']
+            elif "error" in response:
+                raise Exception(f'Failed to scrape URL. Error: {response["error"]}')
+            else:
+                # Use the response content directly if possible, otherwise a generic message
+                error_content = response.get('error', str(response))
+                raise Exception(f'Failed to scrape URL. Error: {error_content}')
+
+        cache_key, data = self._scrape_cache_lookup(scrape_params)
+        if data is not None:
+            return ScrapeResponse(**data)
 
-        if response.get('success') and 'data' in response:
-            return ScrapeResponse(**response['data'])
-        elif "error" in response:
-            raise Exception(f'Failed to scrape URL. Error: {response["error"]}')
+        # Make async request, sharing it with identical scrapes already in flight when enabled
+        if self._scrape_flights is not None:
+            data = await self._scrape_flights.async_do(_scrape_key(scrape_params), scrape)
         else:
-            # Use the response content directly if possible, otherwise a generic message
-            error_content = response.get('error', str(response))
-            raise Exception(f'Failed to scrape URL. Error: {error_content}')
+            data = await scrape()
+        self._scrape_cache_store(cache_key, scrape_params, data)
+        return ScrapeResponse(**data)
+
+    async def scrape_many(
+            self,
+            urls: Union[Iterable[str], AsyncIterable[str]],
+            *,
+            concurrency: int = 10,
+            per_domain_concurrency: Optional[int] = None,
+            **scrape_opts) -> AsyncIterator[Tuple[str, Union[ScrapeResponse[Any], Exception]]]:
+        """
+        Scrape many URLs with scrape_url, a bounded number at a time, yielding results as they complete.
+
+        URLs are read from urls only as scrapes finish, so an iterable or async iterable of any length
+        can be passed without creating all of its tasks up front. A failed scrape does not stop the others:
+        its exception is yielded in place of the response.
+
+        Args:
+            urls (Union[Iterable[str], AsyncIterable[str]]): URLs to scrape
+            concurrency (int): Maximum scrapes in flight at once
+            per_domain_concurrency (Optional[int]): Maximum scrapes in flight for any one domain, None for no limit
+            **scrape_opts: Options passed to scrape_url for every URL
+
+        Yields:
+            Tuple[str, Union[ScrapeResponse[Any], Exception]]: Each URL with its response or the exception
+            its scrape raised, in completion order
+
+        Raises:
+            ValueError: If concurrency or per_domain_concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        slots = _ScrapeSlots(per_domain_concurrency)
+        url_iterator = urls.__aiter__() if hasattr(urls, '__aiter__') else None
+        sync_iterator = iter(urls) if url_iterator is None else None
+        exhausted = False
+        tasks: Dict[asyncio.Task, str] = {}
+
+        async def next_url() -> Optional[str]:
+            nonlocal exhausted
+            try:
+                if url_iterator is not None:
+                    return await url_iterator.__anext__()
+                return next(sync_iterator)
+            except (StopIteration, StopAsyncIteration):
+                exhausted = True
+                return None
+
+        try:
+            while True:
+                while len(tasks) < concurrency:
+                    deferred = slots.take_deferred() if per_domain_concurrency is not None else None
+                    if deferred is not None:
+                        url = deferred[0]
+                    else:
+                        # Hold back at most `concurrency` URLs waiting for a busy domain
+                        if exhausted or len(slots) >= concurrency:
+                            break
+                        url = await next_url()
+                        if url is None or not slots.admit(url):
+                            continue
+                    tasks[asyncio.ensure_future(self.scrape_url(url, **scrape_opts))] = url
+                if not tasks:
+                    return
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    url = tasks.pop(task)
+                    slots.release(url)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        result = e
+                    yield url, result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def rescrape_changed(
+            self,
+            urls: Iterable[str] = (),
+            *,
+            manifest: ScrapeManifest,
+            map_site: Optional[str] = None,
+            concurrency: int = 10,
+            probe_timeout: float = 10.0,
+            **scrape_opts) -> AsyncIterator[Tuple[str, Union[ScrapeResponse[Any], Exception]]]:
+        """
+        Scrape again only the pages that changed since they were recorded in a manifest.
+
+        Every URL is first probed with a HEAD request to its own site. A page whose ETag, or
+        Last-Modified header when it sends no ETag, matches the one recorded is skipped without a
+        scrape. The other pages are scraped with scrape_many, and a result whose content hash
+        matches the manifest is not yielded. The manifest is updated as results arrive.
+
+        Args:
+            urls (Iterable[str]): URLs to check
+            manifest (ScrapeManifest): The pages scraped before
+            map_site (Optional[str]): Also check every URL map_url finds on this site, so new pages are scraped
+            concurrency (int): Maximum probes or scrapes in flight at once
+            probe_timeout (float): Seconds to wait for each HEAD probe
+            **scrape_opts: Options passed to scrape_url
+
+        Yields:
+            Tuple[str, Union[ScrapeResponse[Any], Exception]]: Each new or changed page with its response,
+            or the exception its scrape raised
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        candidates = list(urls)
+        if map_site is not None:
+            candidates.extend((await self.map_url(map_site)).links or [])
+        candidates = list(dict.fromkeys(candidates))
+        # The manifest is SQLite, so its reads and writes run off the event loop
+        loop = asyncio.get_running_loop()
+        validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        unchanged = 0
+
+        async def probe(url: str) -> Tuple[str, Optional[str], Optional[str]]:
+            try:
+                async with session.head(url, allow_redirects=True) as response:
+                    if response.status >= 400:
+                        return url, None, None
+                    return url, response.headers.get('ETag'), response.headers.get('Last-Modified')
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return url, None, None
+
+        async def changed() -> AsyncIterator[str]:
+            """
+            Probe the candidates, a bounded number at a time, yielding those that are new or changed.
+            """
+            nonlocal unchanged
+            remaining = iter(candidates)
+            probes: Set[asyncio.Task] = set()
+            try:
+                while True:
+                    for url in itertools.islice(remaining, concurrency - len(probes)):
+                        probes.add(asyncio.ensure_future(probe(url)))
+                    if not probes:
+                        return
+                    done, probes = await asyncio.wait(probes, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        url, etag, last_modified = task.result()
+                        if await loop.run_in_executor(None, manifest.is_unchanged, url, etag, last_modified):
+                            unchanged += 1
+                        else:
+                            validators[url] = (etag, last_modified)
+                            yield url
+            finally:
+                for task in probes:
+                    task.cancel()
+
+        # Probes go to the sites themselves, so they use their own session without the API credentials.
+        # scrape_many reads the changed pages only as it has room for them, which also paces the probes.
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=probe_timeout)) as session:
+            changed_urls = changed()
+            try:
+                async for url, result in self.scrape_many(changed_urls, concurrency=concurrency, **scrape_opts):
+                    etag, last_modified = validators.pop(url)
+                    if isinstance(result, Exception) or await loop.run_in_executor(
+                            None, manifest.update, url, result, etag, last_modified):
+                        yield url, result
+            finally:
+                await changed_urls.aclose()
+        logger.debug(f"{unchanged} of {len(candidates)} pages unchanged by their validators")
 
     async def batch_scrape_urls(
         self,
@@ -3085,7 +6757,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
         actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
         agent: Optional[AgentOptions] = None,
         poll_interval: Optional[int] = 2,
+        poll_strategy: Optional[PollingStrategy] = None,
         idempotency_key: Optional[str] = None,
+        profile: Optional[ScrapeProfile] = None,
         **kwargs
     ) -> BatchScrapeStatusResponse:
         """
@@ -3111,7 +6785,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
             actions (Optional[List[Union]]): Actions to perform
             agent (Optional[AgentOptions]): Agent configuration
             poll_interval (Optional[int]): Seconds between status checks (default: 2)
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            profile (Optional[ScrapeProfile]): Compiled options to scrape with, added to by any other options given
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3173,16 +6849,21 @@ class AsyncFirecrawlApp(FirecrawlApp):
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
-        # Create final params object
-        final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
-        params_dict['urls'] = urls
-        params_dict['origin'] = f"python-sdk@{version}"
-
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
+        if profile is not None and not scrape_params:
+            # The profile's options were validated and serialized when it was compiled
+            params_dict = profile.params(urls=urls)
+        else:
+            # Create final params object
+            final_params = ScrapeParams(**scrape_params)
+            params_dict = final_params.dict(exclude_none=True)
+            for key in ('extract', 'jsonOptions'):
+                if params_dict.get(key) and 'schema' in params_dict[key]:
+                    params_dict[key]['schema'] = self._ensure_schema_dict(params_dict[key]['schema'])
+            if profile is not None:
+                params_dict = profile.params(urls=urls, **params_dict)
+            else:
+                params_dict['urls'] = urls
+                params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
@@ -3197,7 +6878,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
                 id = response.get('id')
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return await self._async_monitor_job_status(id, headers, poll_interval)
+            return await self._async_monitor_job_status(id, headers, poll_interval, poll_strategy)
         else:
             self._handle_error(response, 'start batch scrape job')
 
@@ -3225,8 +6906,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
         agent: Optional[AgentOptions] = None,
         zero_data_retention: Optional[bool] = None,
         idempotency_key: Optional[str] = None,
+        return_handle: bool = False,
+        profile: Optional[ScrapeProfile] = None,
         **kwargs
-    ) -> BatchScrapeResponse:
+    ) -> Union[BatchScrapeResponse, 'AsyncJobHandle']:
         """
         Initiate a batch scrape job asynchronously.
 
@@ -3251,6 +6934,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             agent (Optional[AgentOptions]): Agent configuration
             zero_data_retention (Optional[bool]): Whether to delete data after 24 hours
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            return_handle (bool): Return an AsyncJobHandle that resolves to the scraped documents instead of the bare response
+            profile (Optional[ScrapeProfile]): Compiled options to scrape with, added to by any other options given
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3315,16 +7000,21 @@ class AsyncFirecrawlApp(FirecrawlApp):
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
-        # Create final params object
-        final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
-        params_dict['urls'] = urls
-        params_dict['origin'] = f"python-sdk@{version}"
-
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
+        if profile is not None and not scrape_params:
+            # The profile's options were validated and serialized when it was compiled
+            params_dict = profile.params(urls=urls)
+        else:
+            # Create final params object
+            final_params = ScrapeParams(**scrape_params)
+            params_dict = final_params.dict(exclude_none=True)
+            for key in ('extract', 'jsonOptions'):
+                if params_dict.get(key) and 'schema' in params_dict[key]:
+                    params_dict[key]['schema'] = self._ensure_schema_dict(params_dict[key]['schema'])
+            if profile is not None:
+                params_dict = profile.params(urls=urls, **params_dict)
+            else:
+                params_dict['urls'] = urls
+                params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
@@ -3334,13 +7024,79 @@ class AsyncFirecrawlApp(FirecrawlApp):
             headers
         )
 
-        if response.get('status_code') == 200:
+        if response.get('success'):
             try:
-                return BatchScrapeResponse(**response.json())
+                batch_response = BatchScrapeResponse(**response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
+            if return_handle:
+                return AsyncJobHandle(self, 'batch_scrape', batch_response)
+            return batch_response
         else:
-            self._handle_error(response, 'start batch scrape job')
+            raise Exception(f'Failed to start batch scrape job. Error: {response.get("error")}')
+
+    async def async_batch_scrape_urls_chunked(
+            self,
+            urls: Iterable[str],
+            *,
+            chunk_size: int = 1000,
+            max_submissions: int = 4,
+            idempotency_key: Optional[str] = None,
+            poll_strategy: Optional[PollingStrategy] = None,
+            **kwargs) -> 'AsyncBatchScrapeGroup':
+        """
+        Split a large list of URLs into chunks and start a batch scrape job for each, several at a time.
+
+        Each chunk is sent with its own idempotency key derived from idempotency_key, so a start
+        request retried after a timeout, or a whole submission repeated with the same key, cannot
+        start a chunk twice. Chunks whose job could not be started are kept on the returned group
+        with their error rather than failing the jobs already started.
+
+        Args:
+            urls (Iterable[str]): URLs to scrape, read one chunk at a time
+            chunk_size (int): Maximum URLs per batch scrape job (default: 1000)
+            max_submissions (int): Maximum start requests in flight at once, also used for status checks (default: 4)
+            idempotency_key (Optional[str]): UUID the chunks' idempotency keys are derived from (default: random)
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
+            **kwargs: Options passed to async_batch_scrape_urls for every chunk
+
+        Returns:
+            AsyncBatchScrapeGroup: The started jobs, whose documents and progress can be read as one job
+
+        Raises:
+            ValueError: If chunk_size or max_submissions is less than 1, or idempotency_key is not a UUID
+            Exception: If no job could be started
+        """
+        if chunk_size < 1 or max_submissions < 1:
+            raise ValueError('chunk_size and max_submissions must be at least 1')
+        base_key = uuid.UUID(idempotency_key) if idempotency_key else uuid.uuid4()
+        slots = asyncio.Semaphore(max_submissions)
+
+        async def start(index: int, chunk: List[str]) -> str:
+            try:
+                response = await self.async_batch_scrape_urls(chunk, idempotency_key=str(uuid.uuid5(base_key, str(index))), **kwargs)
+                return response.id
+            finally:
+                slots.release()
+
+        chunks: List[List[str]] = []
+        tasks: List[asyncio.Task] = []
+        try:
+            for index, chunk in enumerate(_chunks(urls, chunk_size)):
+                await slots.acquire()
+                chunks.append(chunk)
+                tasks.append(asyncio.ensure_future(start(index, chunk)))
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        ids = [result for result in results if not isinstance(result, BaseException)]
+        failed = [(chunk, result) for chunk, result in zip(chunks, results) if isinstance(result, BaseException)]
+        if failed and not ids:
+            raise failed[0][1]
+        return AsyncBatchScrapeGroup(self, ids, failed, max_workers=max_submissions, poll_strategy=poll_strategy)
 
     async def crawl_url(
         self,
@@ -3363,6 +7119,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         delay: Optional[int] = None,
         allow_subdomains: Optional[bool] = None,
         poll_interval: Optional[int] = 2,
+        poll_strategy: Optional[PollingStrategy] = None,
         idempotency_key: Optional[str] = None,
         **kwargs
     ) -> CrawlStatusResponse:
@@ -3388,6 +7145,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             delay (Optional[int]): Delay in seconds between scrapes
             allow_subdomains (Optional[bool]): Follow subdomains
             poll_interval (Optional[int]): Seconds between status checks (default: 2)
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
             **kwargs: Additional parameters to pass to the API
 
@@ -3457,7 +7215,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
                 id = response.get('id')
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return await self._async_monitor_job_status(id, headers, poll_interval)
+            return await self._async_monitor_job_status(id, headers, poll_interval, poll_strategy)
         else:
             self._handle_error(response, 'start crawl job')
 
@@ -3484,8 +7242,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
         allow_subdomains: Optional[bool] = None,
         poll_interval: Optional[int] = 2,
         idempotency_key: Optional[str] = None,
+        return_handle: bool = False,
         **kwargs
-    ) -> CrawlResponse:
+    ) -> Union[CrawlResponse, 'AsyncJobHandle']:
         """
         Start an asynchronous crawl job.
 
@@ -3506,6 +7265,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             ignore_query_parameters (Optional[bool]): Ignore URL parameters
             regex_on_full_url (Optional[bool]): Apply regex to full URLs
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            return_handle (bool): Return an AsyncJobHandle that resolves to the crawl results instead of the bare response
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3573,18 +7333,25 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         if response.get('success'):
             try:
-                return CrawlResponse(**response)
+                crawl_response = CrawlResponse(**response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
+            if return_handle:
+                return AsyncJobHandle(self, 'crawl', crawl_response)
+            return crawl_response
         else:
             self._handle_error(response, 'start crawl job')
 
-    async def check_crawl_status(self, id: str) -> CrawlStatusResponse:
+    async def check_crawl_status(self, id: str, prefetch: int = 0, parallel: int = 0) -> CrawlStatusResponse:
         """
         Check the status and results of an asynchronous crawl job.
 
         Args:
             id (str): Unique identifier for the crawl job
+            prefetch (int): Number of result pages to fetch ahead in a background task while
+                earlier pages are processed (default: 0, pages are fetched one at a time)
+            parallel (int): Once the job is complete, fetch up to this many result pages at once
+                using skip offsets (default: 0, pages are fetched by following `next` links)
 
         Returns:
             CrawlStatusResponse containing:
@@ -3615,27 +7382,21 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if status_data.get('status') == 'completed':
             if 'data' in status_data:
                 data = status_data['data']
-                while 'next' in status_data:
-                    if len(status_data['data']) == 0:
-                        break
-                    next_url = status_data.get('next')
-                    if not next_url:
-                        logger.warning("Expected 'next' URL is missing.")
-                        break
-                    next_data = await self._async_get_request(next_url, headers)
+                next_pages = self._async_read_ahead(self._async_next_pages(status_data, headers, parallel), prefetch)
+                async for next_data in next_pages:
                     data.extend(next_data.get('data', []))
                     status_data = next_data
                 status_data['data'] = data
         # Create CrawlStatusResponse object from status data
-        response = CrawlStatusResponse(
-            status=status_data.get('status'),
-            total=status_data.get('total'),
-            completed=status_data.get('completed'),
-            creditsUsed=status_data.get('creditsUsed'),
-            expiresAt=status_data.get('expiresAt'),
-            data=status_data.get('data'),
-            success=False if 'error' in status_data else True
-        )
+        response = self._build_status_response(CrawlStatusResponse, {
+            'status': status_data.get('status'),
+            'total': status_data.get('total'),
+            'completed': status_data.get('completed'),
+            'creditsUsed': status_data.get('creditsUsed'),
+            'expiresAt': status_data.get('expiresAt'),
+            'data': status_data.get('data'),
+            'success': False if 'error' in status_data else True
+        })
 
         if 'error' in status_data:
             response.error = status_data.get('error')
@@ -3645,14 +7406,55 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         return response
 
-    async def _async_monitor_job_status(self, id: str, headers: Dict[str, str], poll_interval: int = 2) -> CrawlStatusResponse:
+    async def iter_crawl_documents(
+            self,
+            id: str,
+            poll_interval: int = 2,
+            prefetch: int = 0,
+            parallel: int = 0,
+            stream: bool = False) -> AsyncIterator[FirecrawlDocument]:
+        """
+        Asynchronously iterate over the documents of a crawl job page by page.
+
+        Waits for the job to finish, then follows the result pages one at a time so
+        only a single page of documents is held in memory.
+
+        Args:
+            id (str): The ID of the crawl job
+            poll_interval (int): Seconds between status checks while the job is running (default: 2)
+            prefetch (int): Number of result pages to fetch ahead in a background task (default: 0)
+            parallel (int): Number of result pages to fetch at once using skip offsets (default: 0)
+            stream (bool): Parse each result page incrementally as it downloads, holding a single
+                document in memory instead of a whole page. Requires ijson; cannot be combined
+                with prefetch or parallel (default: False)
+
+        Yields:
+            FirecrawlDocument: Each crawled document, in result order
+
+        Raises:
+            Exception: If the job fails, is cancelled or a status request fails
+        """
+        documents = self._async_iter_job_documents(f'{self.api_url}/v1/crawl/{id}', poll_interval, prefetch, parallel, stream)
+        async for document in documents:
+            yield self._build_document(document)
+
+    async def _async_monitor_job_status(
+            self,
+            id: str,
+            headers: Dict[str, str],
+            poll_interval: int = 2,
+            poll_strategy: Optional[PollingStrategy] = None) -> CrawlStatusResponse:
         """
         Monitor the status of an asynchronous job until completion.
 
+        Documents are collected on every poll while the job runs, so once it completes
+        only the documents scraped since the last poll remain to be fetched.
+
         Args:
             id (str): The ID of the job to monitor
             headers (Dict[str, str]): Headers to include in status check requests
-            poll_interval (int): Seconds between status checks (default: 2)
+            poll_interval (int): Seconds before the second status check (default: 2)
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
 
         Returns:
             CrawlStatusResponse: The job results if completed successfully
@@ -3660,34 +7462,388 @@ class AsyncFirecrawlApp(FirecrawlApp):
         Raises:
             Exception: If the job fails or an error occurs during status checks
         """
+        url = f'{self.api_url}/v1/crawl/{id}'
+        data: List[Dict[str, Any]] = []
+        poller = self._poller(poll_strategy, poll_interval)
         while True:
-            status_data = await self._async_get_request(
-                f'{self.api_url}/v1/crawl/{id}',
-                headers
-            )
+            hints: Dict[str, Any] = {}
+            status_data = await self._async_get_request(url, headers, hints=hints)
+            documents = status_data.get('data') or []
+            data.extend(documents)
+            # `next` points just past the documents received so far, so following it on the
+            # next poll only downloads documents scraped since, and the tail once completed
+            if status_data.get('next'):
+                url = status_data['next']
 
             if status_data.get('status') == 'completed':
-                if 'data' in status_data:
-                    data = status_data['data']
-                    while 'next' in status_data:
-                        if len(status_data['data']) == 0:
-                            break
-                        next_url = status_data.get('next')
-                        if not next_url:
-                            logger.warning("Expected 'next' URL is missing.")
-                            break
-                        next_data = await self._async_get_request(next_url, headers)
-                        data.extend(next_data.get('data', []))
-                        status_data = next_data
-                    status_data['data'] = data
-                    return CrawlStatusResponse(**status_data)
-                else:
+                if documents and status_data.get('next'):
+                    continue
+                if 'data' not in status_data and not data:
                     raise Exception('Job completed but no data was returned')
+                status_data['data'] = data
+                return self._build_status_response(CrawlStatusResponse, status_data)
             elif status_data.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                await asyncio.sleep(max(poll_interval, 2))
+                await poller.async_wait(status_data, hints.get('retry_after'))
             else:
                 raise Exception(f'Job failed or was stopped. Status: {status_data["status"]}')
 
+    async def _async_iter_job_documents(
+            self,
+            url: str,
+            poll_interval: int,
+            prefetch: int = 0,
+            parallel: int = 0,
+            stream: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Wait for a crawl or batch scrape job to complete, then yield its raw documents in order.
+
+        Args:
+            url (str): The job status URL
+            poll_interval (int): Seconds between status checks while the job is running
+            prefetch (int): Number of pages to fetch ahead of the consumer in a background task
+            parallel (int): Number of pages to fetch at once using skip offsets
+            stream (bool): Parse pages incrementally instead of decoding them whole
+
+        Yields:
+            Dict[str, Any]: Each document, as returned by the API
+
+        Raises:
+            ValueError: If stream is combined with prefetch or parallel
+            Exception: If the job fails or is stopped, or a status request fails
+        """
+        if stream:
+            if prefetch or parallel:
+                raise ValueError('stream cannot be combined with prefetch or parallel')
+            async for document in self._async_iter_streamed_documents(url, poll_interval):
+                yield document
+            return
+        async for page in self._async_iter_job_pages(url, poll_interval, prefetch, parallel):
+            for document in page.get('data', []):
+                yield document
+
+    @contextlib.asynccontextmanager
+    async def _async_stream_get(self, url: str, headers: Dict[str, str]):
+        """
+        Send a GET request on the shared async session without buffering the response body.
+
+        Yields the response (adapted to the aiohttp interface for httpx) together with an
+        async file-like reader over its decoded body, and records the transfer stats once
+        the body has been read. Opening the response is retried according to the client's
+        retry policy.
+
+        Args:
+            url (str): The URL to send the request to
+            headers (Dict[str, str]): Headers to include in the request
+
+        Raises:
+            CircuitOpenError: If the circuit breaker for the host is open.
+            aiohttp.ClientError: If the request fails and is not retried.
+        """
+        session = await self._get_async_session()
+        attempts = self._retry_attempts('GET', url, headers)
+        while True:
+            attempts.before_attempt()
+            try:
+                async with contextlib.AsyncExitStack() as stack:
+                    try:
+                        await stack.enter_async_context(self._async_rate_limit('GET', url))
+                        if self.http2:
+                            raw = await stack.enter_async_context(session.stream('GET', url, headers=headers))
+                            response = _AsyncHTTPXResponse(raw)
+                            reader = _AsyncChunkReader(raw.aiter_bytes(_STREAM_CHUNK_SIZE))
+                        else:
+                            response = await stack.enter_async_context(session.get(url, headers=headers))
+                            reader = _AsyncChunkReader(response.content.iter_chunked(_STREAM_CHUNK_SIZE))
+                    except attempts.errors as e:
+                        delay = attempts.after_error(e)
+                        if delay is None:
+                            raise
+                        logger.debug(f"GET {url} failed with {e!r}, retrying in {delay:.2f}s")
+                    else:
+                        delay = attempts.after_response(response.status, response.headers.get('Retry-After'))
+                        if delay is None:
+                            try:
+                                yield response, reader
+                            finally:
+                                if self.http2:
+                                    bytes_received = raw.num_bytes_downloaded
+                                else:
+                                    bytes_received = getattr(response.content, 'total_raw_bytes', reader.bytes_read)
+                                self.transfer_stats.record(
+                                    bytes_sent=0,
+                                    bytes_sent_decoded=0,
+                                    bytes_received=bytes_received,
+                                    bytes_received_decoded=reader.bytes_read
+                                )
+                            return
+                        logger.debug(f"GET {url} returned {response.status}, retrying in {delay:.2f}s")
+            finally:
+                attempts.end_attempt()
+            await asyncio.sleep(delay)
+
+    async def _async_stream_status_page(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            fields: Dict[str, Any],
+            hints: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch one status page and yield its documents as they are parsed from the response stream.
+
+        Args:
+            url (str): The status or next-page URL
+            headers (Dict[str, str]): Headers to include in the request
+            fields (Dict[str, Any]): Filled with the page's top-level fields, such as status and next
+            hints (Optional[Dict[str, Any]]): If given, receives 'retry_after' when the response
+                asks the client to wait before polling again
+
+        Yields:
+            Dict[str, Any]: Each document on the page
+
+        Raises:
+            Exception: If the request fails or the response is not valid JSON
+        """
+        async with self._async_stream_get(url, headers) as (response, reader):
+            if response.status != 200:
+                await self._handle_error(response, 'check status')
+            if hints is not None:
+                hints['retry_after'] = _parse_retry_after(response.headers.get('Retry-After'))
+            parser = _StatusPageParser(fields)
+            try:
+                async for prefix, event, value in ijson.parse_async(reader, use_float=True):
+                    document = parser.feed(prefix, event, value)
+                    if document is not parser.NO_DOCUMENT:
+                        yield document
+            except ijson.JSONError:
+                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+
+    async def _async_iter_streamed_documents(self, url: str, poll_interval: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Wait for a job to complete, then yield its documents, parsing each page incrementally.
+
+        Args:
+            url (str): The job status URL
+            poll_interval (int): Seconds between status checks while the job is running
+
+        Yields:
+            Dict[str, Any]: Each document, as returned by the API
+
+        Raises:
+            Exception: If the job fails or is stopped, or a status request fails
+        """
+        _require_ijson()
+        headers = self._prepare_headers()
+        poller = self._poller(poll_interval=poll_interval)
+        hints: Dict[str, Any] = {}
+        while True:
+            fields: Dict[str, Any] = {}
+            documents = self._async_stream_status_page(url, headers, fields, hints)
+            # The API sends status and next ahead of data, so they are known once the first document is parsed
+            first = []
+            async for document in documents:
+                first.append(document)
+                break
+            if fields.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
+                await documents.aclose()
+                await poller.async_wait(fields, hints.get('retry_after'))
+                continue
+            if fields.get('status') != 'completed':
+                await documents.aclose()
+                raise Exception(f'Job failed or was stopped. Status: {fields.get("status")}')
+            break
+
+        while True:
+            count = 0
+            for document in first:
+                count += 1
+                yield document
+            async for document in documents:
+                count += 1
+                yield document
+            next_url = fields.get('next')
+            if not count or not next_url:
+                return
+            fields = {}
+            documents = self._async_stream_status_page(next_url, headers, fields)
+            first = []
+
+    async def _async_iter_job_pages(self, url: str, poll_interval: int, prefetch: int = 0, parallel: int = 0) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Wait for a crawl or batch scrape job to complete, then yield its result pages in order.
+
+        Args:
+            url (str): The job status URL
+            poll_interval (int): Seconds between status checks while the job is running
+            prefetch (int): Number of pages to fetch ahead of the consumer in a background task
+            parallel (int): Number of pages to fetch at once using skip offsets
+
+        Yields:
+            Dict[str, Any]: Each status page, as returned by the API
+
+        Raises:
+            Exception: If the job fails or is stopped, or a status request fails
+        """
+        headers = self._prepare_headers()
+        poller = self._poller(poll_interval=poll_interval)
+        hints: Dict[str, Any] = {}
+        page = await self._async_get_request(url, headers, hints=hints)
+        while page.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
+            await poller.async_wait(page, hints.get('retry_after'))
+            page = await self._async_get_request(url, headers, hints=hints)
+        if page.get('status') != 'completed':
+            raise Exception(f'Job failed or was stopped. Status: {page.get("status")}')
+
+        async def pages() -> AsyncIterator[Dict[str, Any]]:
+            # The first page goes through the read-ahead too, so page 2 is fetched while page 1 is processed
+            yield page
+            next_pages = self._async_next_pages(page, headers, parallel)
+            try:
+                async for next_page in next_pages:
+                    yield next_page
+            finally:
+                await next_pages.aclose()
+
+        async for next_page in self._async_read_ahead(pages(), prefetch):
+            yield next_page
+
+    async def _async_follow_next_pages(self, page: Dict[str, Any], headers: Dict[str, str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the status pages that follow page, walking its `next` links until the results are exhausted.
+
+        Args:
+            page (Dict[str, Any]): The status page to start from; it is not yielded itself
+            headers (Dict[str, str]): Headers to include in the requests
+
+        Yields:
+            Dict[str, Any]: Each following status page
+
+        Raises:
+            Exception: If a page request fails
+        """
+        while page.get('next') and page.get('data'):
+            page = await self._async_get_request(page['next'], headers)
+            yield page
+
+    def _async_next_pages(self, page: Dict[str, Any], headers: Dict[str, str], parallel: int = 0) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over the status pages that follow page, fetching them concurrently when parallel is above 1.
+
+        Args:
+            page (Dict[str, Any]): The status page to start from; it is not included
+            headers (Dict[str, str]): Headers to include in the requests
+            parallel (int): Maximum number of pages to fetch at once
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: The following status pages, in order
+        """
+        if parallel > 1:
+            return self._async_fetch_pages_in_parallel(page, headers, parallel)
+        return self._async_follow_next_pages(page, headers)
+
+    async def _async_fetch_pages_in_parallel(
+            self,
+            page: Dict[str, Any],
+            headers: Dict[str, str],
+            workers: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch the pages of a completed job concurrently by computing their skip offsets.
+
+        Pages are yielded in order. If a page comes back with fewer documents than
+        requested, the remaining pages are fetched sequentially by following `next` links.
+
+        Args:
+            page (Dict[str, Any]): The first status page; it is not yielded itself
+            headers (Dict[str, str]): Headers to include in the requests
+            workers (int): Maximum number of pages to fetch at once
+
+        Yields:
+            Dict[str, Any]: Each following status page, in order
+        """
+        page_size = len(page.get('data') or [])
+        total = page.get('completed')
+        if page.get('status') != 'completed' or not page.get('next') or not page_size or not isinstance(total, int):
+            async for next_page in self._async_follow_next_pages(page, headers):
+                yield next_page
+            return
+
+        offsets = iter(range(page_size, total, page_size))
+        pending: collections.deque = collections.deque()
+
+        def submit() -> None:
+            offset = next(offsets, None)
+            if offset is not None:
+                url = _page_url(page['next'], offset, page_size)
+                pending.append((offset, asyncio.create_task(self._async_get_request(url, headers))))
+
+        for _ in range(workers):
+            submit()
+        try:
+            while pending:
+                offset, task = pending.popleft()
+                page = await task
+                submit()
+                yield page
+                if len(page.get('data') or []) < min(page_size, total - offset):
+                    logger.debug(f"Page at offset {offset} came back short, following next links instead")
+                    break
+            else:
+                return
+        finally:
+            for _, task in pending:
+                task.cancel()
+        async for next_page in self._async_follow_next_pages(page, headers):
+            yield next_page
+
+    async def _async_read_ahead(self, pages: AsyncIterator[Dict[str, Any]], depth: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Consume a page iterator in a background task, keeping up to depth pages ready.
+
+        While the caller processes one page the following ones are already being fetched.
+        Errors raised while fetching are re-raised to the caller in order. The page generator
+        is closed once the caller stops, before this generator finishes closing.
+
+        Args:
+            pages (AsyncIterator[Dict[str, Any]]): The page generator to fetch from
+            depth (int): Number of pages to buffer ahead of the caller; 0 disables read-ahead
+
+        Yields:
+            Dict[str, Any]: The pages, in their original order
+        """
+        if depth <= 0:
+            try:
+                async for page in pages:
+                    yield page
+            finally:
+                await pages.aclose()
+            return
+
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=depth)
+        done = object()
+
+        async def produce() -> None:
+            try:
+                async for page in pages:
+                    await buffer.put((page, None))
+                await buffer.put((done, None))
+            except Exception as e:
+                await buffer.put((done, e))
+            finally:
+                # Release open responses and in-flight requests of a consumer that stopped early
+                await pages.aclose()
+
+        task = asyncio.create_task(produce())
+        try:
+            while True:
+                page, error = await buffer.get()
+                if page is done:
+                    if error is not None:
+                        raise error
+                    return
+                yield page
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
     async def map_url(
         self,
         url: str,
@@ -3772,7 +7928,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             allow_external_links: Optional[bool] = False,
             enable_web_search: Optional[bool] = False,
             show_sources: Optional[bool] = False,
-            agent: Optional[Dict[str, Any]] = None) -> ExtractResponse[Any]:
+            agent: Optional[Dict[str, Any]] = None,
+            poll_strategy: Optional[PollingStrategy] = None) -> ExtractResponse[Any]:
             
         """
         Asynchronously extract structured information from URLs.
@@ -3786,6 +7943,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             enable_web_search (Optional[bool]): Enable web search
             show_sources (Optional[bool]): Include source URLs
             agent (Optional[Dict[str, Any]]): Agent configuration
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
 
         Returns:
           ExtractResponse with:
@@ -3836,10 +7994,13 @@ class AsyncFirecrawlApp(FirecrawlApp):
             if not job_id:
                 raise Exception('Job ID not returned from extract request.')
 
+            poller = self._poller(poll_strategy)
             while True:
+                hints: Dict[str, Any] = {}
                 status_data = await self._async_get_request(
                     f'{self.api_url}/v1/extract/{job_id}',
-                    headers
+                    headers,
+                    hints=hints
                 )
 
                 if status_data['status'] == 'completed':
@@ -3847,16 +8008,20 @@ class AsyncFirecrawlApp(FirecrawlApp):
                 elif status_data['status'] in ['failed', 'cancelled']:
                     raise Exception(f'Extract job {status_data["status"]}. Error: {status_data["error"]}')
 
-                await asyncio.sleep(2)
+                await poller.async_wait(status_data, hints.get('retry_after'))
         else:
             raise Exception(f'Failed to extract. Error: {response.get("error")}')
 
-    async def check_batch_scrape_status(self, id: str) -> BatchScrapeStatusResponse:
+    async def check_batch_scrape_status(self, id: str, prefetch: int = 0, parallel: int = 0) -> BatchScrapeStatusResponse:
         """
         Check the status of an asynchronous batch scrape job.
 
         Args:
             id (str): The ID of the batch scrape job
+            prefetch (int): Number of result pages to fetch ahead in a background task while
+                earlier pages are processed (default: 0, pages are fetched one at a time)
+            parallel (int): Once the job is complete, fetch up to this many result pages at once
+                using skip offsets (default: 0, pages are fetched by following `next` links)
 
         Returns:
             BatchScrapeStatusResponse containing:
@@ -3887,37 +8052,55 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if status_data['status'] == 'completed':
             if 'data' in status_data:
                 data = status_data['data']
-                while 'next' in status_data:
-                    if len(status_data['data']) == 0:
-                        break
-                    next_url = status_data.get('next')
-                    if not next_url:
-                        logger.warning("Expected 'next' URL is missing.")
-                        break
-                    next_data = await self._async_get_request(next_url, headers)
+                next_pages = self._async_read_ahead(self._async_next_pages(status_data, headers, parallel), prefetch)
+                async for next_data in next_pages:
                     data.extend(next_data.get('data', []))
                     status_data = next_data
                 status_data['data'] = data
 
-        response = BatchScrapeStatusResponse(
-            status=status_data.get('status'),
-            total=status_data.get('total'),
-            completed=status_data.get('completed'),
-            creditsUsed=status_data.get('creditsUsed'),
-            expiresAt=status_data.get('expiresAt'),
-            data=status_data.get('data')
-        )
+        return self._build_status_response(BatchScrapeStatusResponse, {
+            'success': False if 'error' in status_data else True,
+            'status': status_data.get('status'),
+            'total': status_data.get('total'),
+            'completed': status_data.get('completed'),
+            'creditsUsed': status_data.get('creditsUsed'),
+            'expiresAt': status_data.get('expiresAt'),
+            'data': status_data.get('data'),
+            'next': status_data.get('next'),
+            'error': status_data.get('error')
+        })
+
+    async def iter_batch_scrape_documents(
+            self,
+            id: str,
+            poll_interval: int = 2,
+            prefetch: int = 0,
+            parallel: int = 0,
+            stream: bool = False) -> AsyncIterator[FirecrawlDocument]:
+        """
+        Asynchronously iterate over the documents of a batch scrape job page by page.
 
-        if 'error' in status_data:
-            response['error'] = status_data['error']
+        Waits for the job to finish, then follows the result pages one at a time so
+        only a single page of documents is held in memory.
 
-        if 'next' in status_data:
-            response['next'] = status_data['next']
+        Args:
+            id (str): The ID of the batch scrape job
+            poll_interval (int): Seconds between status checks while the job is running (default: 2)
+            prefetch (int): Number of result pages to fetch ahead in a background task (default: 0)
+            parallel (int): Number of result pages to fetch at once using skip offsets (default: 0)
+            stream (bool): Parse each result page incrementally as it downloads, holding a single
+                document in memory instead of a whole page. Requires ijson; cannot be combined
+                with prefetch or parallel (default: False)
 
-        return {
-            'success': False if 'error' in status_data else True,
-            **response
-        }
+        Yields:
+            FirecrawlDocument: Each scraped document, in result order
+
+        Raises:
+            Exception: If the job fails, is cancelled or a status request fails
+        """
+        documents = self._async_iter_job_documents(f'{self.api_url}/v1/batch/scrape/{id}', poll_interval, prefetch, parallel, stream)
+        async for document in documents:
+            yield self._build_document(document)
 
     async def check_batch_scrape_errors(self, id: str) -> CrawlErrorsResponse:
         """
@@ -3985,9 +8168,27 @@ class AsyncFirecrawlApp(FirecrawlApp):
             Exception: If cancellation fails
         """
         headers = self._prepare_headers()
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(f'{self.api_url}/v1/crawl/{id}', headers=headers) as response:
-                return await response.json()
+        async with self._async_send('DELETE', f'{self.api_url}/v1/crawl/{id}', headers) as response:
+            return self.json_codec.loads(await response.read())
+
+    async def cancel_batch_scrape(self, id: str) -> Dict[str, Any]:
+        """
+        Cancel a batch scrape job.
+
+        Args:
+            id (str): The ID of the batch scrape job to cancel
+
+        Returns:
+            Dict[str, Any] containing:
+            * success (bool): Whether cancellation was successful
+            * error (str, optional): Error message if cancellation failed
+
+        Raises:
+            Exception: If cancellation fails
+        """
+        headers = self._prepare_headers()
+        async with self._async_send('DELETE', f'{self.api_url}/v1/batch/scrape/{id}', headers) as response:
+            return self.json_codec.loads(await response.read())
 
     async def get_extract_status(self, job_id: str) -> ExtractResponse[Any]:
         """
@@ -4092,7 +8293,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             *,
             max_urls: Optional[int] = None,
             show_full_text: Optional[bool] = None,
-            experimental_stream: Optional[bool] = None) -> GenerateLLMsTextStatusResponse:
+            experimental_stream: Optional[bool] = None,
+            poll_strategy: Optional[PollingStrategy] = None) -> GenerateLLMsTextStatusResponse:
         """
         Generate LLMs.txt for a given URL and monitor until completion.
 
@@ -4101,6 +8303,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             max_urls (Optional[int]): Maximum URLs to process (default: 10)
             show_full_text (Optional[bool]): Include full text in output (default: False)
             experimental_stream (Optional[bool]): Enable experimental streaming
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
 
         Returns:
             GenerateLLMsTextStatusResponse containing:
@@ -4134,6 +8337,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             return response
 
         job_id = response['id']
+        poller = self._poller(poll_strategy)
         while True:
             status = await self.check_generate_llms_text_status(job_id)
             
@@ -4144,7 +8348,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             elif status['status'] != 'processing':
                 break
 
-            await asyncio.sleep(2)
+            await poller.async_wait(status)
 
         return GenerateLLMsTextStatusResponse(success=False, error='LLMs.txt generation job terminated unexpectedly')
 
@@ -4243,7 +8447,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             system_prompt: Optional[str] = None,
             __experimental_stream_steps: Optional[bool] = None,
             on_activity: Optional[Callable[[Dict[str, Any]], None]] = None,
-            on_source: Optional[Callable[[Dict[str, Any]], None]] = None) -> DeepResearchStatusResponse:
+            on_source: Optional[Callable[[Dict[str, Any]], None]] = None,
+            poll_strategy: Optional[PollingStrategy] = None) -> DeepResearchStatusResponse:
         """
         Initiates a deep research operation on a given query and polls until completion.
 
@@ -4257,6 +8462,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             __experimental_stream_steps (Optional[bool]): Enable experimental streaming
             on_activity (Optional[Callable]): Progress callback receiving {type, status, message, timestamp, depth}
             on_source (Optional[Callable]): Source discovery callback receiving {url, title, description}
+            poll_strategy (Optional[PollingStrategy]): Schedule for status checks. Defaults to the client's
 
         Returns:
             DeepResearchStatusResponse containing:
@@ -4301,6 +8507,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         job_id = response['id']
         last_activity_count = 0
         last_source_count = 0
+        poller = self._poller(poll_strategy)
 
         while True:
             status = await self.check_deep_research_status(job_id)
@@ -4324,7 +8531,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             elif status['status'] != 'processing':
                 break
 
-            await asyncio.sleep(2)
+            await poller.async_wait(status)
 
         return DeepResearchStatusResponse(success=False, error='Deep research job terminated unexpectedly')
 
@@ -4527,7 +8734,7 @@ class AsyncCrawlWatcher(CrawlWatcher):
             websocket: The WebSocket connection object
         """
         async for message in websocket:
-            msg = json.loads(message)
+            msg = self.app.json_codec.loads(message)
             await self._handle_message(msg)
 
     async def _handle_message(self, msg: Dict[str, Any]) -> None:
@@ -4557,7 +8764,7 @@ class AsyncCrawlWatcher(CrawlWatcher):
         Handle errors from async API responses.
         """
         try:
-            error_data = await response.json()
+            error_data = self.app.json_codec.loads(await response.read())
             error_message = error_data.get('error', 'No error message provided.')
             error_details = error_data.get('details', 'No additional error details provided.')
         except:
@@ -4582,3 +8789,316 @@ class AsyncCrawlWatcher(CrawlWatcher):
             str: A formatted error message
         """
         return self._get_error_message(status_code, action, error_message, error_details)
+
+class AsyncJobMonitor(JobMonitor):
+    """
+    Polls the status of any number of jobs from a single task on the running event loop.
+
+    Each watched job gets an asyncio.Future that resolves to the same result the
+    corresponding AsyncFirecrawlApp method would return.
+    """
+    def __init__(self, app: AsyncFirecrawlApp, *, max_concurrency: int = 8) -> None:
+        """
+        Args:
+            app (AsyncFirecrawlApp): The client used for status checks
+            max_concurrency (int): Maximum number of status checks in flight at once (default: 8)
+        """
+        super().__init__(app, max_concurrency=max_concurrency)
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    async def __aenter__(self) -> 'AsyncJobMonitor':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    def watch(
+            self,
+            kind: Literal['crawl', 'batch_scrape', 'extract', 'deep_research', 'llmstxt'],
+            id: str,
+            *,
+            callback: Optional[Callable[[asyncio.Future], None]] = None,
+            poll_strategy: Optional[PollingStrategy] = None) -> asyncio.Future:
+        """
+        Start tracking a job. Must be called from a running event loop.
+
+        Args:
+            kind (str): The kind of job: 'crawl', 'batch_scrape', 'extract', 'deep_research' or 'llmstxt'
+            id (str): The job ID
+            callback (Optional[Callable[[asyncio.Future], None]]): Called with the future once the job finishes
+            poll_strategy (Optional[PollingStrategy]): Schedule for this job's status checks. Defaults to the client's
+
+        Returns:
+            asyncio.Future: Resolves to the job's result, or raises if the job fails.
+            Cancelling it stops tracking the job but does not cancel the job itself.
+
+        Raises:
+            ValueError: If the job kind is unknown
+            Exception: If the monitor has been closed or is running on another event loop
+        """
+        future = asyncio.get_running_loop().create_future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        self._track(_MonitoredJob(kind, id, future, self.app._poller(poll_strategy)))
+        return future
+
+    def _track(self, job: _MonitoredJob) -> None:
+        """
+        Schedule a job for its first status check, starting the polling task if needed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._closed:
+            raise Exception('JobMonitor is closed')
+        if self._task is not None and not self._task.done() and self._task.get_loop() is not loop:
+            raise Exception('JobMonitor is already running on another event loop')
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        self._schedule_job(job, 0)
+
+    def pending(self) -> int:
+        """
+        Return the number of jobs still being tracked.
+        """
+        return len(self._schedule) + sum(1 for job in self._checks.values() if not job.future.done())
+
+    def close(self) -> None:
+        """
+        Stop the polling task and cancel the futures of jobs that have not finished.
+        """
+        self._closed = True
+        schedule, self._schedule = self._schedule, []
+        checks, self._checks = self._checks, {}
+        if self._task is not None:
+            self._task.cancel()
+        for check in checks:
+            check.cancel()
+        for job in itertools.chain((job for _, _, job in schedule), checks.values()):
+            job.future.cancel()
+
+    async def aclose(self) -> None:
+        """
+        Stop the polling task, wait for it to exit and cancel the futures of unfinished jobs.
+        """
+        self.close()
+        if self._task is not None and self._task.get_loop() is asyncio.get_running_loop():
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    def _schedule_job(self, job: _MonitoredJob, delay: float) -> None:
+        heapq.heappush(self._schedule, (time.monotonic() + delay, next(self._counter), job))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def check(job: _MonitoredJob) -> None:
+            try:
+                async with semaphore:
+                    delay = await self._async_check(job)
+            finally:
+                self._checks.pop(asyncio.current_task(), None)
+            if delay is not None and not self._closed:
+                self._schedule_job(job, delay)
+
+        while not self._closed:
+            self._wakeup.clear()
+            timeout = self._schedule[0][0] - time.monotonic() if self._schedule else None
+            if timeout is None or timeout > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                continue
+            now = time.monotonic()
+            while self._schedule and self._schedule[0][0] <= now:
+                job = heapq.heappop(self._schedule)[2]
+                # Each check runs in its own task, so a slow one never holds up the others
+                if not job.future.cancelled():
+                    self._checks[asyncio.ensure_future(check(job))] = job
+
+    async def _async_check(self, job: _MonitoredJob) -> Optional[float]:
+        """
+        Check a job's status once and settle its future if the job has finished.
+
+        Returns:
+            Optional[float]: Seconds until the next check, or None if the job has finished.
+        """
+        try:
+            hints: Dict[str, Any] = {}
+            status = await self.app._async_get_request(
+                f'{self.app.api_url}{job.url_path}', self.app._prepare_headers(), hints=hints)
+            job.status = status
+            error = job.failure(status)
+            if error is not None:
+                _settle_future(job.future, exception=error)
+            elif status.get('status') == 'completed':
+                if job.kind == 'crawl':
+                    result = await self.app.check_crawl_status(job.id)
+                elif job.kind == 'batch_scrape':
+                    result = await self.app.check_batch_scrape_status(job.id)
+                else:
+                    result = job.finished_result(status)
+                _settle_future(job.future, result=result)
+            else:
+                return job.poller.next_delay(status, hints.get('retry_after'))
+        except Exception as e:
+            _settle_future(job.future, exception=e)
+        return None
+
+class AsyncJobHandle(_JobProgress, asyncio.Future):
+    """
+    A running crawl or batch scrape job, returned by the AsyncFirecrawlApp versions of
+    async_crawl_url and async_batch_scrape_urls when called with return_handle=True.
+
+    The handle is an asyncio.Future resolved by the client's job monitor, so it can be awaited
+    and works with asyncio.wait, as_completed and gather. Cancelling it cancels the job.
+    """
+    def __init__(
+            self,
+            app: AsyncFirecrawlApp,
+            kind: Literal['crawl', 'batch_scrape'],
+            response: Union[CrawlResponse, BatchScrapeResponse]) -> None:
+        """
+        Args:
+            app (AsyncFirecrawlApp): The client that started the job
+            kind (str): 'crawl' or 'batch_scrape'
+            response (Union[CrawlResponse, BatchScrapeResponse]): The response that started the job
+        """
+        super().__init__(loop=asyncio.get_running_loop())
+        self.app = app
+        self.kind = kind
+        self.id = response.id
+        self.response = response
+        self.cancel_error: Optional[Exception] = None
+        self._cancel_task: Optional[asyncio.Task] = None
+        self._job = _MonitoredJob(kind, response.id, self, app._poller())
+        app.job_monitor._track(self._job)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.kind} {self.id} status={self.status!r}>'
+
+    def cancel(self, *args, **kwargs) -> bool:
+        """
+        Stop tracking the job and cancel it on the server in a background task.
+        Use acancel to wait for the cancellation request and see its errors. If the request fails,
+        the handle stays cancelled while the job may keep running on the server; the error is
+        logged and kept in cancel_error.
+
+        Returns:
+            bool: False if the job had already finished, True otherwise.
+        """
+        if not super().cancel(*args, **kwargs):
+            return False
+        self._cancel_task = self.get_loop().create_task(self._cancel_remote())
+        return True
+
+    async def acancel(self) -> bool:
+        """
+        Stop tracking the job and cancel it on the server, waiting for the cancellation request.
+
+        The handle is cancelled before the request is sent. If the request fails, the handle stays
+        cancelled while the job may keep running on the server: the error is raised and kept in cancel_error.
+
+        Returns:
+            bool: False if the job had already finished, True otherwise.
+
+        Raises:
+            Exception: If the cancellation request fails
+        """
+        if not super().cancel():
+            return False
+        await self._cancel_remote()
+        return True
+
+    async def _cancel_remote(self) -> None:
+        try:
+            if self.kind == 'crawl':
+                await self.app.cancel_crawl(self.id)
+            else:
+                await self.app.cancel_batch_scrape(self.id)
+        except Exception as e:
+            self.cancel_error = e
+            if self._cancel_task is None or self._cancel_task is not asyncio.current_task():
+                raise Exception(_cancel_failed_message(self, e)) from e
+            logger.error(_cancel_failed_message(self, e))
+
+class AsyncBatchScrapeGroup(BatchScrapeGroup):
+    """
+    The batch scrape jobs started for one URL list split into chunks by
+    AsyncFirecrawlApp.async_batch_scrape_urls_chunked, read as a single job.
+    """
+    app: AsyncFirecrawlApp
+
+    async def refresh(self) -> 'AsyncBatchScrapeGroup':
+        """
+        Check the status of every unfinished job once, updating the progress counters.
+
+        Returns:
+            AsyncBatchScrapeGroup: This group
+
+        Raises:
+            Exception: If a status request fails
+        """
+        headers = self.app._prepare_headers()
+        slots = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(id: str) -> None:
+            async with slots:
+                page = await self.app._async_get_request(f'{self._status_url(id)}?limit=1', headers)
+            self._statuses[id] = {key: value for key, value in page.items() if key != 'data'}
+
+        await asyncio.gather(*(fetch(id) for id in self._unfinished()))
+        return self
+
+    async def iter_documents(self, poll_interval: int = 2) -> AsyncIterator[FirecrawlDocument]:
+        """
+        Iterate over the documents of all jobs as they are scraped.
+
+        Every unfinished job is polled each round, following its `next` link so that only
+        documents scraped since the previous round are downloaded. Documents of different
+        jobs are interleaved; within a job they keep their result order.
+
+        Args:
+            poll_interval (int): Seconds before the second round of status checks (default: 2)
+
+        Yields:
+            FirecrawlDocument: Each scraped document
+
+        Raises:
+            Exception: If a job fails or is cancelled, or a status request fails
+        """
+        headers = self.app._prepare_headers()
+        cursors = {id: self._status_url(id) for id in self.ids}
+        poller = self.app._poller(self.poll_strategy, poll_interval)
+        slots = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(id: str) -> Tuple[Dict[str, Any], Optional[float]]:
+            hints: Dict[str, Any] = {}
+            async with slots:
+                page = await self.app._async_get_request(cursors[id], headers, hints=hints)
+            return page, hints.get('retry_after')
+
+        while cursors:
+            ids = list(cursors)
+            draining = False
+            retry_after = None
+            for id, (page, hint) in zip(ids, await asyncio.gather(*(fetch(id) for id in ids))):
+                draining = self._advance(id, page, cursors) or draining
+                if hint is not None:
+                    retry_after = max(retry_after or 0, hint)
+                for document in page.get('data') or []:
+                    yield self.app._build_document(document)
+            if cursors and not draining:
+                await poller.async_wait({'status': self.status, 'completed': self.completed, 'total': self.total}, retry_after)
+
+    async def cancel(self) -> None:
+        """
+        Cancel every job of the group that has not finished.
+
+        Raises:
+            Exception: If a cancellation request fails
+        """
+        for id in self._unfinished():
+            await self.app.cancel_batch_scrape(id)
+            self._statuses.setdefault(id, {})['status'] = 'cancelled'
@@ -36,6 +36,12 @@ setup(
         'pydantic',
         'aiohttp'
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'fast-json': ['orjson'],
+        'streaming': ['ijson'],
+        'compression': ['brotli', 'zstandard', "backports.zstd; python_version < '3.14'"],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -2,10 +2,10 @@ import unittest
 from unittest.mock import patch, MagicMock
 import json
 import os
-from firecrawl import FirecrawlApp
+from firecrawl import FirecrawlApp, ChangeTrackingOptions
 
 class TestChangeTracking(unittest.TestCase):
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_change_tracking_format(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -20,21 +20,20 @@ class TestChangeTracking(unittest.TestCase):
                 }
             }
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
 
         app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
-        result = app.scrape_url('https://example.com', {
-            'formats': ['markdown', 'changeTracking']
-        })
+        result = app.scrape_url('https://example.com', formats=['markdown', 'changeTracking'])
 
         args, kwargs = mock_post.call_args
-        self.assertEqual(kwargs['json']['formats'], ['markdown', 'changeTracking'])
+        self.assertEqual(json.loads(kwargs['data'])['formats'], ['markdown', 'changeTracking'])
         
-        self.assertEqual(result['changeTracking']['previousScrapeAt'], '2023-01-01T00:00:00Z')
-        self.assertEqual(result['changeTracking']['changeStatus'], 'changed')
-        self.assertEqual(result['changeTracking']['visibility'], 'visible')
+        self.assertEqual(result.changeTracking.previousScrapeAt, '2023-01-01T00:00:00Z')
+        self.assertEqual(result.changeTracking.changeStatus, 'changed')
+        self.assertEqual(result.changeTracking.visibility, 'visible')
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_change_tracking_options(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -78,21 +77,23 @@ class TestChangeTracking(unittest.TestCase):
                 }
             }
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
 
         app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
-        result = app.scrape_url('https://example.com', {
-            'formats': ['markdown', 'changeTracking'],
-            'changeTrackingOptions': {
-                'modes': ['git-diff', 'json'],
-                'schema': {'type': 'object', 'properties': {'title': {'type': 'string'}}}
-            }
-        })
+        result = app.scrape_url(
+            'https://example.com',
+            formats=['markdown', 'changeTracking'],
+            change_tracking_options=ChangeTrackingOptions(
+                modes=['git-diff', 'json'],
+                schema={'type': 'object', 'properties': {'title': {'type': 'string'}}}
+            )
+        )
 
         args, kwargs = mock_post.call_args
-        self.assertEqual(kwargs['json']['formats'], ['markdown', 'changeTracking'])
-        self.assertEqual(kwargs['json']['changeTrackingOptions']['modes'], ['git-diff', 'json'])
+        self.assertEqual(json.loads(kwargs['data'])['formats'], ['markdown', 'changeTracking'])
+        self.assertEqual(json.loads(kwargs['data'])['changeTrackingOptions']['modes'], ['git-diff', 'json'])
         
-        self.assertEqual(result['changeTracking']['diff']['text'], '@@ -1,1 +1,1 @@\n-old content\n+new content')
-        self.assertEqual(result['changeTracking']['json']['title']['previous'], 'Old Title')
-        self.assertEqual(result['changeTracking']['json']['title']['current'], 'New Title')
+        self.assertEqual(result.changeTracking.diff['text'], '@@ -1,1 +1,1 @@\n-old content\n+new content')
+        self.assertEqual(result.changeTracking.json['title']['previous'], 'Old Title')
+        self.assertEqual(result.changeTracking.json['title']['current'], 'New Title')
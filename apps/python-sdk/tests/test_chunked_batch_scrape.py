@@ -0,0 +1,116 @@
+import unittest
+import uuid
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, PollingStrategy, BatchScrapeGroup
+
+from tests.test_pagination import FakeJobAPI
+
+
+FAST_POLLING = PollingStrategy(interval=0.01, min_interval=0.01, max_interval=0.05, jitter=0)
+
+
+def _chunk_documents(job, count):
+    return [{'markdown': f'{job} page {i}', 'metadata': {'sourceURL': f'https://example.com/{job}/{i}'}} for i in range(count)]
+
+
+class TestChunkedBatchScrape(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI(page_size=2).start()
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING)
+
+    def tearDown(self):
+        self.app.close()
+        self.api.stop()
+
+    def test_urls_are_split_into_chunks_with_their_own_keys(self):
+        for job in ('batch-0', 'batch-1', 'batch-2'):
+            self.api.add_job('batch/scrape', job, _chunk_documents(job, 3))
+        urls = (f'https://example.com/{i}' for i in range(7))
+        key = str(uuid.uuid4())
+
+        group = self.app.async_batch_scrape_urls_chunked(urls, chunk_size=3, max_submissions=1, idempotency_key=key)
+
+        self.assertIsInstance(group, BatchScrapeGroup)
+        self.assertEqual(group.ids, ['batch-0', 'batch-1', 'batch-2'])
+        self.assertEqual([len(start['urls']) for start in self.api.started], [3, 3, 1])
+        keys = [start['idempotency_key'] for start in self.api.started]
+        self.assertEqual(len(set(keys)), 3)
+        self.assertEqual(keys[0], str(uuid.uuid5(uuid.UUID(key), '0')))
+
+    def test_documents_of_all_jobs_are_merged(self):
+        self.api.add_job('batch/scrape', 'batch-0', _chunk_documents('batch-0', 5), polls_until_done=3, scraped_per_poll=1)
+        self.api.add_job('batch/scrape', 'batch-1', _chunk_documents('batch-1', 4))
+
+        group = self.app.async_batch_scrape_urls_chunked([f'https://example.com/{i}' for i in range(9)], chunk_size=5)
+        markdown = [document.markdown for document in group.iter_documents()]
+
+        self.assertEqual(sorted(markdown), sorted([f'batch-0 page {i}' for i in range(5)] + [f'batch-1 page {i}' for i in range(4)]))
+        self.assertEqual([m for m in markdown if m.startswith('batch-0')], [f'batch-0 page {i}' for i in range(5)])
+        self.assertEqual((group.status, group.completed, group.total), ('completed', 9, 9))
+
+    def test_refresh_sums_progress(self):
+        self.api.add_job('batch/scrape', 'batch-0', _chunk_documents('batch-0', 3), polls_until_done=5, scraped_per_poll=1)
+        self.api.add_job('batch/scrape', 'batch-1', _chunk_documents('batch-1', 2))
+
+        group = self.app.async_batch_scrape_urls_chunked([f'https://example.com/{i}' for i in range(4)], chunk_size=2)
+        group.refresh()
+
+        self.assertEqual(group.status, 'scraping')
+        self.assertEqual(group.completed, 3)
+
+    def test_chunks_that_fail_to_start_are_kept(self):
+        self.api.add_job('batch/scrape', 'batch-0', _chunk_documents('batch-0', 2))
+
+        group = self.app.async_batch_scrape_urls_chunked(['https://a.com', 'https://b.com', 'https://c.com'], chunk_size=2, max_submissions=1)
+
+        self.assertEqual(group.ids, ['batch-0'])
+        self.assertEqual(len(group.failed_chunks), 1)
+        self.assertEqual(group.failed_chunks[0][0], ['https://c.com'])
+
+    def test_nothing_started(self):
+        with self.assertRaises(Exception):
+            self.app.async_batch_scrape_urls_chunked(['https://a.com'])
+
+    def test_failed_job_raises_while_iterating(self):
+        self.api.add_job('batch/scrape', 'batch-0', _chunk_documents('batch-0', 2), status='failed')
+
+        group = self.app.async_batch_scrape_urls_chunked(['https://a.com'])
+
+        with self.assertRaises(Exception):
+            list(group.iter_documents())
+
+
+class TestAsyncChunkedBatchScrape(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeJobAPI(page_size=2).start()
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def test_documents_of_all_jobs_are_merged(self):
+        self.api.add_job('batch/scrape', 'batch-0', _chunk_documents('batch-0', 3), polls_until_done=2, scraped_per_poll=2)
+        self.api.add_job('batch/scrape', 'batch-1', _chunk_documents('batch-1', 3))
+        self.api.add_job('batch/scrape', 'batch-2', _chunk_documents('batch-2', 1))
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING) as app:
+            group = await app.async_batch_scrape_urls_chunked([f'https://example.com/{i}' for i in range(7)], chunk_size=3)
+            markdown = [document.markdown async for document in group.iter_documents()]
+
+        self.assertEqual(len(markdown), 7)
+        self.assertEqual(sorted(group.ids), ['batch-0', 'batch-1', 'batch-2'])
+        self.assertEqual(group.completed, 7)
+        self.assertEqual(len({start['idempotency_key'] for start in self.api.started}), 3)
+
+    async def test_cancel_cancels_unfinished_jobs(self):
+        self.api.add_job('batch/scrape', 'batch-0', _chunk_documents('batch-0', 2), polls_until_done=1000)
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING) as app:
+            group = await app.async_batch_scrape_urls_chunked(['https://a.com', 'https://b.com'])
+            await group.cancel()
+
+        self.assertEqual(self.api.cancelled, ['batch-0'])
+        self.assertEqual(group.status, 'failed')
+
+
+if __name__ == '__main__':
+    unittest.main()
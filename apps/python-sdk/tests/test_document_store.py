@@ -0,0 +1,125 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from firecrawl import FirecrawlApp, SQLiteDocumentStore
+from firecrawl.firecrawl import FirecrawlDocument, DocumentView
+
+from tests.test_pagination import FakeJobAPI, _documents
+
+
+def _page(url, markdown, title='Page'):
+    return {'markdown': markdown, 'html': f'<p>{markdown}</p>', 'metadata': {'sourceURL': url, 'title': title}}
+
+
+class TestSQLiteDocumentStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'documents.db')
+        self.store = SQLiteDocumentStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def _body_count(self):
+        with sqlite3.connect(self.path) as connection:
+            return connection.execute('SELECT COUNT(*) FROM bodies').fetchone()[0]
+
+    def test_documents_round_trip(self):
+        self.store.add(FirecrawlDocument(**_page('https://example.com', 'hello')))
+        self.store.add(DocumentView(_page('https://example.org', 'world')))
+
+        document = self.store.get_document('https://example.com')
+
+        self.assertEqual(document.markdown, 'hello')
+        self.assertEqual(document.html, '<p>hello</p>')
+        self.assertEqual(document.metadata['title'], 'Page')
+        self.assertEqual(self.store.get_document('https://example.org').markdown, 'world')
+        self.assertIsNone(self.store.get_document('https://example.net'))
+
+    def test_identical_content_is_stored_once(self):
+        self.store.add_documents([_page('https://example.com', 'same', title='First'),
+                                  _page('https://example.com', 'same', title='Second'),
+                                  _page('https://example.org', 'same')])
+
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self._body_count(), 2)
+        self.assertEqual(self.store.get_document('https://example.com').metadata['title'], 'Second')
+
+    def test_zlib_fallback_is_readable(self):
+        zlib_store = SQLiteDocumentStore(self.path, compression='zlib')
+        zlib_store.add(_page('https://example.com', 'compressed'))
+        zlib_store.close()
+
+        self.assertEqual(self.store.get_document('https://example.com').markdown, 'compressed')
+
+    @patch('firecrawl.firecrawl.zstandard', None)
+    def test_zstd_requires_zstandard(self):
+        with self.assertRaises(ImportError):
+            SQLiteDocumentStore(self.path, compression='zstd')
+
+    def test_history_by_url_and_time(self):
+        self.store.add(_page('https://example.com', 'v1'), scraped_at=1000)
+        self.store.add(_page('https://example.com', 'v2'), scraped_at=2000)
+        self.store.add(_page('https://example.org', 'other'), scraped_at=1500)
+
+        history = [(at, document.markdown) for at, document in self.store.iter_documents('https://example.com')]
+        recent = [document.markdown for _, document in self.store.iter_documents(since=1500)]
+
+        self.assertEqual(history, [(1000, 'v1'), (2000, 'v2')])
+        self.assertEqual(recent, ['v2', 'other'])
+        self.assertIsNone(self.store.get_document('https://example.com', max_age=60))
+
+    def test_prune_removes_old_documents_and_unused_content(self):
+        self.store.add(_page('https://example.com', 'old'), scraped_at=1000)
+        self.store.add(_page('https://example.com', 'new'), scraped_at=2000)
+
+        self.assertEqual(self.store.prune(before=1500), 1)
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(self._body_count(), 2)
+
+    def test_cache_interface(self):
+        self.store.set('key-1', _page('https://example.com', 'cached'))
+
+        self.assertEqual(self.store.get('key-1')['markdown'], 'cached')
+        self.assertIsNone(self.store.get('key-2'))
+        with patch('firecrawl.firecrawl.time.time', return_value=10 ** 10):
+            self.assertIsNone(self.store.get('key-1', max_age=60))
+
+
+class TestDocumentStoreWithClient(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'documents.db')
+
+    def tearDown(self):
+        self.api.stop()
+        self.directory.cleanup()
+
+    def test_scrape_cache_survives_restarts(self):
+        for _ in range(2):
+            with SQLiteDocumentStore(self.path) as store:
+                with FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, scrape_cache=store) as app:
+                    result = app.scrape_url('https://example.com', formats=['markdown'])
+
+        self.assertEqual(result.markdown, '# https://example.com')
+        self.assertEqual(len(self.api.scraped), 1)
+
+    def test_crawl_results_sink(self):
+        self.api.add_job('crawl', 'job-1', _documents(7))
+
+        with SQLiteDocumentStore(self.path) as store:
+            with FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+                stored = store.add_documents(app.iter_crawl_documents('job-1'), batch_size=3)
+            document = store.get_document('https://example.com/4')
+
+        self.assertEqual(stored, 7)
+        self.assertEqual(document.markdown, 'page 4')
+
+
+if __name__ == '__main__':
+    unittest.main()
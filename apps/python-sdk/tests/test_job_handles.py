@@ -0,0 +1,145 @@
+import asyncio
+import concurrent.futures
+import unittest
+from unittest.mock import patch
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, PollingStrategy, JobHandle, AsyncJobHandle
+
+from tests.test_pagination import FakeJobAPI, _documents
+
+
+FAST_POLLING = PollingStrategy(interval=0.01, min_interval=0.01, max_interval=0.05, jitter=0)
+
+
+class TestJobHandle(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING)
+
+    def tearDown(self):
+        self.app.close()
+        self.api.stop()
+
+    def test_async_crawl_url_returns_bare_response_by_default(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(1))
+
+        response = self.app.async_crawl_url('https://example.com')
+
+        self.assertNotIsInstance(response, JobHandle)
+        self.assertEqual(response.id, 'crawl-1')
+
+    def test_handles_compose_with_as_completed(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(5), polls_until_done=3, scraped_per_poll=1)
+        self.api.add_job('batch/scrape', 'batch-1', _documents(2), polls_until_done=1)
+
+        crawl = self.app.async_crawl_url('https://example.com', return_handle=True)
+        batch = self.app.async_batch_scrape_urls(['https://example.com'], return_handle=True)
+        finished = [handle.id for handle in concurrent.futures.as_completed([crawl, batch], timeout=10)]
+
+        self.assertEqual(sorted(finished), ['batch-1', 'crawl-1'])
+        self.assertEqual([d.markdown for d in crawl.result().data], [f'page {i}' for i in range(5)])
+        self.assertEqual(batch.result(timeout=0).completed, 2)
+        self.assertEqual(crawl.status, 'completed')
+        self.assertEqual(crawl.completed, 5)
+
+    def test_cancel_cancels_the_job(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(3), polls_until_done=1000)
+
+        handle = self.app.async_crawl_url('https://example.com', return_handle=True)
+
+        self.assertTrue(handle.cancel())
+        self.assertTrue(handle.cancelled())
+        self.assertEqual(self.api.cancelled, ['crawl-1'])
+        with self.assertRaises(concurrent.futures.CancelledError):
+            handle.result(timeout=0)
+
+    def test_cancelled_handles_are_done_for_wait_and_as_completed(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(3), polls_until_done=1000)
+        self.api.add_job('batch/scrape', 'batch-1', _documents(2), polls_until_done=1)
+
+        crawl = self.app.async_crawl_url('https://example.com', return_handle=True)
+        batch = self.app.async_batch_scrape_urls(['https://example.com'], return_handle=True)
+        crawl.cancel()
+
+        done, not_done = concurrent.futures.wait([crawl, batch], timeout=10)
+        self.assertEqual(done, {crawl, batch})
+        self.assertFalse(not_done)
+        finished = list(concurrent.futures.as_completed([crawl, batch], timeout=10))
+        self.assertCountEqual(finished, [crawl, batch])
+
+    def test_cancelling_twice_sends_one_cancellation(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(3), polls_until_done=1000)
+        handle = self.app.async_crawl_url('https://example.com', return_handle=True)
+
+        self.assertTrue(handle.cancel())
+        self.assertTrue(handle.cancel())
+
+        self.assertEqual(self.api.cancelled, ['crawl-1'])
+
+    def test_failed_remote_cancel_is_reported(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(3), polls_until_done=1000)
+        handle = self.app.async_crawl_url('https://example.com', return_handle=True)
+
+        with patch.object(self.app, 'cancel_crawl', side_effect=Exception('Unavailable')):
+            with self.assertRaisesRegex(Exception, 'may still be running: Unavailable'):
+                handle.cancel()
+
+        self.assertTrue(handle.cancelled())
+        self.assertEqual(str(handle.cancel_error), 'Unavailable')
+
+    def test_cancel_after_completion_is_a_no_op(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(2))
+
+        handle = self.app.async_crawl_url('https://example.com', return_handle=True)
+        handle.result(timeout=10)
+
+        self.assertFalse(handle.cancel())
+        self.assertEqual(self.api.cancelled, [])
+
+
+class TestAsyncJobHandle(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def test_handles_can_be_awaited_together(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(4), polls_until_done=2, scraped_per_poll=2)
+        self.api.add_job('batch/scrape', 'batch-1', _documents(3), polls_until_done=1)
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING) as app:
+            crawl = await app.async_crawl_url('https://example.com', return_handle=True)
+            batch = await app.async_batch_scrape_urls(['https://example.com'], return_handle=True)
+            self.assertIsInstance(crawl, AsyncJobHandle)
+            done, pending = await asyncio.wait([crawl, batch], timeout=10)
+
+        self.assertFalse(pending)
+        self.assertEqual([d.markdown for d in crawl.result().data], [f'page {i}' for i in range(4)])
+        self.assertEqual((await batch).completed, 3)
+
+    async def test_acancel_cancels_the_job(self):
+        self.api.add_job('batch/scrape', 'batch-1', _documents(3), polls_until_done=1000)
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING) as app:
+            handle = await app.async_batch_scrape_urls(['https://example.com'], return_handle=True)
+            self.assertTrue(await handle.acancel())
+
+        self.assertTrue(handle.cancelled())
+        self.assertEqual(self.api.cancelled, ['batch-1'])
+
+    async def test_failed_remote_acancel_is_reported(self):
+        self.api.add_job('batch/scrape', 'batch-1', _documents(3), polls_until_done=1000)
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING) as app:
+            handle = await app.async_batch_scrape_urls(['https://example.com'], return_handle=True)
+            with patch.object(app, 'cancel_batch_scrape', side_effect=Exception('Unavailable')):
+                with self.assertRaisesRegex(Exception, 'may still be running'):
+                    await handle.acancel()
+
+        self.assertTrue(handle.cancelled())
+        self.assertIsNotNone(handle.cancel_error)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import asyncio
+import concurrent.futures
+import threading
+import unittest
+from unittest.mock import patch
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, PollingStrategy, JobMonitor, AsyncJobMonitor
+
+from tests.test_pagination import FakeJobAPI, _documents
+
+
+FAST_POLLING = PollingStrategy(interval=0.01, min_interval=0.01, max_interval=0.05, jitter=0)
+
+
+class TestJobMonitor(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING)
+
+    def tearDown(self):
+        self.app.close()
+        self.api.stop()
+
+    def test_tracks_many_jobs_on_one_thread(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(5), polls_until_done=3, scraped_per_poll=1)
+        self.api.add_job('crawl', 'crawl-2', _documents(2), polls_until_done=1)
+        self.api.add_job('batch/scrape', 'batch-1', _documents(4), polls_until_done=2)
+        self.api.add_job('extract', 'extract-1', [{'name': 'Firecrawl'}], polls_until_done=2)
+
+        futures = {
+            'crawl-1': self.app.job_monitor.watch('crawl', 'crawl-1'),
+            'crawl-2': self.app.job_monitor.watch('crawl', 'crawl-2'),
+            'batch-1': self.app.job_monitor.watch('batch_scrape', 'batch-1'),
+            'extract-1': self.app.job_monitor.watch('extract', 'extract-1'),
+        }
+        done, not_done = concurrent.futures.wait(futures.values(), timeout=10)
+
+        self.assertFalse(not_done)
+        self.assertEqual([d.markdown for d in futures['crawl-1'].result().data], [f'page {i}' for i in range(5)])
+        self.assertEqual(len(futures['crawl-2'].result().data), 2)
+        self.assertEqual(futures['batch-1'].result().completed, 4)
+        self.assertEqual(futures['extract-1'].result().data, [{'name': 'Firecrawl'}])
+        self.assertEqual([t.name for t in threading.enumerate()].count('firecrawl-job-monitor'), 1)
+        self.assertEqual(self.app.job_monitor.pending(), 0)
+
+    def test_failed_job_raises_from_future(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(2), status='failed')
+
+        future = self.app.job_monitor.watch('crawl', 'crawl-1')
+
+        with self.assertRaises(Exception):
+            future.result(timeout=10)
+
+    def test_callback_receives_future(self):
+        self.api.add_job('batch/scrape', 'batch-1', _documents(3), polls_until_done=1)
+        finished = threading.Event()
+        results = []
+
+        def on_done(future):
+            results.append(future.result().completed)
+            finished.set()
+
+        self.app.job_monitor.watch('batch_scrape', 'batch-1', callback=on_done)
+
+        self.assertTrue(finished.wait(10))
+        self.assertEqual(results, [3])
+
+    def test_close_cancels_unfinished_jobs(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(2), polls_until_done=1000)
+        monitor = JobMonitor(self.app)
+
+        future = monitor.watch('crawl', 'crawl-1')
+        monitor.close()
+
+        self.assertTrue(future.cancelled())
+        with self.assertRaises(Exception):
+            monitor.watch('crawl', 'crawl-1')
+
+    def test_cancelled_futures_are_done_for_wait_and_as_completed(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(2), polls_until_done=1000)
+        self.api.add_job('crawl', 'crawl-2', _documents(2), polls_until_done=1000)
+        monitor = JobMonitor(self.app)
+
+        dropped = monitor.watch('crawl', 'crawl-1', poll_strategy=FAST_POLLING)
+        closed = monitor.watch('crawl', 'crawl-2', poll_strategy=FAST_POLLING)
+        dropped.cancel()
+        done, _ = concurrent.futures.wait([dropped], timeout=10)
+        self.assertEqual(done, {dropped})
+        monitor.close()
+
+        self.assertCountEqual(concurrent.futures.as_completed([dropped, closed], timeout=10), [dropped, closed])
+        self.assertTrue(closed.cancelled())
+        self.assertEqual(monitor.pending(), 0)
+
+    def test_slow_result_download_does_not_hold_up_other_jobs(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(2))
+        self.api.add_job('crawl', 'crawl-2', _documents(2), polls_until_done=3)
+        release = threading.Event()
+        check_crawl_status = self.app.check_crawl_status
+
+        def slow_download(id, *args, **kwargs):
+            if id == 'crawl-1':
+                release.wait(10)
+            return check_crawl_status(id, *args, **kwargs)
+
+        with patch.object(self.app, 'check_crawl_status', side_effect=slow_download):
+            slow = self.app.job_monitor.watch('crawl', 'crawl-1')
+            fast = self.app.job_monitor.watch('crawl', 'crawl-2')
+
+            self.assertEqual(len(fast.result(timeout=5).data), 2)
+            self.assertFalse(slow.done())
+            release.set()
+            self.assertEqual(len(slow.result(timeout=10).data), 2)
+
+    def test_unknown_job_kind(self):
+        with self.assertRaises(ValueError):
+            self.app.job_monitor.watch('scrape', 'job-1')
+
+
+class TestAsyncJobMonitor(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def test_tracks_many_jobs_on_one_task(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(4), polls_until_done=2, scraped_per_poll=2)
+        self.api.add_job('batch/scrape', 'batch-1', _documents(3), polls_until_done=3)
+        self.api.add_job('extract', 'extract-1', [{'name': 'Firecrawl'}], polls_until_done=1)
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING) as app:
+            self.assertIsInstance(app.job_monitor, AsyncJobMonitor)
+            crawl, batch, extract = await asyncio.wait_for(asyncio.gather(
+                app.job_monitor.watch('crawl', 'crawl-1'),
+                app.job_monitor.watch('batch_scrape', 'batch-1'),
+                app.job_monitor.watch('extract', 'extract-1'),
+            ), 10)
+
+        self.assertEqual([d.markdown for d in crawl.data], [f'page {i}' for i in range(4)])
+        self.assertEqual(batch.completed, 3)
+        self.assertEqual(extract.data, [{'name': 'Firecrawl'}])
+
+    async def test_aclose_cancels_unfinished_jobs(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(2), polls_until_done=1000)
+
+        app = AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING)
+        future = app.job_monitor.watch('crawl', 'crawl-1')
+        await asyncio.sleep(0.05)
+        await app.aclose()
+
+        self.assertTrue(future.cancelled())
+
+    async def test_slow_result_download_does_not_hold_up_other_jobs(self):
+        self.api.add_job('crawl', 'crawl-1', _documents(2))
+        self.api.add_job('crawl', 'crawl-2', _documents(2), polls_until_done=3)
+        release = asyncio.Event()
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, poll_strategy=FAST_POLLING) as app:
+            check_crawl_status = app.check_crawl_status
+
+            async def slow_download(id, *args, **kwargs):
+                if id == 'crawl-1':
+                    await release.wait()
+                return await check_crawl_status(id, *args, **kwargs)
+
+            with patch.object(app, 'check_crawl_status', side_effect=slow_download):
+                slow = app.job_monitor.watch('crawl', 'crawl-1')
+                fast = app.job_monitor.watch('crawl', 'crawl-2')
+
+                self.assertEqual(len((await asyncio.wait_for(fast, 5)).data), 2)
+                self.assertFalse(slow.done())
+                release.set()
+                self.assertEqual(len((await asyncio.wait_for(slow, 5)).data), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
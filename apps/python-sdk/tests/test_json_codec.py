@@ -0,0 +1,73 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from firecrawl import FirecrawlApp, JsonCodec
+from firecrawl.firecrawl import CrawlWatcher, OrjsonCodec, MsgspecCodec, orjson, msgspec
+
+
+class _RecordingCodec(JsonCodec):
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append('dumps')
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.calls.append('loads')
+        return super().loads(data)
+
+
+class TestJsonCodec(unittest.TestCase):
+    def test_auto_prefers_installed_fast_codec(self):
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing')
+        if orjson is not None:
+            self.assertIsInstance(app.json_codec, OrjsonCodec)
+        elif msgspec is not None:
+            self.assertIsInstance(app.json_codec, MsgspecCodec)
+        else:
+            self.assertEqual(app.json_codec.name, 'json')
+
+    def test_unknown_codec_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FirecrawlApp(api_key='dummy-api-key-for-testing', json_codec='simplejson')
+
+    @unittest.skipIf(msgspec is None, 'msgspec is not installed')
+    def test_msgspec_decode_errors_are_value_errors(self):
+        with self.assertRaises(ValueError):
+            MsgspecCodec().loads(b'not json')
+
+    @patch('requests.Session.get')
+    def test_codec_is_used_for_responses(self, mock_get):
+        response = MagicMock()
+        response.status_code = 200
+        response.content = json.dumps({'errors': [], 'robotsBlocked': ['https://example.com/private']}).encode()
+        mock_get.return_value = response
+        codec = _RecordingCodec()
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', json_codec=codec)
+
+        result = app.check_crawl_errors('job-id')
+
+        self.assertEqual(result.robotsBlocked, ['https://example.com/private'])
+        self.assertEqual(codec.calls, ['loads'])
+
+    def test_crawl_watcher_decodes_messages_with_codec(self):
+        codec = _RecordingCodec()
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', json_codec=codec)
+        watcher = CrawlWatcher('job-id', app)
+        documents = []
+        watcher.add_event_listener('document', lambda detail: documents.append(detail['data']))
+
+        async def messages():
+            yield json.dumps({'type': 'document', 'data': {'markdown': '# Hello'}})
+
+        asyncio.run(watcher._listen(messages()))
+
+        self.assertEqual(documents, [{'markdown': '# Hello'}])
+        self.assertEqual(codec.calls, ['loads'])
+
+
+if __name__ == '__main__':
+    unittest.main()
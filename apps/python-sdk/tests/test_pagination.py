@@ -0,0 +1,400 @@
+import asyncio
+import collections
+import threading
+import time
+import unittest
+import urllib.parse
+from unittest.mock import patch
+
+from aiohttp import web
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, PollingStrategy
+
+
+class FakeJobAPI:
+    """
+    Serves crawl and batch scrape status pages the way the Firecrawl API paginates them, single scrapes and
+    maps, on a background event loop so both the sync and async clients can talk to it. Web pages added to
+    pages are served under /pages/ with their validators, and scraping one returns its content.
+    """
+    def __init__(self, page_size=3):
+        self.page_size = page_size
+        self.short_pages = set()
+        self.jobs = {}
+        self.unstarted = {}
+        self.cancelled = []
+        self.started = []
+        self.requests = []
+        self.scrape_delay = 0
+        self.failing_urls = set()
+        self.scraped = []
+        self.in_flight = collections.Counter()
+        self.peak_in_flight = collections.Counter()
+        self.pages = {}
+        self.probed = []
+        self.throttled = 0
+        self.retry_after = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def add_job(self, kind, id, documents, status='completed', polls_until_done=0, scraped_per_poll=0):
+        self.jobs[(kind, id)] = {
+            'documents': documents,
+            'status': status,
+            'polls': polls_until_done,
+            'scraped_per_poll': scraped_per_poll,
+            'scraped': 0,
+        }
+        self.unstarted.setdefault(kind, []).append(id)
+
+    def start(self):
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _start(self):
+        web_app = web.Application()
+        web_app.router.add_post('/v1/scrape', self._scrape_handler)
+        web_app.router.add_post('/v1/map', self._map_handler)
+        web_app.router.add_get('/pages/{name}', self._page_handler)
+        web_app.router.add_get('/v1/crawl/{id}', self._status_handler('crawl'))
+        web_app.router.add_get('/v1/batch/scrape/{id}', self._status_handler('batch/scrape'))
+        web_app.router.add_get('/v1/extract/{id}', self._status_handler('extract'))
+        for kind in ('crawl', 'batch/scrape'):
+            web_app.router.add_post(f'/v1/{kind}', self._start_handler(kind))
+            web_app.router.add_delete(f'/v1/{kind}/{{id}}', self._cancel_handler(kind))
+        self._runner = web.AppRunner(web_app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f'http://127.0.0.1:{port}'
+
+    async def _scrape_handler(self, request):
+        url = (await request.json())['url']
+        self.scraped.append(url)
+        # Concurrency is counted overall under '*' and per domain of the scraped URL
+        keys = ('*', urllib.parse.urlsplit(url).hostname)
+        for key in keys:
+            self.in_flight[key] += 1
+            self.peak_in_flight[key] = max(self.peak_in_flight[key], self.in_flight[key])
+        try:
+            await asyncio.sleep(self.scrape_delay)
+        finally:
+            for key in keys:
+                self.in_flight[key] -= 1
+        if url in self.failing_urls:
+            return web.json_response({'success': False, 'error': 'Blocked'}, status=403)
+        page = self.pages.get(url.rpartition('/pages/')[2]) if '/pages/' in url else None
+        markdown = page['content'] if page else f'# {url}'
+        return web.json_response({'success': True, 'data': {'markdown': markdown, 'metadata': {'sourceURL': url}}})
+
+    async def _map_handler(self, request):
+        return web.json_response({'success': True, 'links': [f'{self.url}/pages/{name}' for name in self.pages]})
+
+    async def _page_handler(self, request):
+        page = self.pages.get(request.match_info['name'])
+        if page is None:
+            raise web.HTTPNotFound()
+        self.probed.append(request.match_info['name'])
+        headers = {key: page[field] for key, field in (('ETag', 'etag'), ('Last-Modified', 'last_modified')) if page.get(field)}
+        return web.Response(text=page['content'], headers=headers)
+
+    def _start_handler(self, kind):
+        async def handler(request):
+            self.started.append({'urls': (await request.json()).get('urls'),
+                                 'idempotency_key': request.headers.get('x-idempotency-key')})
+            if not self.unstarted.get(kind):
+                return web.json_response({'success': False, 'error': 'Idempotency key already used'}, status=409)
+            id = self.unstarted[kind].pop(0)
+            return web.json_response({'success': True, 'id': id, 'url': f'{self.url}/v1/{kind}/{id}'})
+        return handler
+
+    def _cancel_handler(self, kind):
+        async def handler(request):
+            id = request.match_info['id']
+            self.cancelled.append(id)
+            self.jobs[(kind, id)].update(status='cancelled', polls=0)
+            return web.json_response({'success': True, 'status': 'cancelled'})
+        return handler
+
+    def _status_handler(self, kind):
+        async def handler(request):
+            id = request.match_info['id']
+            self.requests.append(str(request.rel_url))
+            if self.throttled > 0:
+                self.throttled -= 1
+                return web.json_response({'success': False, 'error': 'Rate limit exceeded'}, status=429,
+                                         headers={'Retry-After': '0'})
+            job = self.jobs[(kind, id)]
+            status = job['status']
+            documents = job['documents']
+            if job['polls'] > 0:
+                job['polls'] -= 1
+                job['scraped'] += job['scraped_per_poll']
+                documents = documents[:job['scraped']]
+                status = 'scraping'
+            skip = int(request.query.get('skip', 0))
+            limit = int(request.query.get('limit', self.page_size))
+            page = documents[skip:skip + min(limit, self.page_size)]
+            if skip in self.short_pages:
+                page = page[:-1]
+            body = {
+                'success': True,
+                'status': status,
+                'completed': len(documents),
+                'total': len(documents),
+                'creditsUsed': len(documents),
+                'expiresAt': '2030-01-01T00:00:00Z',
+                'data': page,
+            }
+            if status == 'scraping' or skip + len(page) < len(documents):
+                body['next'] = f'{self.url}/v1/{kind}/{id}?skip={skip + len(page)}'
+                if 'limit' in request.query:
+                    body['next'] += f'&limit={limit}'
+            headers = {'Retry-After': self.retry_after} if status == 'scraping' and self.retry_after else None
+            return web.json_response(body, headers=headers)
+        return handler
+
+
+def _documents(count):
+    return [{'markdown': f'page {i}', 'metadata': {'sourceURL': f'https://example.com/{i}'}} for i in range(count)]
+
+
+class TestIterDocuments(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url)
+
+    def tearDown(self):
+        self.app.close()
+        self.api.stop()
+
+    def test_iter_crawl_documents_follows_every_page(self):
+        self.api.add_job('crawl', 'job-1', _documents(8))
+
+        markdown = [document.markdown for document in self.app.iter_crawl_documents('job-1')]
+
+        self.assertEqual(markdown, [f'page {i}' for i in range(8)])
+        self.assertEqual(len(self.api.requests), 3)
+
+    def test_iter_batch_scrape_documents_follows_every_page(self):
+        self.api.add_job('batch/scrape', 'job-1', _documents(6))
+
+        markdown = [document.markdown for document in self.app.iter_batch_scrape_documents('job-1')]
+
+        self.assertEqual(markdown, [f'page {i}' for i in range(6)])
+
+    def test_pages_are_fetched_lazily(self):
+        self.api.add_job('crawl', 'job-1', _documents(9))
+
+        documents = self.app.iter_crawl_documents('job-1')
+        next(documents)
+
+        self.assertEqual(len(self.api.requests), 1)
+
+    def test_read_ahead_fetches_following_pages(self):
+        self.api.add_job('crawl', 'job-1', _documents(9))
+
+        documents = self.app.iter_crawl_documents('job-1', prefetch=2)
+        next(documents)
+        deadline = time.monotonic() + 5
+        while len(self.api.requests) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(len(self.api.requests), 3)
+        self.assertEqual([d.markdown for d in documents], [f'page {i}' for i in range(1, 9)])
+
+    def test_read_ahead_closes_the_source_when_stopped_early(self):
+        closed = threading.Event()
+
+        def source():
+            try:
+                for i in range(100):
+                    yield {'page': i}
+            finally:
+                closed.set()
+
+        generator = source()
+        pages = self.app._read_ahead(generator, 2)
+        self.assertEqual(next(pages), {'page': 0})
+        pages.close()
+
+        self.assertTrue(closed.wait(5))
+
+    def test_check_crawl_status_with_read_ahead(self):
+        self.api.add_job('crawl', 'job-1', _documents(10))
+
+        status = self.app.check_crawl_status('job-1', prefetch=3)
+
+        self.assertEqual([d.markdown for d in status.data], [f'page {i}' for i in range(10)])
+
+    def test_check_batch_scrape_status_with_read_ahead(self):
+        self.api.add_job('batch/scrape', 'job-1', _documents(5))
+
+        status = self.app.check_batch_scrape_status('job-1', prefetch=2)
+
+        self.assertEqual([d.markdown for d in status.data], [f'page {i}' for i in range(5)])
+
+    def test_parallel_fetch_uses_skip_offsets(self):
+        self.api.add_job('crawl', 'job-1', _documents(14))
+
+        status = self.app.check_crawl_status('job-1', parallel=3)
+
+        self.assertEqual([d.markdown for d in status.data], [f'page {i}' for i in range(14)])
+        self.assertEqual(sorted(self.api.requests[1:]), sorted(f'/v1/crawl/job-1?skip={skip}&limit=3' for skip in (3, 6, 9, 12)))
+
+    def test_parallel_fetch_falls_back_on_short_page(self):
+        self.api.add_job('batch/scrape', 'job-1', _documents(14))
+        self.api.short_pages.add(6)
+
+        documents = self.app.iter_batch_scrape_documents('job-1', parallel=4)
+
+        self.assertEqual([d.markdown for d in documents], [f'page {i}' for i in range(14)])
+
+    def test_streamed_documents_follow_every_page(self):
+        self.api.add_job('crawl', 'job-1', _documents(8))
+
+        documents = self.app.iter_crawl_documents('job-1', stream=True)
+
+        self.assertEqual([d.markdown for d in documents], [f'page {i}' for i in range(8)])
+        self.assertEqual(len(self.api.requests), 3)
+        self.assertEqual(self.app.transfer_stats.requests, 3)
+
+    @patch('firecrawl.firecrawl.time.sleep')
+    def test_streamed_polling_honors_retry_after(self, mock_sleep):
+        self.api.add_job('crawl', 'job-1', _documents(4), polls_until_done=2)
+        self.api.retry_after = '9'
+
+        documents = list(self.app.iter_crawl_documents('job-1', stream=True))
+
+        self.assertEqual(len(documents), 4)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [9, 9])
+
+    def test_stream_cannot_be_combined_with_parallel(self):
+        with self.assertRaises(ValueError):
+            next(self.app.iter_batch_scrape_documents('job-1', stream=True, parallel=2))
+
+    @patch('firecrawl.firecrawl.time.sleep')
+    def test_monitor_fetches_documents_while_crawl_runs(self, mock_sleep):
+        self.api.add_job('crawl', 'job-1', _documents(10), polls_until_done=3, scraped_per_poll=2)
+
+        status = self.app._monitor_job_status('job-1', self.app._prepare_headers(), 2)
+
+        self.assertEqual([d.markdown for d in status.data], [f'page {i}' for i in range(10)])
+        self.assertEqual(mock_sleep.call_count, 3)
+        self.assertEqual(self.api.requests, [
+            '/v1/crawl/job-1',
+            '/v1/crawl/job-1?skip=2',
+            '/v1/crawl/job-1?skip=4',
+            '/v1/crawl/job-1?skip=6',
+            '/v1/crawl/job-1?skip=9',
+        ])
+
+    def test_failed_job_raises(self):
+        self.api.add_job('crawl', 'job-1', _documents(2), status='failed')
+
+        with self.assertRaises(Exception):
+            list(self.app.iter_crawl_documents('job-1'))
+
+
+class TestAsyncIterDocuments(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def test_iter_crawl_documents_follows_every_page(self):
+        self.api.add_job('crawl', 'job-1', _documents(7))
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            markdown = [document.markdown async for document in app.iter_crawl_documents('job-1')]
+
+        self.assertEqual(markdown, [f'page {i}' for i in range(7)])
+
+    async def test_iter_batch_scrape_documents_follows_every_page(self):
+        self.api.add_job('batch/scrape', 'job-1', _documents(4))
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            markdown = [document.markdown async for document in app.iter_batch_scrape_documents('job-1')]
+
+        self.assertEqual(markdown, [f'page {i}' for i in range(4)])
+
+    async def test_streamed_documents_follow_every_page(self):
+        self.api.add_job('batch/scrape', 'job-1', _documents(7))
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            markdown = [d.markdown async for d in app.iter_batch_scrape_documents('job-1', stream=True)]
+
+        self.assertEqual(markdown, [f'page {i}' for i in range(7)])
+
+    async def test_streamed_polling_honors_retry_after(self):
+        self.api.add_job('batch/scrape', 'job-1', _documents(4), polls_until_done=2)
+        self.api.retry_after = '0'
+        slow_polling = PollingStrategy(interval=60, min_interval=0.01, jitter=0)
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url,
+                                     poll_strategy=slow_polling) as app:
+            async def read():
+                return [d.markdown async for d in app.iter_batch_scrape_documents('job-1', stream=True)]
+            markdown = await asyncio.wait_for(read(), timeout=5)
+
+        self.assertEqual(markdown, [f'page {i}' for i in range(4)])
+
+    async def test_check_batch_scrape_status_with_lazy_validation(self):
+        self.api.add_job('batch/scrape', 'job-1', _documents(5))
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, validate='lazy') as app:
+            status = await app.check_batch_scrape_status('job-1')
+
+        self.assertEqual(status.completed, 5)
+        self.assertEqual([d.markdown for d in status.data], [f'page {i}' for i in range(5)])
+
+    async def test_read_ahead_closes_the_source_when_stopped_early(self):
+        closed = []
+
+        async def source():
+            try:
+                for i in range(100):
+                    yield {'page': i}
+            finally:
+                closed.append(True)
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            for depth in (0, 2):
+                generator = source()
+                pages = app._async_read_ahead(generator, depth)
+                async for page in pages:
+                    break
+                await pages.aclose()
+                self.assertIsNone(generator.ag_frame)
+
+        self.assertEqual(closed, [True, True])
+
+    async def test_check_crawl_status_with_read_ahead(self):
+        self.api.add_job('crawl', 'job-1', _documents(10))
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            status = await app.check_crawl_status('job-1', prefetch=2)
+
+        self.assertEqual([d.markdown for d in status.data], [f'page {i}' for i in range(10)])
+
+    async def test_parallel_fetch_falls_back_on_short_page(self):
+        self.api.add_job('crawl', 'job-1', _documents(14))
+        self.api.short_pages.add(3)
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            status = await app.check_crawl_status('job-1', parallel=3)
+
+        self.assertEqual([d.markdown for d in status.data], [f'page {i}' for i in range(14)])
+
+
+if __name__ == '__main__':
+    unittest.main()
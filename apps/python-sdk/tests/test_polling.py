@@ -0,0 +1,94 @@
+import unittest
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from firecrawl import FirecrawlApp, PollingStrategy
+from firecrawl.firecrawl import _parse_retry_after
+
+from tests.test_pagination import FakeJobAPI, _documents
+
+
+class TestPollingStrategy(unittest.TestCase):
+    def setUp(self):
+        self.strategy = PollingStrategy(interval=2, min_interval=1, max_interval=30, backoff=1.5, jitter=0)
+
+    def test_first_wait_is_the_initial_interval(self):
+        self.assertEqual(self.strategy.next_interval(None, None, {'status': 'scraping'}), 2)
+
+    def test_wait_grows_without_progress(self):
+        status = {'status': 'scraping', 'completed': 5, 'total': 100}
+
+        self.assertEqual(self.strategy.next_interval(2, status, status), 3)
+        self.assertEqual(self.strategy.next_interval(20, status, status), 30)
+
+    def test_wait_shrinks_toward_remaining_time(self):
+        previous = {'status': 'scraping', 'completed': 10, 'total': 20}
+        status = {'status': 'scraping', 'completed': 18, 'total': 20}
+
+        # 8 documents in 4 seconds leaves about a second of work
+        self.assertEqual(self.strategy.next_interval(4, previous, status), 1)
+
+    def test_retry_after_takes_precedence(self):
+        status = {'status': 'scraping'}
+
+        self.assertEqual(self.strategy.next_interval(2, status, status, retry_after=45), 45)
+        self.assertEqual(self.strategy.next_interval(2, status, status, retry_after=0), 1)
+
+    def test_jitter_stays_within_bounds(self):
+        strategy = PollingStrategy(interval=10, jitter=0.2)
+
+        for _ in range(100):
+            self.assertTrue(8 <= strategy.next_interval(None, None, {}) <= 12)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(_parse_retry_after('7'), 7)
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertIsNone(_parse_retry_after('soon'))
+        when = datetime.now(timezone.utc) + timedelta(seconds=60)
+        self.assertAlmostEqual(_parse_retry_after(format_datetime(when, usegmt=True)), 60, delta=2)
+
+
+class TestMonitorPolling(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+
+    def tearDown(self):
+        self.api.stop()
+
+    @patch('firecrawl.firecrawl.time.sleep')
+    def test_monitor_uses_strategy_passed_to_call(self, mock_sleep):
+        self.api.add_job('crawl', 'job-1', _documents(4), polls_until_done=2)
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url)
+
+        app._monitor_job_status('job-1', app._prepare_headers(), 2, PollingStrategy(interval=7, backoff=2, jitter=0))
+
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [7, 14])
+        app.close()
+
+    @patch('firecrawl.firecrawl.time.sleep')
+    def test_monitor_uses_client_strategy(self, mock_sleep):
+        self.api.add_job('crawl', 'job-1', _documents(4), polls_until_done=1)
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url,
+                           poll_strategy=PollingStrategy(interval=3, jitter=0))
+
+        app._monitor_job_status('job-1', app._prepare_headers(), 2)
+
+        mock_sleep.assert_called_once_with(3)
+        app.close()
+
+    def test_poll_interval_above_default_maximum_is_respected(self):
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url)
+
+        strategy = app._poller(None, 60).strategy
+        strategy.jitter = 0
+        status = {'status': 'scraping', 'completed': 5, 'total': 100}
+
+        self.assertEqual(strategy.next_interval(None, None, status), 60)
+        self.assertGreaterEqual(strategy.next_interval(60, status, status), 60)
+        self.assertEqual(app._poller(None, 1).strategy.interval, 2)
+        app.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
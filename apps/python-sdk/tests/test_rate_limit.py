@@ -0,0 +1,152 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from firecrawl import FirecrawlApp, RateLimit, RateLimiter, SQLiteBucketStore
+
+from tests.test_pagination import FakeJobAPI, _documents
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_classify_follows_api_rate_limit_modes(self):
+        classify = RateLimiter.classify
+        self.assertEqual(classify('POST', 'https://api.firecrawl.dev/v1/scrape'), 'scrape')
+        self.assertEqual(classify('POST', 'https://api.firecrawl.dev/v1/batch/scrape'), 'scrape')
+        self.assertEqual(classify('POST', 'https://api.firecrawl.dev/v1/crawl'), 'crawl')
+        self.assertEqual(classify('GET', 'https://api.firecrawl.dev/v1/crawl/abc?skip=10'), 'crawl_status')
+        self.assertEqual(classify('DELETE', 'https://api.firecrawl.dev/v1/crawl/abc'), 'crawl_status')
+        self.assertEqual(classify('POST', 'https://api.firecrawl.dev/v1/extract'), 'extract')
+        self.assertEqual(classify('GET', 'https://api.firecrawl.dev/v1/extract/abc'), 'extract_status')
+
+    @patch('firecrawl.firecrawl.time.sleep')
+    def test_requests_beyond_burst_wait_for_their_slot(self, mock_sleep):
+        limiter = RateLimiter({'scrape': RateLimit(rate=10, burst=2)})
+
+        for _ in range(4):
+            with limiter.acquire('POST', 'https://api.firecrawl.dev/v1/scrape'):
+                pass
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertAlmostEqual(delays[0], 0.1, delta=0.02)
+        self.assertAlmostEqual(delays[1], 0.2, delta=0.02)
+
+    def test_unlimited_endpoint_classes_are_not_delayed(self):
+        limiter = RateLimiter({'scrape': 0.001})
+
+        with patch('firecrawl.firecrawl.time.sleep') as mock_sleep:
+            for _ in range(3):
+                with limiter.acquire('GET', 'https://api.firecrawl.dev/v1/crawl/abc'):
+                    pass
+
+        mock_sleep.assert_not_called()
+
+    def test_concurrency_cap(self):
+        limiter = RateLimiter({'*': RateLimit(rate=1000, burst=1000, concurrency=2)})
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def request():
+            with limiter.acquire('POST', 'https://api.firecrawl.dev/v1/scrape'):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                threading.Event().wait(0.02)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(peak[0], 2)
+
+    def test_sqlite_buckets_are_shared_between_stores(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'buckets.db')
+            first, second = SQLiteBucketStore(path), SQLiteBucketStore(path)
+
+            self.assertEqual(first.reserve('key:scrape', 1, 1), 0)
+            self.assertGreater(second.reserve('key:scrape', 1, 1), 0.9)
+            self.assertEqual(second.reserve('key:map', 1, 1), 0)
+            first.close()
+            second.close()
+
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrency_cap(self):
+        limiter = RateLimiter({'scrape': RateLimit(rate=1000, burst=1000, concurrency=3)})
+        active, peak = 0, 0
+
+        async def request():
+            nonlocal active, peak
+            async with limiter.async_acquire('POST', 'https://api.firecrawl.dev/v1/scrape'):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(request() for _ in range(10)))
+
+        self.assertEqual(peak, 3)
+
+    async def test_shared_store_does_not_block_the_event_loop(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'buckets.db')
+            store = SQLiteBucketStore(path, timeout=1)
+            limiter = RateLimiter({'scrape': 1000}, store=store)
+            other_process = sqlite3.connect(path, isolation_level=None)
+            other_process.execute('BEGIN IMMEDIATE')
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            async def request():
+                async with limiter.async_acquire('POST', 'https://api.firecrawl.dev/v1/scrape'):
+                    pass
+
+            ticker = asyncio.ensure_future(tick())
+            waiting = asyncio.ensure_future(request())
+            await asyncio.sleep(0.2)
+            self.assertFalse(waiting.done())
+            self.assertGreater(ticks, 5)
+
+            other_process.execute('COMMIT')
+            await waiting
+            ticker.cancel()
+            other_process.close()
+            store.close()
+
+
+class TestClientRateLimiting(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+
+    def tearDown(self):
+        self.api.stop()
+
+    @patch('firecrawl.firecrawl.time.sleep')
+    def test_status_checks_are_paced(self, mock_sleep):
+        self.api.add_job('crawl', 'job-1', _documents(1))
+        limiter = RateLimiter({'crawl_status': RateLimit(rate=5, burst=1)})
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, rate_limiter=limiter)
+
+        for _ in range(3):
+            app.check_crawl_status('job-1')
+        app.close()
+
+        self.assertEqual(len(self.api.requests), 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import asyncio
+import contextlib
+import threading
+import unittest
+from unittest.mock import patch
+
+import aiohttp
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, ScrapeManifest
+
+from tests.test_pagination import FakeJobAPI, _documents
+
+
+class TestScrapeManifest(unittest.TestCase):
+    def test_record_tracks_content_changes(self):
+        with ScrapeManifest() as manifest:
+            self.assertEqual(manifest.record(_documents(3), scraped_at=100), 3)
+            self.assertEqual(manifest.record(_documents(3), scraped_at=200), 0)
+            self.assertEqual(manifest.get('https://example.com/0')['scraped_at'], 200)
+
+            changed = _documents(3)
+            changed[1]['markdown'] = 'page 1, edited'
+            self.assertEqual(manifest.record(changed), 1)
+            self.assertEqual(len(manifest), 3)
+
+    def test_validators_decide_unchanged(self):
+        with ScrapeManifest() as manifest:
+            manifest.update('https://example.com/a', {'markdown': 'a'}, etag='"1"', last_modified='Mon')
+            manifest.update('https://example.com/b', {'markdown': 'b'}, last_modified='Mon')
+
+            self.assertTrue(manifest.is_unchanged('https://example.com/a', '"1"', 'Tue'))
+            self.assertFalse(manifest.is_unchanged('https://example.com/a', '"2"', 'Mon'))
+            self.assertTrue(manifest.is_unchanged('https://example.com/b', None, 'Mon'))
+            self.assertFalse(manifest.is_unchanged('https://example.com/b', None, None))
+            self.assertFalse(manifest.is_unchanged('https://example.com/c', '"1"', 'Mon'))
+
+    def test_unchanged_content_keeps_validators(self):
+        with ScrapeManifest() as manifest:
+            manifest.update('https://example.com/a', {'markdown': 'a'}, etag='"1"')
+
+            self.assertFalse(manifest.update('https://example.com/a', {'markdown': 'a'}))
+            self.assertEqual(manifest.get('https://example.com/a')['etag'], '"1"')
+            self.assertTrue(manifest.update('https://example.com/a', {'markdown': 'b'}))
+            self.assertIsNone(manifest.get('https://example.com/a')['etag'])
+
+
+class TestRescrapeChanged(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.api.pages = {
+            'tagged': {'content': 'tagged v1', 'etag': '"v1"'},
+            'dated': {'content': 'dated v1', 'last_modified': 'Mon, 05 Oct 2026 10:00:00 GMT'},
+            'plain': {'content': 'plain v1'},
+        }
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url)
+        self.manifest = ScrapeManifest()
+
+    def tearDown(self):
+        self.manifest.close()
+        self.app.close()
+        self.api.stop()
+
+    def page(self, name):
+        return f'{self.api.url}/pages/{name}'
+
+    def rescrape(self):
+        self.api.scraped.clear()
+        results = dict(self.app.rescrape_changed(manifest=self.manifest, map_site=self.api.url, max_workers=2))
+        return {url.rpartition('/')[2]: result for url, result in results.items()}
+
+    def test_only_changed_pages_are_scraped_and_yielded(self):
+        first = self.rescrape()
+        self.assertEqual(sorted(first), ['dated', 'plain', 'tagged'])
+        self.assertEqual(first['tagged'].markdown, 'tagged v1')
+
+        self.assertEqual(self.rescrape(), {})
+        self.assertEqual(self.api.scraped, [self.page('plain')])
+
+        self.api.pages['tagged'] = {'content': 'tagged v2', 'etag': '"v2"'}
+        self.api.pages['dated']['last_modified'] = 'Tue, 06 Oct 2026 10:00:00 GMT'
+        self.api.pages['new'] = {'content': 'new v1', 'etag': '"v1"'}
+        changed = self.rescrape()
+
+        self.assertEqual(sorted(changed), ['new', 'tagged'])
+        self.assertEqual(changed['tagged'].markdown, 'tagged v2')
+        self.assertEqual(sorted(self.api.scraped), sorted(self.page(name) for name in ('tagged', 'dated', 'plain', 'new')))
+        self.assertEqual(self.manifest.get(self.page('tagged'))['etag'], '"v2"')
+
+    def test_pages_recorded_from_a_crawl_are_probed_first(self):
+        self.manifest.record([{'markdown': 'tagged v1', 'metadata': {'sourceURL': self.page('tagged')}}])
+        self.manifest.update(self.page('tagged'), {'markdown': 'tagged v1'}, etag='"v1"')
+
+        results = list(self.app.rescrape_changed([self.page('tagged'), self.page('plain')], manifest=self.manifest))
+
+        self.assertEqual([url for url, _ in results], [self.page('plain')])
+        self.assertEqual(self.api.scraped, [self.page('plain')])
+        self.assertEqual(sorted(self.api.probed), ['plain', 'tagged'])
+
+    def test_scrape_errors_are_yielded(self):
+        self.api.failing_urls.add(self.page('plain'))
+
+        results = dict(self.app.rescrape_changed([self.page('plain')], manifest=self.manifest))
+
+        self.assertIsInstance(results[self.page('plain')], Exception)
+        self.assertNotIn(self.page('plain'), self.manifest)
+
+
+class TestAsyncRescrapeChanged(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.api.pages = {'tagged': {'content': 'tagged v1', 'etag': '"v1"'}, 'plain': {'content': 'plain v1'}}
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def test_only_changed_pages_are_scraped_and_yielded(self):
+        with ScrapeManifest() as manifest:
+            async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+                first = [url async for url, _ in app.rescrape_changed(manifest=manifest, map_site=self.api.url)]
+                self.api.scraped.clear()
+                second = [url async for url, _ in app.rescrape_changed(manifest=manifest, map_site=self.api.url)]
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second, [])
+        self.assertEqual(self.api.scraped, [f'{self.api.url}/pages/plain'])
+
+    async def test_probes_are_bounded_and_the_manifest_is_used_off_the_loop(self):
+        urls = [f'{self.api.url}/pages/page-{i}' for i in range(30)]
+        loop_thread = threading.get_ident()
+        manifest_threads = set()
+        most_tasks = 0
+        head = aiohttp.ClientSession.head
+
+        @contextlib.asynccontextmanager
+        async def counted_head(session, url, **kwargs):
+            nonlocal most_tasks
+            most_tasks = max(most_tasks, len(asyncio.all_tasks()))
+            async with head(session, url, **kwargs) as response:
+                yield response
+
+        def on_thread(method):
+            def wrapper(*args, **kwargs):
+                manifest_threads.add(threading.get_ident())
+                return method(*args, **kwargs)
+            return wrapper
+
+        with ScrapeManifest() as manifest, patch.object(aiohttp.ClientSession, 'head', counted_head), \
+                patch.object(manifest, 'is_unchanged', on_thread(manifest.is_unchanged)), \
+                patch.object(manifest, 'update', on_thread(manifest.update)):
+            async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+                results = [url async for url, _ in app.rescrape_changed(urls, manifest=manifest, concurrency=2)]
+
+        self.assertCountEqual(results, urls)
+        self.assertLessEqual(most_tasks, 6)
+        self.assertTrue(manifest_threads)
+        self.assertNotIn(loop_thread, manifest_threads)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,285 @@
+import asyncio
+import contextlib
+import json
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, RetryPolicy, CircuitBreaker, CircuitOpenError
+
+from tests.test_pagination import FakeJobAPI, _documents
+
+
+def _response(status_code, body=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(body or {'success': True}).encode()
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_decorrelated_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(base_delay=1, max_delay=10)
+        delay = None
+        for _ in range(50):
+            previous = delay
+            delay = policy.backoff(previous)
+            self.assertGreaterEqual(delay, 1)
+            self.assertLessEqual(delay, min(10, 3 * (previous or 1)))
+
+    def test_transport_errors_retried_only_when_safe(self):
+        policy = RetryPolicy()
+        timeout = requests.exceptions.ReadTimeout()
+
+        self.assertTrue(policy.retries_exception('GET', {}, timeout))
+        self.assertFalse(policy.retries_exception('POST', {}, timeout))
+        self.assertTrue(policy.retries_exception('POST', {'x-idempotency-key': 'abc'}, timeout))
+        self.assertTrue(policy.retries_exception('POST', {}, requests.exceptions.ConnectTimeout()))
+        self.assertFalse(policy.retries_exception('GET', {}, ValueError()))
+
+
+@patch('firecrawl.firecrawl.time.sleep')
+class TestRequestRetries(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url='https://api.example.com')
+
+    def test_retry_after_is_honored(self, mock_sleep):
+        with patch.object(self.app, '_request', side_effect=[
+                _response(429, headers={'Retry-After': '3'}), _response(200)]) as mock_request:
+            response = self.app._get_request('https://api.example.com/v1/crawl/1', {})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_called_once_with(3.0)
+
+    def test_last_response_returned_when_attempts_run_out(self, mock_sleep):
+        with patch.object(self.app, '_request', return_value=_response(503)) as mock_request:
+            response = self.app._post_request('https://api.example.com/v1/scrape', {}, {})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_connection_errors_are_retried(self, mock_sleep):
+        with patch.object(self.app, '_request', side_effect=[
+                requests.exceptions.ConnectionError(), _response(200)]):
+            response = self.app._delete_request('https://api.example.com/v1/crawl/1', {})
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_read_timeout_on_post_is_not_retried(self, mock_sleep):
+        with patch.object(self.app, '_request', side_effect=requests.exceptions.ReadTimeout()) as mock_request:
+            with self.assertRaises(requests.exceptions.ReadTimeout):
+                self.app._post_request('https://api.example.com/v1/scrape', {}, {})
+
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_retry_budget_limits_waiting(self, mock_sleep):
+        self.app.retry_policy = RetryPolicy(max_attempts=5, retry_budget=10)
+        with patch.object(self.app, '_request', return_value=_response(429, headers={'Retry-After': '6'})) as mock_request:
+            response = self.app._get_request('https://api.example.com/v1/crawl/1', {})
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_scrape_url_retries_rate_limited_responses(self, mock_sleep):
+        with patch.object(self.app, '_request', side_effect=[
+                _response(429, {'success': False}, headers={'Retry-After': '2'}),
+                _response(200, {'success': True, 'data': {'markdown': '# page'}})]) as mock_request:
+            response = self.app.scrape_url('https://example.com')
+
+        self.assertEqual(response.markdown, '# page')
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_search_and_map_report_to_the_circuit_breaker(self, mock_sleep):
+        self.app.retry_policy = RetryPolicy(max_attempts=1)
+        self.app.circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+        with patch.object(self.app, '_request', return_value=_response(503)):
+            for call in (lambda: self.app.search('firecrawl'), lambda: self.app.map_url('https://example.com')):
+                with self.assertRaises(Exception):
+                    call()
+
+        self.assertEqual(self.app.circuit_breaker.state('api.example.com'), 'open')
+
+    def test_interrupted_trial_request_reopens_the_circuit(self, mock_sleep):
+        self.app.retry_policy = RetryPolicy(max_attempts=1)
+        self.app.circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.05)
+        with patch.object(self.app, '_request', return_value=_response(503)):
+            self.app._get_request('https://api.example.com/v1/crawl/1', {})
+        threading.Event().wait(0.06)
+
+        with patch.object(self.app, '_request', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.app._get_request('https://api.example.com/v1/crawl/1', {})
+        self.assertEqual(self.app.circuit_breaker.state('api.example.com'), 'open')
+
+        threading.Event().wait(0.06)
+        with patch.object(self.app, '_request', return_value=_response(200)):
+            self.assertEqual(self.app._get_request('https://api.example.com/v1/crawl/1', {}).status_code, 200)
+        self.assertEqual(self.app.circuit_breaker.state('api.example.com'), 'closed')
+
+    def test_circuit_opens_after_repeated_failures(self, mock_sleep):
+        self.app.retry_policy = RetryPolicy(max_attempts=1)
+        self.app.circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+        with patch.object(self.app, '_request', return_value=_response(503)) as mock_request:
+            self.app._get_request('https://api.example.com/v1/crawl/1', {})
+            self.app._get_request('https://api.example.com/v1/crawl/1', {})
+            with self.assertRaises(CircuitOpenError):
+                self.app._get_request('https://api.example.com/v1/crawl/1', {})
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(self.app.circuit_breaker.state('api.example.com'), 'open')
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_half_open_trial_closes_or_reopens_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.05)
+        breaker.record_failure('a')
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request('a')
+        breaker.before_request('b')
+
+        time.sleep(0.06)
+        breaker.before_request('a')
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request('a')
+        breaker.record_failure('a')
+        self.assertEqual(breaker.state('a'), 'open')
+
+        time.sleep(0.06)
+        breaker.before_request('a')
+        breaker.record_success('a')
+        self.assertEqual(breaker.state('a'), 'closed')
+
+
+class TestAsyncRequestRetries(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.statuses = [503, 429, 200]
+
+        async def handler(request):
+            status = self.statuses.pop(0)
+            return web.json_response({'success': status == 200}, status=status, headers={'Retry-After': '0'})
+
+        web_app = web.Application()
+        web_app.router.add_get('/v1/crawl/{id}', handler)
+        self.server = TestServer(web_app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_retryable_statuses_are_retried(self):
+        url = str(self.server.make_url('/v1/crawl/1'))
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=url,
+                                     retry_policy=RetryPolicy(base_delay=0.01)) as app:
+            response = await app._async_get_request(url, {})
+
+        self.assertEqual(response, {'success': True})
+        self.assertEqual(self.statuses, [])
+
+    async def test_api_errors_are_not_retried(self):
+        self.statuses = [404, 200]
+        url = str(self.server.make_url('/v1/crawl/1'))
+        breaker = CircuitBreaker(failure_threshold=1)
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=url, circuit_breaker=breaker) as app:
+            with self.assertRaisesRegex(Exception, 'Status code 404'):
+                await app._async_get_request(url, {})
+
+        self.assertEqual(self.statuses, [200])
+        self.assertEqual(breaker.state(f'{self.server.host}:{self.server.port}'), 'closed')
+
+
+class TestAsyncHalfOpenTrial(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.delay = 0
+
+        async def handler(request):
+            await asyncio.sleep(self.delay)
+            return web.json_response({'success': True})
+
+        web_app = web.Application()
+        web_app.router.add_get('/v1/crawl/{id}', handler)
+        self.server = TestServer(web_app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_cancelled_trial_request_reopens_the_circuit(self):
+        url = str(self.server.make_url('/v1/crawl/1'))
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.05)
+        host = f'{self.server.host}:{self.server.port}'
+        breaker.record_failure(host)
+        await asyncio.sleep(0.06)
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=url, circuit_breaker=breaker) as app:
+            self.delay = 10
+            trial = asyncio.create_task(app._async_get_request(url, {}))
+            await asyncio.sleep(0.05)
+            trial.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await trial
+            self.assertEqual(breaker.state(host), 'open')
+
+            self.delay = 0
+            await asyncio.sleep(0.06)
+            self.assertEqual(await app._async_get_request(url, {}), {'success': True})
+        self.assertEqual(breaker.state(host), 'closed')
+
+
+@patch('firecrawl.firecrawl.time.sleep')
+class TestStreamedRetries(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url)
+
+    def tearDown(self):
+        self.app.close()
+        self.api.stop()
+
+    def test_streamed_status_pages_are_retried(self, mock_sleep):
+        self.api.add_job('crawl', 'job-1', _documents(4))
+        self.api.throttled = 2
+
+        documents = list(self.app.iter_crawl_documents('job-1', stream=True))
+
+        self.assertEqual(len(documents), 4)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_streamed_status_pages_report_to_the_circuit_breaker(self, mock_sleep):
+        self.api.add_job('crawl', 'job-1', _documents(4))
+        self.app.retry_policy = RetryPolicy(max_attempts=1, statuses=(503,))
+        self.app.circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_time=60)
+        self.app.circuit_breaker.record_failure(self.api.url.split('://')[1])
+
+        with self.assertRaises(CircuitOpenError):
+            list(self.app.iter_crawl_documents('job-1', stream=True))
+
+
+class TestAsyncStreamedRetries(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def test_streamed_status_pages_are_retried(self):
+        self.api.add_job('batch/scrape', 'job-1', _documents(4))
+        self.api.throttled = 2
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url,
+                                     retry_policy=RetryPolicy(base_delay=0.01)) as app:
+            documents = [d async for d in app.iter_batch_scrape_documents('job-1', stream=True)]
+
+        self.assertEqual(len(documents), 4)
+        self.assertEqual(self.api.throttled, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
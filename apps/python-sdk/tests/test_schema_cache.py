@@ -0,0 +1,76 @@
+import gc
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pydantic
+
+from firecrawl import FirecrawlApp, JsonConfig
+from firecrawl.firecrawl import _ensure_schema_dict, _generated_schemas
+
+
+class Product(pydantic.BaseModel):
+    name: str
+    price: float
+
+
+def _response(body):
+    response = MagicMock()
+    response.status_code = 200
+    response.content = json.dumps(body).encode()
+    return response
+
+
+class TestSchemaCache(unittest.TestCase):
+    def test_schema_is_generated_once_per_class(self):
+        class Review(pydantic.BaseModel):
+            rating: int
+
+        with patch.object(Review, 'model_json_schema', wraps=Review.model_json_schema) as mock_schema:
+            first = _ensure_schema_dict(Review)
+            second = _ensure_schema_dict({'type': 'array', 'items': Review})
+
+        self.assertEqual(mock_schema.call_count, 1)
+        self.assertEqual(first, Review.model_json_schema())
+        self.assertEqual(second['items'], first)
+        self.assertIs(_ensure_schema_dict(first), first)
+
+    def test_changing_a_request_schema_leaves_the_cache_intact(self):
+        class Review(pydantic.BaseModel):
+            rating: int
+
+        schema = _ensure_schema_dict(Review)
+        schema['title'] = 'Changed'
+        schema['properties']['rating']['type'] = 'string'
+        schema['required'].append('comment')
+
+        self.assertEqual(_ensure_schema_dict(Review), Review.model_json_schema())
+
+    def test_cache_does_not_keep_classes_alive(self):
+        class Temporary(pydantic.BaseModel):
+            value: str
+
+        _ensure_schema_dict(Temporary)
+        count = len(_generated_schemas)
+        del Temporary
+        gc.collect()
+
+        self.assertEqual(len(_generated_schemas), count - 1)
+
+    def test_repeated_scrapes_reuse_the_schema(self):
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url='https://api.example.com')
+        response = _response({'success': True, 'data': {'json': {'name': 'Pen', 'price': 1.5}}})
+
+        with patch.object(app, '_request', return_value=response) as mock_request, \
+                patch.object(Product, 'model_json_schema', wraps=Product.model_json_schema) as mock_schema:
+            _generated_schemas.pop(Product, None)
+            for _ in range(3):
+                app.scrape_url('https://example.com', formats=['json'], json_options=JsonConfig(schema=Product))
+        app.close()
+
+        self.assertEqual(mock_schema.call_count, 1)
+        self.assertEqual(mock_request.call_args.args[3]['jsonOptions']['schema'], Product.model_json_schema())
+
+
+if __name__ == '__main__':
+    unittest.main()
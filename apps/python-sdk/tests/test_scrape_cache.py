@@ -0,0 +1,142 @@
+import unittest
+from unittest.mock import patch
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, MemoryScrapeCache
+
+from tests.test_pagination import FakeJobAPI
+
+
+class TestMemoryScrapeCache(unittest.TestCase):
+    def test_least_recently_used_results_are_evicted_to_fit_the_budget(self):
+        cache = MemoryScrapeCache(max_bytes=100)
+        cache.set('a', {'markdown': 'x' * 30})
+        cache.set('b', {'markdown': 'y' * 30})
+        cache.get('a')
+        cache.set('c', {'markdown': 'z' * 30})
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertLessEqual(cache.size, 100)
+
+    def test_oversized_results_are_not_stored(self):
+        cache = MemoryScrapeCache(max_bytes=10)
+        cache.set('a', {'markdown': 'x' * 30})
+
+        self.assertEqual(len(cache), 0)
+
+    @patch('firecrawl.firecrawl.time.monotonic')
+    def test_ttl_and_max_age(self, mock_monotonic):
+        cache = MemoryScrapeCache(ttl=60)
+        mock_monotonic.return_value = 1000.0
+        cache.set('a', {'markdown': 'x'})
+
+        mock_monotonic.return_value = 1030.0
+        self.assertIsNone(cache.get('a', max_age=10))
+        self.assertEqual(cache.get('a', max_age=40), {'markdown': 'x'})
+
+        mock_monotonic.return_value = 1061.0
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+    def test_hits_return_copies(self):
+        cache = MemoryScrapeCache()
+        cache.set('a', {'links': ['https://example.com']})
+        cache.get('a')['links'].append('https://example.org')
+
+        self.assertEqual(cache.get('a'), {'links': ['https://example.com']})
+        self.assertEqual((cache.hits, cache.misses), (2, 0))
+
+
+class TestScrapeUrlCache(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.cache = MemoryScrapeCache()
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, scrape_cache=self.cache)
+
+    def tearDown(self):
+        self.app.close()
+        self.api.stop()
+
+    def test_repeat_scrapes_skip_the_network(self):
+        first = self.app.scrape_url('https://example.com', formats=['markdown'])
+        second = self.app.scrape_url('https://example.com', formats=['markdown'], max_age=60000)
+
+        self.assertEqual(self.api.scraped, ['https://example.com'])
+        self.assertEqual(second.markdown, first.markdown)
+
+    def test_options_are_part_of_the_key(self):
+        self.app.scrape_url('https://example.com', formats=['markdown'])
+        self.app.scrape_url('https://example.com', formats=['html'])
+
+        self.assertEqual(len(self.api.scraped), 2)
+
+    def test_max_age_zero_always_scrapes(self):
+        self.app.scrape_url('https://example.com')
+        self.app.scrape_url('https://example.com', max_age=0)
+
+        self.assertEqual(len(self.api.scraped), 2)
+
+    @patch('firecrawl.firecrawl.time.monotonic')
+    def test_results_older_than_max_age_are_refreshed(self, mock_monotonic):
+        mock_monotonic.return_value = 1000.0
+        self.app.scrape_url('https://example.com')
+        mock_monotonic.return_value = 1005.0
+        self.app.scrape_url('https://example.com', max_age=10000)
+        self.app.scrape_url('https://example.com', max_age=1000)
+
+        self.assertEqual(len(self.api.scraped), 2)
+
+    def test_store_in_cache_false_is_not_cached(self):
+        self.app.scrape_url('https://example.com', store_in_cache=False)
+        self.app.scrape_url('https://example.com')
+
+        self.assertEqual(len(self.api.scraped), 2)
+
+    def test_zero_data_retention_scrapes_are_not_cached(self):
+        self.app.scrape_url('https://example.com', zero_data_retention=True)
+        self.app.scrape_url('https://example.com', zero_data_retention=True)
+
+        self.assertEqual(len(self.api.scraped), 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_failed_scrapes_are_not_cached(self):
+        self.api.failing_urls.add('https://example.com')
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                self.app.scrape_url('https://example.com')
+
+        self.assertEqual(len(self.api.scraped), 2)
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestAsyncScrapeUrlCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def test_repeat_scrapes_skip_the_network(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url,
+                                     scrape_cache=MemoryScrapeCache()) as app:
+            await app.scrape_url('https://example.com')
+            result = await app.scrape_url('https://example.com', max_age=60000)
+            await app.scrape_url('https://example.com', max_age=0)
+
+        self.assertEqual(result.markdown, '# https://example.com')
+        self.assertEqual(len(self.api.scraped), 2)
+
+    async def test_zero_data_retention_scrapes_are_not_cached(self):
+        cache = MemoryScrapeCache()
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url,
+                                     scrape_cache=cache) as app:
+            await app.scrape_url('https://example.com', zero_data_retention=True)
+            await app.scrape_url('https://example.com', zero_data_retention=True)
+
+        self.assertEqual(len(self.api.scraped), 2)
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+
+from tests.test_pagination import FakeJobAPI
+
+
+class TestScrapeMany(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.api.scrape_delay = 0.02
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url)
+
+    def tearDown(self):
+        self.app.close()
+        self.api.stop()
+
+    def test_yields_every_result_and_captures_errors(self):
+        urls = [f'https://example.com/{i}' for i in range(10)]
+        self.api.failing_urls.add(urls[3])
+
+        results = dict(self.app.scrape_many(urls, max_workers=4, formats=['markdown']))
+
+        self.assertEqual(set(results), set(urls))
+        self.assertIsInstance(results[urls[3]], Exception)
+        self.assertEqual(results[urls[0]].markdown, f'# {urls[0]}')
+        self.assertLessEqual(self.api.peak_in_flight['*'], 4)
+        self.assertGreater(self.api.peak_in_flight['*'], 1)
+
+    def test_ordered_results_follow_input_order(self):
+        urls = [f'https://a.example.com/{i}' for i in range(6)] + [f'https://b.example.com/{i}' for i in range(6)]
+
+        results = [url for url, _ in self.app.scrape_many(urls, max_workers=4, per_domain_concurrency=1, ordered=True)]
+
+        self.assertEqual(results, urls)
+        self.assertEqual(self.api.peak_in_flight['a.example.com'], 1)
+        self.assertEqual(self.api.peak_in_flight['b.example.com'], 1)
+
+    def test_closing_stops_new_scrapes(self):
+        pulled = []
+
+        def urls():
+            for i in range(1000):
+                pulled.append(i)
+                yield f'https://example.com/{i}'
+
+        results = self.app.scrape_many(urls(), max_workers=2)
+        next(results)
+        results.close()
+
+        self.assertLessEqual(len(pulled), 4)
+
+
+class TestAsyncScrapeMany(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.api.scrape_delay = 0.02
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def test_yields_every_result_and_captures_errors(self):
+        urls = [f'https://example.com/{i}' for i in range(10)]
+        self.api.failing_urls.add(urls[3])
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            results = dict([item async for item in app.scrape_many(urls, concurrency=4, formats=['markdown'])])
+
+        self.assertEqual(set(results), set(urls))
+        self.assertIsInstance(results[urls[3]], Exception)
+        self.assertEqual(results[urls[0]].markdown, f'# {urls[0]}')
+        self.assertLessEqual(self.api.peak_in_flight['*'], 4)
+
+    async def test_per_domain_concurrency(self):
+        urls = [f'https://a.example.com/{i}' for i in range(8)] + [f'https://b.example.com/{i}' for i in range(4)]
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            results = [url async for url, _ in app.scrape_many(urls, concurrency=3, per_domain_concurrency=2)]
+
+        self.assertEqual(sorted(results), sorted(urls))
+        self.assertEqual(self.api.peak_in_flight['a.example.com'], 2)
+        self.assertLessEqual(self.api.peak_in_flight['*'], 3)
+
+    async def test_input_is_consumed_lazily(self):
+        pulled = []
+
+        async def urls():
+            for i in range(1000):
+                pulled.append(i)
+                yield f'https://example.com/{i}'
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            results = app.scrape_many(urls(), concurrency=3)
+            async for url, response in results:
+                break
+            await results.aclose()
+
+        self.assertEqual(len(pulled), 3)
+
+    async def test_invalid_concurrency(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url) as app:
+            with self.assertRaises(ValueError):
+                async for _ in app.scrape_many(['https://example.com'], concurrency=0):
+                    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pydantic
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, JsonConfig, ScrapeOptions, ScrapeProfile
+from firecrawl.firecrawl import LocationConfig, WaitAction
+
+
+class Product(pydantic.BaseModel):
+    name: str
+    price: float
+
+
+def _response(body):
+    response = MagicMock()
+    response.status_code = 200
+    response.content = json.dumps(body).encode()
+    return response
+
+
+SCRAPED = {'success': True, 'data': {'markdown': '# page'}}
+
+
+class TestScrapeProfile(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url='https://api.example.com')
+        self.profile = ScrapeProfile(
+            ScrapeOptions(formats=['markdown', 'json'], onlyMainContent=True, location=LocationConfig(country='DE')),
+            json_options=JsonConfig(prompt='Find the product', schema=Product),
+            actions=[WaitAction(type='wait', milliseconds=500)],
+        )
+
+    def tearDown(self):
+        self.app.close()
+
+    def test_payload_is_fully_serialized(self):
+        self.assertEqual(self.profile.payload, {
+            'formats': ['markdown', 'json'],
+            'onlyMainContent': True,
+            'location': {'country': 'DE'},
+            'jsonOptions': {'prompt': 'Find the product', 'schema': Product.model_json_schema()},
+            'actions': [{'type': 'wait', 'milliseconds': 500}],
+        })
+        json.dumps(self.profile.payload)
+
+    def test_scrape_sends_the_same_request_as_individual_options(self):
+        with patch.object(self.app, '_request', return_value=_response(SCRAPED)) as mock_request:
+            self.app.scrape_url('https://example.com', formats=['markdown', 'json'], only_main_content=True,
+                                location=LocationConfig(country='DE'),
+                                json_options=JsonConfig(prompt='Find the product', schema=Product),
+                                actions=[WaitAction(type='wait', milliseconds=500)])
+            with patch.object(FirecrawlApp, '_ensure_schema_dict') as mock_schema:
+                self.app.scrape_url('https://example.com', profile=self.profile)
+
+        mock_schema.assert_not_called()
+        individual, profiled = (call.args[3] for call in mock_request.call_args_list)
+        self.assertEqual(profiled, individual)
+
+    def test_options_given_with_a_profile_are_added(self):
+        with patch.object(self.app, '_request', return_value=_response(SCRAPED)) as mock_request:
+            self.app.scrape_url('https://example.com', profile=self.profile, formats=['html'], timeout=1000)
+
+        params = mock_request.call_args.args[3]
+        self.assertEqual(params['formats'], ['html'])
+        self.assertEqual(params['onlyMainContent'], True)
+        self.assertEqual(mock_request.call_args.kwargs['timeout'], 6000)
+        self.assertEqual(self.profile.payload['formats'], ['markdown', 'json'])
+
+    def test_batch_scrape_adds_only_the_urls(self):
+        urls = ['https://example.com/1', 'https://example.com/2']
+        with patch.object(self.app, '_post_request', return_value=_response({'success': True, 'id': 'batch-1'})) as mock_post:
+            self.app.async_batch_scrape_urls(urls, profile=self.profile)
+            self.app.async_batch_scrape_urls(urls, profile=self.profile, mobile=True)
+
+        plain, extended = (call.args[1] for call in mock_post.call_args_list)
+        self.assertEqual(plain, self.profile.params(urls=urls))
+        self.assertEqual(extended, dict(self.profile.params(urls=urls), mobile=True))
+
+    def test_invalid_options_are_rejected_when_compiled(self):
+        with self.assertRaises(pydantic.ValidationError):
+            ScrapeProfile(formats='markdown')
+
+
+class TestAsyncScrapeProfile(unittest.IsolatedAsyncioTestCase):
+    async def test_scrape_uses_the_compiled_payload(self):
+        profile = ScrapeProfile(ScrapeOptions(formats=['markdown']), json_options=JsonConfig(schema=Product))
+
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url='https://api.example.com') as app:
+            with patch.object(app, '_async_post_request', AsyncMock(return_value=SCRAPED)) as mock_post:
+                response = await app.scrape_url('https://example.com', profile=profile)
+
+        self.assertEqual(response.markdown, '# page')
+        self.assertEqual(mock_post.call_args.args[1], profile.params(url='https://example.com'))
+
+
+if __name__ == '__main__':
+    unittest.main()
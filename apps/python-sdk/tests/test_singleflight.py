@@ -0,0 +1,94 @@
+import asyncio
+import concurrent.futures
+import unittest
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+
+from tests.test_pagination import FakeJobAPI
+
+
+class TestScrapeCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.api.scrape_delay = 0.2
+        self.app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, coalesce_scrapes=True)
+
+    def tearDown(self):
+        self.app.close()
+        self.api.stop()
+
+    def _scrape_concurrently(self, calls):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = [pool.submit(self.app.scrape_url, url, **options) for url, options in calls]
+            return [future.exception() or future.result() for future in futures]
+
+    def test_concurrent_identical_scrapes_share_one_request(self):
+        results = self._scrape_concurrently([('https://example.com', {'formats': ['markdown']})] * 5)
+
+        self.assertEqual(self.api.scraped, ['https://example.com'])
+        self.assertEqual({result.markdown for result in results}, {'# https://example.com'})
+        self.assertEqual(len({id(result) for result in results}), 5)
+
+    def test_different_options_are_not_coalesced(self):
+        self._scrape_concurrently([
+            ('https://example.com', {'formats': ['markdown']}),
+            ('https://example.com', {'formats': ['html']}),
+            ('https://example.org', {'formats': ['markdown']}),
+        ])
+
+        self.assertEqual(len(self.api.scraped), 3)
+
+    def test_errors_are_shared(self):
+        self.api.failing_urls.add('https://example.com')
+
+        results = self._scrape_concurrently([('https://example.com', {})] * 3)
+
+        self.assertEqual(len(self.api.scraped), 1)
+        self.assertTrue(all(isinstance(result, Exception) for result in results))
+
+    def test_sequential_scrapes_are_not_coalesced(self):
+        self.api.scrape_delay = 0
+        self.app.scrape_url('https://example.com')
+        self.app.scrape_url('https://example.com')
+
+        self.assertEqual(len(self.api.scraped), 2)
+
+    def test_disabled_by_default(self):
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(lambda _: app.scrape_url('https://example.com'), range(3)))
+        app.close()
+
+        self.assertEqual(len(self.api.scraped), 3)
+
+
+class TestAsyncScrapeCoalescing(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.api.scrape_delay = 0.1
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def test_concurrent_identical_scrapes_share_one_request(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, coalesce_scrapes=True) as app:
+            results = await asyncio.gather(*(app.scrape_url('https://example.com', formats=['markdown']) for _ in range(5)))
+
+        self.assertEqual(self.api.scraped, ['https://example.com'])
+        self.assertEqual({result.markdown for result in results}, {'# https://example.com'})
+
+    async def test_cancelling_one_caller_leaves_the_others(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url, coalesce_scrapes=True) as app:
+            first = asyncio.ensure_future(app.scrape_url('https://example.com'))
+            second = asyncio.ensure_future(app.scrape_url('https://example.com'))
+            await asyncio.sleep(0.02)
+            first.cancel()
+            result = await second
+
+        self.assertTrue(first.cancelled())
+        self.assertEqual(result.markdown, '# https://example.com')
+        self.assertEqual(len(self.api.scraped), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
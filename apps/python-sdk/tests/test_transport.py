@@ -0,0 +1,193 @@
+import asyncio
+import gc
+import gzip
+import json
+import threading
+import unittest
+import warnings
+from unittest.mock import patch, MagicMock
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+
+from tests.test_pagination import FakeJobAPI
+
+
+def _json_response(payload, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+class TestPooledSession(unittest.TestCase):
+    def test_session_is_reused_across_requests(self):
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing')
+        self.assertIs(app.session, app.session)
+
+    def test_pool_settings_are_applied_to_adapter(self):
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', pool_maxsize=32, pool_block=True)
+        adapter = app.session.get_adapter('https://api.firecrawl.dev')
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+
+    def test_keep_alive_disabled_sends_connection_close(self):
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', keep_alive=False)
+        self.assertEqual(app.session.headers['Connection'], 'close')
+
+    @patch('requests.Session.get')
+    def test_requests_go_through_session(self, mock_get):
+        mock_get.return_value = _json_response({'errors': [], 'robotsBlocked': []})
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing')
+        app.check_crawl_errors('job-id')
+        mock_get.assert_called_once()
+
+    def test_context_manager_closes_session(self):
+        with FirecrawlApp(api_key='dummy-api-key-for-testing') as app:
+            session = app.session
+            session.close = MagicMock()
+        session.close.assert_called_once()
+        self.assertIsNone(app._session)
+
+
+class _APIServerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = TestServer(self._make_web_app())
+        await self.server.start_server()
+        self.api_url = str(self.server.make_url('')).rstrip('/')
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    def _make_web_app(self):
+        async def crawl_errors(request):
+            return web.json_response({'errors': [], 'robotsBlocked': []})
+
+        web_app = web.Application()
+        web_app.router.add_get('/v1/crawl/{id}/errors', crawl_errors)
+        return web_app
+
+
+class TestAsyncSession(_APIServerTestCase):
+    async def test_session_is_shared_between_requests(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api_url) as app:
+            await app.check_crawl_errors('job-1')
+            session = app._async_session
+            await app.check_crawl_errors('job-2')
+            self.assertIs(app._async_session, session)
+        self.assertTrue(session.closed)
+        self.assertIsNone(app._async_session)
+
+    async def test_connector_settings_are_applied(self):
+        app = AsyncFirecrawlApp(
+            api_key='dummy-api-key-for-testing',
+            api_url=self.api_url,
+            connection_limit=7,
+            connection_limit_per_host=3
+        )
+        session = await app._get_async_session()
+        self.assertEqual(session.connector.limit, 7)
+        self.assertEqual(session.connector.limit_per_host, 3)
+        await app.aclose()
+
+
+class TestAsyncSessionAcrossLoops(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeJobAPI().start()
+        self.app = AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api.url)
+        self.sessions = []
+
+    def tearDown(self):
+        self.api.stop()
+
+    async def scrape(self):
+        await self.app.scrape_url('https://example.com')
+        self.sessions.append(self.app._async_session)
+
+    def test_session_of_a_finished_loop_is_closed(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            asyncio.run(self.scrape())
+            asyncio.run(self.scrape())
+            first, second = self.sessions
+
+            self.assertTrue(first.closed)
+            self.assertFalse(second.closed)
+            asyncio.run(self.app.aclose())
+            self.assertTrue(second.closed)
+            del first, second
+            self.sessions.clear()
+            gc.collect()
+
+        self.assertEqual([w for w in caught if 'Unclosed' in str(w.message)], [])
+
+    def test_session_of_a_loop_in_another_thread_is_closed_there(self):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self.scrape(), loop).result(10)
+            asyncio.run(self.scrape())
+
+            self.assertTrue(self.sessions[0].closed)
+            asyncio.run(self.app.aclose())
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestHTTP2Transport(_APIServerTestCase):
+    def test_sync_session_is_http2_client(self):
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', http2=True)
+        self.assertIsInstance(app.session, httpx.Client)
+        app.close()
+
+    async def test_async_requests_use_httpx(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api_url, http2=True) as app:
+            result = await app.check_crawl_errors('job-1')
+            self.assertEqual(result, {'errors': [], 'robotsBlocked': []})
+            session = app._async_session
+            self.assertIsInstance(session, httpx.AsyncClient)
+        self.assertTrue(session.is_closed)
+
+    async def test_session_is_shared_between_requests(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key-for-testing', api_url=self.api_url, http2=True) as app:
+            await app.check_crawl_errors('job-1')
+            session = app._async_session
+            await app.check_crawl_errors('job-2')
+            self.assertIs(app._async_session, session)
+
+
+class TestCompression(unittest.TestCase):
+    @patch('requests.Session.post')
+    def test_large_request_bodies_are_gzipped(self, mock_post):
+        mock_post.return_value = _json_response({'success': True, 'id': 'job-id'})
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', compress_requests=True, compression_threshold=1024)
+        paths = [f'/page/{i}' for i in range(1000)]
+        app.async_crawl_url('https://example.com', include_paths=paths)
+
+        kwargs = mock_post.call_args.kwargs
+        self.assertEqual(kwargs['headers']['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(kwargs['data']))['includePaths'], paths)
+        self.assertLess(app.transfer_stats.bytes_sent, app.transfer_stats.bytes_sent_decoded)
+
+    @patch('requests.Session.post')
+    def test_small_request_bodies_are_not_compressed(self, mock_post):
+        mock_post.return_value = _json_response({'success': True, 'id': 'job-id'})
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', compress_requests=True)
+        app.async_crawl_url('https://example.com')
+
+        kwargs = mock_post.call_args.kwargs
+        self.assertNotIn('Content-Encoding', kwargs['headers'])
+        self.assertEqual(json.loads(kwargs['data'])['url'], 'https://example.com')
+        self.assertEqual(app.transfer_stats.requests, 1)
+        self.assertEqual(app.transfer_stats.bytes_sent, app.transfer_stats.bytes_sent_decoded)
@@ -0,0 +1,78 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+import pydantic
+
+from firecrawl import FirecrawlApp, DocumentView
+from firecrawl.firecrawl import FirecrawlDocument, CrawlStatusResponse
+
+
+def _status_response(documents):
+    payload = {
+        'success': True,
+        'status': 'completed',
+        'completed': len(documents),
+        'total': len(documents),
+        'creditsUsed': len(documents),
+        'expiresAt': '2030-01-01T00:00:00Z',
+        'data': documents,
+    }
+    response = MagicMock()
+    response.status_code = 200
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+DOCUMENTS = [
+    {'markdown': '# One', 'links': ['https://example.com/a'], 'metadata': {'sourceURL': 'https://example.com/1'}},
+    {'markdown': '# Two', 'actions': {'screenshots': 'not-a-list', 'pdfs': []}},
+]
+
+
+class TestValidationModes(unittest.TestCase):
+    def test_invalid_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FirecrawlApp(api_key='dummy-api-key-for-testing', validate='sometimes')
+
+    @patch('requests.Session.get')
+    def test_full_validation_rejects_invalid_documents(self, mock_get):
+        mock_get.return_value = _status_response(DOCUMENTS)
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing')
+
+        with self.assertRaises(pydantic.ValidationError):
+            app.check_crawl_status('job-id')
+
+    @patch('requests.Session.get')
+    def test_lazy_validation_validates_fields_on_access(self, mock_get):
+        mock_get.return_value = _status_response(DOCUMENTS)
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', validate='lazy')
+
+        status = app.check_crawl_status('job-id')
+
+        self.assertIsInstance(status, CrawlStatusResponse)
+        self.assertEqual(status.completed, 2)
+        first, second = status.data
+        self.assertIsInstance(first, DocumentView)
+        self.assertEqual(first.markdown, '# One')
+        self.assertEqual(first.links, ['https://example.com/a'])
+        self.assertIsNone(first.html)
+        self.assertIsInstance(first.to_document(), FirecrawlDocument)
+        self.assertEqual(second.markdown, '# Two')
+        with self.assertRaises(pydantic.ValidationError):
+            second.actions
+        with self.assertRaises(AttributeError):
+            first.not_a_field
+
+    @patch('requests.Session.get')
+    def test_no_validation_returns_raw_documents(self, mock_get):
+        mock_get.return_value = _status_response(DOCUMENTS)
+        app = FirecrawlApp(api_key='dummy-api-key-for-testing', validate='none')
+
+        documents = list(app.iter_batch_scrape_documents('job-id'))
+
+        self.assertEqual(documents, DOCUMENTS)
+
+
+if __name__ == '__main__':
+    unittest.main()